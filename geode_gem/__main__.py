@@ -25,6 +25,7 @@ from shutil import rmtree
 from geode_gem.engine.api import GEM
 from geode_gem.engine.utils import copy, get_data
 from geode_gem.engine.lib.configuration import Configuration
+from geode_gem.engine.lib.database import Database
 
 from geode_gem.ui.data import Icons, Columns, Folders, Metadata
 from geode_gem.ui.utils import magic_from_file
@@ -227,6 +228,16 @@ def main():
         "--debug",
         action="store_true",
         help="launch gem with debug flag")
+    parser.add_argument(
+        "--profile-db",
+        action="store",
+        metavar="MS",
+        type=int,
+        nargs='?',
+        const=Database.slow_request_threshold,
+        default=None,
+        help="profile database requests and log the ones slower than MS "
+             f"milliseconds (default: {Database.slow_request_threshold})")
 
     parser_api = parser.add_argument_group("api arguments")
     parser_api.add_argument(
@@ -280,7 +291,10 @@ def main():
     process_status = False
 
     try:
-        gem = GEM(arguments.config, arguments.local, arguments.debug)
+        gem = GEM(arguments.config,
+                  arguments.local,
+                  arguments.debug,
+                  arguments.profile_db)
 
         # Set cache directory
         cache_path = Folders.Default.CACHE.joinpath(gem.Instance)
@@ -302,6 +316,9 @@ def main():
                 from geode_gem.ui.interface import MainWindow
                 MainWindow(gem, cache_path)
 
+                # Release database connections
+                gem.close()
+
                 # Remove lock
                 gem.free_lock()
 
@@ -20,6 +20,9 @@
 # Collections
 from collections import OrderedDict
 
+# Concurrent
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 # Filesystem
 from pathlib import Path
 from os.path import splitext
@@ -43,6 +46,10 @@ import logging
 
 from logging.config import fileConfig
 
+# Regex
+from re import escape as re_escape
+from re import findall as re_findall
+
 # System
 from fcntl import flock, LOCK_EX, LOCK_NB
 from os import getpid
@@ -66,7 +73,13 @@ class GEM(object):
     Databases = "databases.conf"
     Environment = "environment.conf"
 
-    def __init__(self, config, local, debug=False):
+    # Maximum number of consoles games directories scanned at the same time
+    scan_workers = 4
+
+    # Database metadata key set when the game_tags table was filled
+    tags_metadata = "game_tags"
+
+    def __init__(self, config, local, debug=False, profile=None):
         """ Constructor
 
         Parameters
@@ -77,6 +90,10 @@ class GEM(object):
             Default data folder
         debug : bool, optional
             Debug mode status (default: False)
+        profile : int, optional
+            Log database requests slower than this value in milliseconds and
+            write requests statistics when closing API, enabled by debug mode
+            with the default database threshold (default: None)
         """
 
         if isinstance(config, str):
@@ -88,6 +105,9 @@ class GEM(object):
         if type(debug) is not bool:
             debug = False
 
+        if profile is None and debug:
+            profile = Database.slow_request_threshold
+
         # ----------------------------------------
         #   Variables
         # ----------------------------------------
@@ -95,9 +115,15 @@ class GEM(object):
         # Debug mode
         self.debug = debug
 
+        # Database profiling threshold
+        self.profile = profile
+
         # Migration mode
         self.__need_migration = False
 
+        # Full-text search index status
+        self.__search_index = False
+
         # Data list
         self.__data = dict(
             consoles=dict(),
@@ -248,7 +274,8 @@ class GEM(object):
 
             # Check GEM database file
             self.database = Database(
-                self.__database_path, config, self.logger)
+                self.__database_path, config, self.logger,
+                profile=self.profile)
 
             # Check current GEM version
             version = self.database.select("gem", "version")
@@ -279,6 +306,9 @@ class GEM(object):
                 self.logger.info("Current database is up-to-date")
                 self.__need_migration = False
 
+                self.__init_game_tags(self.database)
+                self.__init_search_index(self.database)
+
         except OSError as error:
             self.logger.exception(f"Cannot access to database: {error}")
             sys_exit(error)
@@ -291,6 +321,112 @@ class GEM(object):
             self.logger.exception(f"An error occur: {error}")
             sys_exit(error)
 
+    def __init_game_tags(self, database):
+        """ Initialize game tags table
+
+        Generate the game_tags indexes and fill the table from the games tags
+        column once for a database (new table or migrated database). A
+        metadata entry store this status, so a database without any tag is
+        not read again on next startup
+
+        Parameters
+        ----------
+        database : gem.engine.lib.database.Database
+            Database instance
+        """
+
+        database.create_index("game_tags", ["filename", "tag"], unique=True)
+        database.create_index("game_tags", ["tag"])
+
+        status = database.select(
+            "metadata", "value", {"key": self.tags_metadata})
+
+        if status is None:
+            self.logger.debug("Generate game tags table")
+
+            with database.transaction():
+                rows = database.iter_select("games", ["filename", "tags"])
+
+                for filename, tags in rows:
+                    if not tags:
+                        continue
+
+                    for tag in set(tags.strip().split(';')):
+                        if tag:
+                            database.modify("game_tags",
+                                            {"filename": filename, "tag": tag},
+                                            {"filename": filename, "tag": tag})
+
+                database.modify("metadata",
+                                {"key": self.tags_metadata,
+                                 "value": GEM.Version},
+                                {"key": self.tags_metadata})
+
+    def __init_search_index(self, database):
+        """ Initialize games full-text search index
+
+        This index is stored as a FTS5 virtual table and updated every time a
+        console retrieve his games list. Each index row use the identifier of
+        a search_games row, which store the console and the game identifiers
+
+        Parameters
+        ----------
+        database : gem.engine.lib.database.Database
+            Database instance
+        """
+
+        self.__search_index = database.create_virtual_table(
+            "games_search", "fts5", [
+                "name",
+                "filename",
+                "tags",
+                "notes",
+                "tokenize='unicode61 remove_diacritics 2'"
+            ])
+
+        if not self.__search_index:
+            self.logger.warning(
+                "Full-text search is not available, use games list instead")
+            return
+
+        database.create_index("search_games", ["console", "game"], unique=True)
+
+        # Index rows without search_games entry cannot be retrieved anymore
+        if database.is_empty("search_games"):
+            database.execute("DELETE FROM games_search;", commit=True)
+
+    def __get_search_data(self, game, notes=None):
+        """ Generate the search index values for a specific game
+
+        Parameters
+        ----------
+        game : gem.engine.game.Game
+            Game object
+        notes : pathlib.Path, optional
+            Game notes file path (Default: None)
+
+        Returns
+        -------
+        dict
+            Index values
+        """
+
+        content = str()
+
+        if notes is not None and notes.exists():
+            try:
+                content = notes.read_text(errors="replace")
+
+            except OSError as error:
+                self.logger.error(f"Cannot read {notes}: {error}")
+
+        return {
+            "name": game.name,
+            "filename": game.path.name,
+            "tags": ' '.join(game.tags),
+            "notes": content
+        }
+
     def __init_configurations(self):
         """ Initalize configuration
 
@@ -387,6 +523,9 @@ class GEM(object):
         if self.__need_migration:
             self.logger.info("Backup database")
 
+            # Ensure the write-ahead log is merged before copying the file
+            self.database.close()
+
             # Database backup
             copy(self.__database_path, self.__backup_path)
 
@@ -397,15 +536,15 @@ class GEM(object):
             #   Initialize new database
             # ----------------------------------------
 
+            new_database = None
+
             try:
                 config = Configuration(
                     get_data("data", "config", GEM.Databases))
 
-                previous_database = Database(
-                    self.__backup_path, config, self.logger)
-
                 new_database = Database(
-                    self.__database_path, config, self.logger)
+                    self.__database_path, config, self.logger,
+                    profile=self.profile)
 
                 new_database.insert("gem", {"version": GEM.Version})
 
@@ -415,49 +554,15 @@ class GEM(object):
 
                 self.logger.info("Start database migration")
 
-                # ----------------------------------------
-                #   Migrate game by game
-                # ----------------------------------------
-
-                games = previous_database.select("games", ['*'])
-
-                if games is not None:
+                counter = new_database.migrate(
+                    self.__backup_path, "games", updater)
 
-                    # Get current table columns
-                    old_columns_name = previous_database.get_columns("games")
-
-                    # Get new table columns
-                    new_columns_name = new_database.get_columns("games")
-
-                    if updater is not None:
-                        updater.init(len(games))
-
-                    counter = int()
-                    for row in games:
-                        counter += 1
-
-                        row_data = dict()
-
-                        for element in row:
-                            column = old_columns_name[row.index(element)]
-
-                            # Avoid to retrieve columns which are no more used
-                            if column in new_columns_name:
-                                row_data[column] = element
-
-                        new_database.insert("games", row_data)
-
-                        if updater is not None:
-                            updater.update(counter)
-
-                # ----------------------------------------
-                #   Remove backup
-                # ----------------------------------------
-
-                self.logger.info("Migration complete")
+                self.logger.info(f"Migration complete with {counter} games")
                 self.__need_migration = False
 
-                del previous_database
+                self.__init_game_tags(new_database)
+                self.__init_search_index(new_database)
+
                 del self.database
 
                 setattr(self, "database", new_database)
@@ -468,10 +573,14 @@ class GEM(object):
 
                 self.logger.info("Restore database backup")
 
+                if new_database is not None:
+                    new_database.close()
+
                 copy(self.__backup_path, self.__database_path)
 
             # Remove backup
-            self.get_local("save.gem.db").unlink()
+            if self.__backup_path.exists():
+                self.__backup_path.unlink()
 
         if updater is not None:
             updater.close()
@@ -590,15 +699,17 @@ class GEM(object):
         # ----------------------------------------
 
         try:
-            for previous, emulator in self.__rename.items():
+            with self.database.transaction():
 
-                # Update games which use a renamed emulator
-                self.database.update("games",
-                                     {"emulator": emulator.id},
-                                     {"emulator": previous})
+                for previous, emulator in self.__rename.items():
 
-                self.logger.info(f"Update old {previous} references from "
-                                 f"database to {emulator.id}")
+                    # Update games which use a renamed emulator
+                    self.database.update("games",
+                                         {"emulator": emulator.id},
+                                         {"emulator": previous})
+
+                    self.logger.info(f"Update old {previous} references from "
+                                     f"database to {emulator.id}")
 
         except Exception as error:
             self.logger.exception(f"Cannot write database: {error}")
@@ -606,6 +717,19 @@ class GEM(object):
 
         return True
 
+    def close(self):
+        """ Close API resources which need to be released on exit
+        """
+
+        self.save_snapshots()
+
+        if hasattr(self, "database"):
+            self.database.log_profile()
+
+            self.logger.debug("Close database connections")
+
+            self.database.close()
+
     def get_config(self, *args):
         """ Retrieve configuration data
 
@@ -1006,26 +1130,350 @@ class GEM(object):
         # Check console games list
         return self.__data["consoles"][console].get_game(game)
 
-    def get_game_tags(self):
+    def get_game_tags(self, counts=False):
         """ Retrieve avaialable game tags from database
 
+        Parameters
+        ----------
+        counts : bool, optional
+            Retrieve the games number for each tag (Default: False)
+
         Returns
         -------
         list
-            Tags list
+            Tags list, or (tag, games number) tuples list when counts is True
         """
 
-        result = self.database.select("games", "tags")
+        request = self.database.execute(
+            "SELECT tag, COUNT(filename) FROM game_tags "
+            "GROUP BY tag ORDER BY tag;")
 
-        if result is not None:
-            tags = list()
+        if counts:
+            return list(request.fetchall())
 
-            for tag in result:
-                tags.extend(tag.split(';'))
+        return list(tag for tag, counter in request.fetchall())
 
-            return sorted(list(set(tags)))
+    def get_games_by_tag(self, tag):
+        """ Retrieve games which use a specific tag from database
 
-        return list()
+        Parameters
+        ----------
+        tag : str
+            Tag name
+
+        Returns
+        -------
+        list
+            Games filenames list
+        """
+
+        return list(filename for filename, in self.database.iter_select(
+            "game_tags", "filename", {"tag": tag}))
+
+    def load_snapshot(self, console):
+        """ Initialize the games of a specific console from its snapshot
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console object
+
+        Returns
+        -------
+        bool
+            return True if the snapshot was loaded, False otherwise
+        """
+
+        return console.load_snapshot(
+            self.get_local("snapshots", f"{console.id}.json"))
+
+    def save_snapshots(self):
+        """ Store the games of every scanned consoles into snapshots files
+        """
+
+        for console in self.__data["consoles"].values():
+
+            try:
+                if console.save_snapshot(
+                   self.get_local("snapshots", f"{console.id}.json")):
+                    self.logger.debug(f"Store {console.id} snapshot")
+
+            except OSError as error:
+                self.logger.warning(
+                    f"Cannot store {console.id} snapshot: {error}")
+
+    def scan_consoles(self, consoles=None, callback=None, workers=None):
+        """ Initialize the games list of several consoles concurrently
+
+        Each console games directory is scanned by a worker from a bounded
+        pool, this function returns when every scan is terminated
+
+        Parameters
+        ----------
+        consoles : list, optional
+            Consoles objects, every consoles are scanned if not specified
+            (Default: None)
+        callback : callable, optional
+            Function called with the console and the init_games result when a
+            scan is terminated, from the thread which call this function
+            (Default: None)
+        workers : int, optional
+            Maximum number of workers (Default: GEM.scan_workers)
+
+        Returns
+        -------
+        int
+            Number of modified consoles
+        """
+
+        if consoles is None:
+            consoles = self.get_consoles()
+
+        consoles = list(console for console in consoles
+                        if console.path is not None and console.path.exists())
+
+        if len(consoles) == 0:
+            return 0
+
+        if workers is None:
+            workers = self.scan_workers
+
+        counter = int()
+
+        with ThreadPoolExecutor(max_workers=workers,
+                                thread_name_prefix="scan") as executor:
+            futures = dict(
+                (executor.submit(console.init_games), console)
+                for console in consoles)
+
+            for future in as_completed(futures):
+                console = futures[future]
+
+                try:
+                    status = future.result()
+
+                except OSError as error:
+                    self.logger.warning(
+                        f"Cannot scan {console.id} games: {error}")
+                    status = False
+
+                # Other consoles results must be delivered in any case
+                except Exception as error:
+                    self.logger.exception(
+                        f"Cannot scan {console.id} games: {error}")
+                    status = False
+
+                if status:
+                    counter += 1
+
+                if callback is not None:
+                    callback(console, status)
+
+        return counter
+
+    def update_search_index(self, console):
+        """ Store the games of a specific console into the search index
+
+        Only the games which are not available anymore are removed from the
+        index, and only the new games are added to it
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console object
+
+        Returns
+        -------
+        bool
+            return True if the index is up-to-date, False otherwise
+        """
+
+        if not self.__search_index:
+            return False
+
+        games = dict((game.id, game) for game in console.get_games())
+
+        try:
+            with self.database.transaction():
+                rows = dict(self.database.execute(
+                    "SELECT game, id FROM search_games WHERE console = ?;",
+                    (console.id,)).fetchall())
+
+                removed = list(rows[key] for key in rows.keys() - games.keys())
+                added = list(game for key, game in games.items()
+                             if key not in rows)
+
+                for identifier in removed:
+                    self.database.execute(
+                        "DELETE FROM games_search WHERE rowid = ?;",
+                        (identifier,))
+                    self.database.execute(
+                        "DELETE FROM search_games WHERE id = ?;",
+                        (identifier,))
+
+                # Retrieve available notes with a single directory listing
+                notes = dict()
+
+                folder = self.get_local("notes")
+                if added and folder.exists():
+                    notes = dict(
+                        (path.stem, path) for path in folder.glob("*.txt"))
+
+                for game in added:
+                    identifier = self.database.execute(
+                        "INSERT INTO search_games (console, game) "
+                        "VALUES (?, ?);", (console.id, game.id)).lastrowid
+
+                    data = self.__get_search_data(game, notes.get(game.id))
+
+                    self.database.execute(
+                        "INSERT INTO games_search "
+                        "(rowid, name, filename, tags, notes) "
+                        "VALUES (?, ?, ?, ?, ?);",
+                        (identifier, data["name"], data["filename"],
+                         data["tags"], data["notes"]))
+
+        except Exception as error:
+            self.logger.exception(f"Cannot update search index: {error}")
+            return False
+
+        if removed or added:
+            self.logger.debug(
+                f"Update {console.id} search index: {len(added)} added, "
+                f"{len(removed)} removed")
+
+        return True
+
+    def __get_game_console(self, game):
+        """ Retrieve the console which contains a specific game
+
+        Parameters
+        ----------
+        game : gem.engine.game.Game
+            Game object
+
+        Returns
+        -------
+        gem.engine.console.Console or None
+            Console object
+        """
+
+        for console in self.__data["consoles"].values():
+            if console.get_game(game.id) is game:
+                return console
+
+        return None
+
+    def update_search_game(self, game):
+        """ Update a specific game from the search index
+
+        Parameters
+        ----------
+        game : gem.engine.game.Game
+            Game object
+        """
+
+        if not self.__search_index:
+            return
+
+        console = self.__get_game_console(game)
+        if console is None:
+            return
+
+        identifier = self.database.select(
+            "search_games", "id", {"console": console.id, "game": game.id})
+
+        # Game will be added by the next index update
+        if identifier is None:
+            return
+
+        self.database.update(
+            "games_search",
+            self.__get_search_data(
+                game, self.get_local("notes", f"{game.id}.txt")),
+            {"rowid": identifier})
+
+    def search(self, query, limit=50, console=None):
+        """ Search games from every consoles
+
+        Each word from query is used as a prefix, matching games are sorted by
+        relevance. Games which name contains the query words in the same order
+        are added after them
+
+        Parameters
+        ----------
+        query : str
+            Search query
+        limit : int, optional
+            Maximum number of results, without limit when None (Default: 50)
+        console : gem.engine.console.Console, optional
+            Only search games from this console (Default: None)
+
+        Returns
+        -------
+        list
+            Games list
+
+        Examples
+        --------
+        >>> g = GEM()
+        >>> g.init()
+        >>> g.search("mario kart")
+        [<gem.engine.api.Game object at 0x7f174a986f60>]
+        """
+
+        terms = re_findall(r"\w+", query)
+
+        if not terms:
+            return list()
+
+        games = list()
+
+        consoles = list(self.consoles.values())
+        if console is not None:
+            consoles = [console]
+
+        regex = '.*'.join(re_escape(term) for term in terms)
+
+        # Fallback to the consoles games lists
+        if not self.__search_index:
+            for element in consoles:
+                games.extend(element.search_game(regex))
+
+            return games[:limit]
+
+        request = "SELECT search_games.console, search_games.game " \
+            "FROM games_search " \
+            "JOIN search_games ON search_games.id = games_search.rowid " \
+            "WHERE games_search MATCH ?"
+        parameters = [' '.join(f'"{term}"*' for term in terms)]
+
+        if console is not None:
+            request += " AND search_games.console = ?"
+            parameters.append(console.id)
+
+        # A negative limit retrieve every matching rows
+        request += " ORDER BY rank LIMIT ?;"
+        parameters.append(limit if limit is not None else -1)
+
+        for identifier, key in self.database.execute(
+           request, parameters).fetchall():
+
+            if identifier not in self.consoles:
+                continue
+
+            game = self.consoles[identifier].get_game(key)
+            if game is not None:
+                games.append(game)
+
+        # The index only match words prefix, so names are checked too
+        found = set(games)
+
+        for element in consoles:
+            games.extend(game for game in element.search_game(regex)
+                         if game not in found)
+
+        return games[:limit]
 
     def update_game(self, game):
         """ Update a game in database
@@ -1071,7 +1519,19 @@ class GEM(object):
         # Update game in database
         self.logger.debug(f"Update {game.name} database entry")
 
-        self.database.modify("games", data, {"filename": game.path.name})
+        with self.database.transaction():
+            self.database.modify(
+                "games", data, {"filename": game.path.name})
+
+            # Update game tags index
+            self.database.remove("game_tags", {"filename": game.path.name})
+
+            for tag in set(game.tags):
+                if tag:
+                    self.database.insert(
+                        "game_tags", {"filename": game.path.name, "tag": tag})
+
+            self.update_search_game(game)
 
         # Update game environment variables
         self.logger.debug(f"Update {game.name} environment variables")
@@ -1109,7 +1569,24 @@ class GEM(object):
         if results is not None and len(results) > 0:
             self.logger.info(f"Remove {game.name} from database")
 
-            self.database.remove("games", {"filename": game.path.name})
+            with self.database.transaction():
+                self.database.remove("games", {"filename": game.path.name})
+                self.database.remove(
+                    "game_tags", {"filename": game.path.name})
+
+                console = self.__get_game_console(game)
+
+                if self.__search_index and console is not None:
+                    identifier = self.database.select(
+                        "search_games",
+                        "id",
+                        {"console": console.id, "game": game.id})
+
+                    if identifier is not None:
+                        self.database.remove(
+                            "games_search", {"rowid": identifier})
+                        self.database.remove(
+                            "search_games", {"id": identifier})
 
         # Update game environment variables
         self.logger.debug(f"Remove {game.name} environment variables")
@@ -18,11 +18,14 @@
 # ------------------------------------------------------------------------------
 
 # Filesystem
-from os import access, R_OK
+from os import access, stat_result, R_OK
 from pathlib import Path
 
 # GEM
-from geode_gem.engine.utils import generate_extension, generate_identifier
+from geode_gem.engine.utils import (DIRECTORY_RACY_DELAY,
+                                    generate_identifier,
+                                    get_stat,
+                                    scan_directory)
 from geode_gem.engine.game import Game
 from geode_gem.engine.emulator import Emulator
 
@@ -30,6 +33,16 @@ from geode_gem.engine.emulator import Emulator
 from re import IGNORECASE
 from re import compile as re_compile
 
+# Serialization
+from json import dumps as json_dumps
+from json import loads as json_loads
+
+# Thread
+from threading import RLock
+
+# Time
+from time import time_ns
+
 
 # ------------------------------------------------------------------------------
 #   Class
@@ -37,6 +50,12 @@ from re import compile as re_compile
 
 class Console(object):
 
+    # Directories modified less than this delay ago are scanned again
+    racy_delay = DIRECTORY_RACY_DELAY
+
+    # Snapshot file format version
+    snapshot_version = 1
+
     attributes = {
         "id": str,
         "name": str,
@@ -66,6 +85,29 @@ class Console(object):
 
         self.__games = list()
 
+        # Store games with identifier and file path as keys
+        self.__games_by_id = dict()
+        self.__games_by_path = dict()
+
+        # Store scanned files inode, size and creation time with file path as
+        # key
+        self.__files = dict()
+
+        # Store scanned directories modification time with path as key
+        self.__directories = dict()
+
+        # Store parameters used by the last scan
+        self.__scan_options = None
+
+        # Games list modification status since last snapshot
+        self.__snapshot_outdated = False
+
+        # Games list modification status since last search index update
+        self.__search_outdated = False
+
+        # Avoid to scan games directory from several threads at the same time
+        self.__lock = RLock()
+
         # ----------------------------------------
         #   Initialization
         # ----------------------------------------
@@ -151,9 +193,23 @@ class Console(object):
             "recursive": self.recursive
         }
 
-    def init_games(self):
+    def init_games(self, force=False):
         """ Initialize games list from path directory
 
+        Games list is updated incrementally: directories are only read again
+        when their modification time changed, and games are only generated
+        for new or replaced files. Others games instances are kept.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Read directories even if they were not modified (Default: False)
+
+        Returns
+        -------
+        bool
+            True if the games list was modified, False otherwise
+
         Raises
         ------
         FileNotFoundError
@@ -164,6 +220,23 @@ class Console(object):
             when path did not have read access
         """
 
+        with self.__lock:
+            return self.__init_games(force)
+
+    def __init_games(self, force=False):
+        """ Initialize games list from path directory
+
+        Parameters
+        ----------
+        force : bool, optional
+            Read directories even if they were not modified (Default: False)
+
+        Returns
+        -------
+        bool
+            True if the games list was modified, False otherwise
+        """
+
         if self.path is not None:
 
             if not self.path.exists():
@@ -178,29 +251,287 @@ class Console(object):
                 raise PermissionError(
                     f"Read permission not available for '{self.path}'")
 
-            # Rest games list
+            options = self.__get_scan_options()
+
+            if not force and options == self.__scan_options \
+               and not self.is_modified():
+                self.__update_search_index()
+                return False
+
+            # Reset games list when scan parameters have been modified
+            reset = not options == self.__scan_options
+            if reset:
+                self.__games.clear()
+                self.__games_by_id.clear()
+                self.__games_by_path.clear()
+                self.__files.clear()
+
+            # Retrieve files from games directory with a single walk
+            directories = dict()
+            entries = scan_directory(self.path,
+                                     self.extensions,
+                                     recursive=self.recursive,
+                                     directories=directories)
+
+            # Remove games which are not available anymore or replaced
+            paths = dict((Path(entry.path), entry) for entry in entries)
+
+            removed_games = list(
+                game for path, game in self.__games_by_path.items()
+                if path not in paths
+                or not self.__files.get(path) == self.__get_file_status(
+                    paths[path].stat()))
+
+            for game in removed_games:
+                self.delete_game(game)
+
+            entries = list(entry for path, entry in paths.items()
+                           if path not in self.__games_by_path)
+
+            # Retrieve every database entries with a single request
+            rows = dict()
+            if entries and hasattr(self.__parent, "database"):
+                rows = self.__parent.database.get_many(
+                    "games", "filename", [entry.name for entry in entries])
+
+            for entry in entries:
+                self.add_game(Path(entry.path),
+                              data=rows.get(entry.name, dict()),
+                              stat=entry.stat())
+
+            # Recently modified directories must be checked on next scan
+            limit = time_ns() - self.racy_delay
+            for directory, mtime in directories.items():
+                if mtime > limit:
+                    directories[directory] = None
+
+            self.__directories = directories
+            self.__scan_options = options
+
+            if not reset and not removed_games and not entries:
+                self.__update_search_index()
+                return False
+
+            self.__snapshot_outdated = True
+            self.__search_outdated = True
+
+            self.__update_search_index()
+
+            return True
+
+        return False
+
+    def __update_search_index(self):
+        """ Store games into the parent full-text search index
+
+        The index is only updated when the games list was modified since the
+        last update, or restored from a snapshot
+        """
+
+        if not self.__search_outdated:
+            return
+
+        if hasattr(self.__parent, "update_search_index"):
+            self.__search_outdated = \
+                not self.__parent.update_search_index(self)
+
+        else:
+            self.__search_outdated = False
+
+    @staticmethod
+    def __get_file_status(stat):
+        """ Retrieve the file status values which identify a game file
+
+        Parameters
+        ----------
+        stat : os.stat_result
+            File status
+
+        Returns
+        -------
+        tuple
+            File inode, size and creation time
+        """
+
+        return (stat.st_ino, stat.st_size, stat.st_ctime)
+
+    def __get_scan_options(self):
+        """ Retrieve the parameters which define the games list
+
+        Returns
+        -------
+        tuple
+            Games directory, extensions, recursive status and emulator
+        """
+
+        return (
+            self.path, tuple(self.extensions), self.recursive, self.emulator)
+
+    def load_snapshot(self, path):
+        """ Initialize games list from a snapshot file
+
+        The snapshot contains the files and directories status retrieved by the
+        last scan, which allow to generate games without accessing to the games
+        directory. The directories are checked by the next init_games call.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Snapshot file path
+
+        Returns
+        -------
+        bool
+            True if the snapshot was loaded, False otherwise
+        """
+
+        # Games list already retrieved from the games directory
+        if self.path is None or self.__scan_options is not None:
+            return False
+
+        if not path.exists():
+            return False
+
+        try:
+            snapshot = json_loads(path.read_text())
+
+            if not snapshot.get("version") == self.snapshot_version \
+               or not snapshot.get("path") == str(self.path) \
+               or not snapshot.get("extensions") == list(self.extensions) \
+               or not snapshot.get("recursive") == self.recursive:
+                return False
+
+            games = snapshot["games"]
+            directories = snapshot["directories"]
+
+        except (OSError, ValueError, KeyError, AttributeError):
+            return False
+
+        with self.__lock:
             self.__games.clear()
+            self.__games_by_id.clear()
+            self.__games_by_path.clear()
+            self.__files.clear()
+
+            # Retrieve every database entries with a single request
+            rows = dict()
+            if hasattr(self.__parent, "database"):
+                rows = self.__parent.database.get_many(
+                    "games",
+                    "filename",
+                    [Path(filename).name for filename, *data in games])
+
+            for filename, inode, size, ctime, identifier in games:
+                filename = self.path.joinpath(filename)
+
+                # Only inode, size and creation time are used by games
+                stat = stat_result(
+                    (0, inode, 0, 0, 0, 0, size, 0, 0, int(ctime),
+                     None, None, ctime))
+
+                self.add_game(filename,
+                              data=rows.get(filename.name, dict()),
+                              stat=stat,
+                              identifier=identifier)
+
+            self.__directories = dict(
+                (str(self.path.joinpath(directory)), mtime)
+                for directory, mtime in directories.items())
+
+            self.__scan_options = self.__get_scan_options()
+            self.__snapshot_outdated = False
+
+            # Games restored from a snapshot are checked by next scan, as the
+            # search index could be missing (migrated database for example)
+            self.__search_outdated = True
+
+        return True
+
+    def save_snapshot(self, path):
+        """ Store games list into a snapshot file
+
+        Only games from the games directory are stored, with their path
+        relative to this directory. Names and extensions are generated from
+        this path.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Snapshot file path
+
+        Returns
+        -------
+        bool
+            True if the snapshot was written, False otherwise
+        """
+
+        with self.__lock:
+            if self.__scan_options is None or not self.__snapshot_outdated:
+                return False
+
+            games = list()
+            for game in self.__games:
+                if game.path in self.__files \
+                   and self.path in game.path.parents:
+                    games.append(
+                        [str(game.path.relative_to(self.path)),
+                         *self.__files[game.path],
+                         game.id])
+
+            snapshot = {
+                "version": self.snapshot_version,
+                "path": str(self.path),
+                "extensions": list(self.extensions),
+                "recursive": self.recursive,
+                "directories": dict(
+                    (str(Path(directory).relative_to(self.path)), mtime)
+                    for directory, mtime in self.__directories.items()),
+                "games": games
+            }
+
+            self.__snapshot_outdated = False
+
+        if not path.parent.exists():
+            path.parent.mkdir(mode=0o755, parents=True)
 
-            for extension in self.extensions:
-                pattern = f"*.{generate_extension(extension)}"
+        path.write_text(json_dumps(snapshot, separators=(',', ':')))
 
-                if self.recursive:
-                    files = self.path.rglob(pattern)
+        return True
 
-                else:
-                    files = self.path.glob(pattern)
+    def is_modified(self):
+        """ Check if the games directories were modified since last scan
 
-                # Retrieve files from games directory
-                for filename in sorted(files):
-                    self.add_game(filename)
+        Returns
+        -------
+        bool
+            True if a directory was modified or never scanned, False
+            otherwise
+        """
+
+        if not self.__directories:
+            return True
 
-    def add_game(self, filename):
+        for directory, mtime in self.__directories.items():
+            stat = get_stat(directory)
+
+            if stat is None or mtime is None or not stat.st_mtime_ns == mtime:
+                return True
+
+        return False
+
+    def add_game(self, filename, data=None, stat=None, identifier=None):
         """ Add a new game
 
         Parameters
         ----------
         filename : str or pathlib.Path
             Game filepath
+        data : dict, optional
+            Database row already retrieved for this game (Default: None)
+        stat : os.stat_result, optional
+            File status already retrieved for this game (Default: None)
+        identifier : str, optional
+            Game identifier already generated for this file (Default: None)
 
         Returns
         -------
@@ -213,16 +544,30 @@ class Console(object):
             when the filename was already added to Console collection
         """
 
-        game = Game(self.__parent, filename)
+        # File status is stored to detect a replaced file on next scan
+        if stat is None:
+            stat = get_stat(Path(filename).expanduser())
+
+        game = Game(self.__parent,
+                    filename,
+                    data=data,
+                    stat=stat,
+                    emulator=self.emulator,
+                    identifier=identifier)
 
-        if self.get_game(game.id):
-            raise ValueError(f"The Game ID '{game.id}' already exists in "
-                             f"console '{self.name}'")
+        # Games list can be modified while a thread scan games directory
+        with self.__lock:
 
-        if game.emulator is None:
-            game.emulator = self.emulator
+            if game.id in self.__games_by_id:
+                raise ValueError(f"The Game ID '{game.id}' already exists in "
+                                 f"console '{self.name}'")
 
-        self.__games.append(game)
+            self.__games.append(game)
+
+            self.__games_by_id[game.id] = game
+            self.__games_by_path[game.path] = game
+
+            self.__files[game.path] = self.__get_file_status(stat)
 
         return game
 
@@ -239,11 +584,18 @@ class Console(object):
             raise TypeError(f"Cannot use specified game parameter, must be a "
                             f"{repr(Game)} object")
 
-        if game not in self.__games:
-            raise KeyError(
-                f"Cannot remove game '{game.name}' from '{self.id}' console")
+        # Games list can be modified while a thread scan games directory
+        with self.__lock:
+
+            if self.__games_by_id.get(game.id) is not game:
+                raise KeyError(f"Cannot remove game '{game.name}' from "
+                               f"'{self.id}' console")
+
+            self.__games.remove(game)
 
-        self.__games.remove(game)
+            del self.__games_by_id[game.id]
+            self.__games_by_path.pop(game.path, None)
+            self.__files.pop(game.path, None)
 
     def get_games(self):
         """ Retrieve games list
@@ -251,10 +603,11 @@ class Console(object):
         Returns
         -------
         list
-            Games list
+            Copy of the games list, which can be used while the games
+            directory is scanned by another thread
         """
 
-        return self.__games
+        return list(self.__games)
 
     def get_game(self, key):
         """ Return specific game from current console
@@ -270,7 +623,26 @@ class Console(object):
             Game instance if found, None otherwise
         """
 
-        return next((game for game in self.__games if game.id == key), None)
+        return self.__games_by_id.get(key)
+
+    def get_game_from_path(self, path):
+        """ Return specific game from current console with his file path
+
+        Parameters
+        ----------
+        path : pathlib.Path or str
+            Game file path
+
+        Returns
+        -------
+        gem.engine.game.Game or None
+            Game instance if found, None otherwise
+        """
+
+        if isinstance(path, str):
+            path = Path(path).expanduser()
+
+        return self.__games_by_path.get(path)
 
     def search_game(self, key):
         """ Search games from a specific key
@@ -18,15 +18,27 @@
 # ------------------------------------------------------------------------------
 
 # Filesystem
+from fnmatch import fnmatchcase
+from os import scandir
 from pathlib import Path
+from stat import S_ISDIR
 
 # GEM
-from geode_gem.engine.utils import get_binary_path
+from geode_gem.engine.utils import DIRECTORY_RACY_DELAY
 from geode_gem.engine.utils import generate_identifier
+from geode_gem.engine.utils import get_stat
+from geode_gem.engine.utils import resolve_binary_path
+
+# Search
+from bisect import bisect_left
 
 # System
+from shlex import quote as shlex_quote
 from shlex import split as shlex_split
 
+# Time
+from time import time_ns
+
 
 # ------------------------------------------------------------------------------
 #   Class
@@ -47,10 +59,21 @@ class Emulator(object):
         "screenshots": Path
     }
 
+    # Directories modified less than this delay ago are not stored in index
+    racy_delay = DIRECTORY_RACY_DELAY
+
     def __init__(self, **kwargs):
         """ Constructor
         """
 
+        # ----------------------------------------
+        #   Variables
+        # ----------------------------------------
+
+        # Store directories modification time, resolved path and sorted files
+        # names with directory path as key
+        self.__directories = dict()
+
         # ----------------------------------------
         #   Initialization
         # ----------------------------------------
@@ -117,19 +140,76 @@ class Emulator(object):
 
         files = list()
 
-        path = Path(pattern).expanduser().resolve()
+        path = Path(pattern).expanduser()
+
+        content = self.__get_directory_content(path.parent)
 
         # Check if parent path exists and is a directory
-        if path.parent.exists() and path.parent.is_dir():
+        if content is not None:
+            directory, names = content
 
-            for filename in path.parent.glob(path.name):
+            # Only the files which start with the pattern part before the first
+            # wildcard can match, they are contiguous in the sorted names
+            prefix = path.name
+            for character in ('*', '?', '['):
+                prefix = prefix.split(character, 1)[0]
 
-                # Only retrieve files which exists and are not directories
-                if filename.exists() and filename.is_file():
-                    files.append(filename)
+            for index in range(bisect_left(names, prefix), len(names)):
+                if not names[index].startswith(prefix):
+                    break
+
+                if fnmatchcase(names[index], path.name):
+                    files.append(directory.joinpath(names[index]))
 
         return files
 
+    def __get_directory_content(self, path):
+        """ Retrieve the files of a directory from the directories index
+
+        The directory is only listed again when its modification time changed
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Directory path
+
+        Returns
+        -------
+        tuple or None
+            Resolved directory path and sorted files names, None if the path
+            is not an available directory
+        """
+
+        stat = get_stat(path)
+
+        if stat is None or not S_ISDIR(stat.st_mode):
+            self.__directories.pop(str(path), None)
+            return None
+
+        data = self.__directories.get(str(path))
+
+        if data is not None and data[0] == stat.st_mtime_ns:
+            return data[1:]
+
+        directory = path.resolve()
+
+        try:
+            # Only retrieve files which exists and are not directories
+            with scandir(directory) as entries:
+                names = sorted(entry.name for entry in entries
+                               if entry.is_file())
+
+        except OSError:
+            return None
+
+        # A recently modified directory can be modified again without changing
+        # its modification time, so it will be listed again next time
+        if time_ns() - stat.st_mtime_ns > self.racy_delay:
+            self.__directories[str(path)] = (
+                stat.st_mtime_ns, directory, names)
+
+        return directory, names
+
     def as_dict(self):
         """ Return object as dictionary structure
 
@@ -150,6 +230,22 @@ class Emulator(object):
             "fullscreen": self.fullscreen
         }
 
+    @property
+    def binary_path(self):
+        """ Retrieve the absolute path of the emulator binary
+
+        Returns
+        -------
+        str or None
+            Binary absolute path, None if binary not exists
+
+        See Also
+        --------
+        gem.engine.utils.resolve_binary_path()
+        """
+
+        return resolve_binary_path(self.binary)
+
     @property
     def exists(self):
         """ Check if emulator binary exists in user system
@@ -160,10 +256,7 @@ class Emulator(object):
             return True if binary exist, False otherwise
         """
 
-        if len(get_binary_path(self.binary)) > 0:
-            return True
-
-        return False
+        return self.binary_path is not None
 
     def get_screenshots(self, game):
         """ Get screenshots list
@@ -219,8 +312,10 @@ class Emulator(object):
             Command launcher parameters list, None otherwise
         """
 
+        binary = self.binary_path
+
         # Check emulator binary
-        if not self.exists:
+        if binary is None:
             raise FileNotFoundError(
                 f"Cannot found emulator binary '{self.binary}'")
 
@@ -228,7 +323,8 @@ class Emulator(object):
         #   Retrieve default parameters
         # ----------------------------------------
 
-        arguments = shlex_split(str(self.binary))
+        # Resolved path is used to avoid another lookup when launching
+        arguments = [shlex_quote(binary)]
 
         # Retrieve fullscreen mode
         if fullscreen and self.fullscreen is not None:
@@ -26,6 +26,7 @@ from pathlib import Path
 # GEM
 from geode_gem.engine.utils import (get_creation_datetime,
                                     generate_identifier,
+                                    get_stat,
                                     parse_timedelta)
 from geode_gem.engine.emulator import Emulator
 
@@ -59,15 +60,45 @@ class Game(object):
         "finish": bool
     }
 
-    def __init__(self, parent, filename):
+    __slots__ = tuple(attributes.keys()) + (
+        "__parent", "__path", "__stat", "__data", "__emulator", "__loaded")
+
+    # Default values of attributes stored in database
+    __defaults = dict()
+
+    # Retrieve time from a string (HH:MM:SS.MS)
+    __time_regex = re_compile(r"(\d+):(\d+):(\d+)[\.\d*]?")
+
+    # Convert old column name from database to the new object scheme
+    __convert_keys = dict(
+        play="played",
+        arguments="default",
+        last_play="last_launch_date",
+        last_play_time="last_launch_time")
+
+    def __init__(self, parent, filename, data=None, stat=None, emulator=None,
+                 identifier=None):
         """ Constructor
 
+        Only the identifier is generated here, the other attributes are
+        initialized together when one of them is accessed for the first time
+
         Parameters
         ----------
         parent : gem.engine.api.GEM
             API instance
         filename : pathlib.Path
             Game file path
+        data : dict, optional
+            Database row already retrieved for this game, an empty dict means
+            the game has no entry in database (Default: None)
+        stat : os.stat_result, optional
+            File status already retrieved when scanning the games directory
+            (Default: None)
+        emulator : gem.engine.emulator.Emulator, optional
+            Emulator used when the game did not define one (Default: None)
+        identifier : str, optional
+            Identifier already generated for this file (Default: None)
 
         Raises
         ------
@@ -83,147 +114,281 @@ class Game(object):
         if isinstance(filename, str):
             filename = Path(filename).expanduser()
 
-        if not filename.exists():
+        # Retrieve file status once for identifier and installation date
+        if stat is None:
+            stat = get_stat(filename)
+
+        if stat is None:
             raise FileNotFoundError(f"Cannot found '{filename}' in filesytem")
 
         # ----------------------------------------
         #   Variables
         # ----------------------------------------
 
+        # Database attributes initialization status
+        self.__loaded = False
+
         self.__parent = parent
 
         self.__path = filename
 
+        self.__stat = stat
+
+        # Database row, parsed when a database attribute is accessed
+        self.__data = data
+        if self.__parent is None:
+            self.__data = dict()
+
+        self.__emulator = emulator
+
         # ----------------------------------------
         #   Initialization
         # ----------------------------------------
 
-        # Initialize attributes
+        if identifier is None:
+            identifier = generate_identifier(self.__path, self.__stat)
+
+        setattr(self, "id", identifier)
+
+    def __getattr__(self, key):
+        """ Initialize an attribute when accessed for the first time
+
+        This method is only called when an attribute has no value yet, every
+        attributes are initialized at once to avoid to call this method again
+
+        Parameters
+        ----------
+        key : str
+            Attribute name
+
+        Returns
+        -------
+        object
+            Attribute value
+
+        Raises
+        ------
+        AttributeError
+            When the attribute is not a game attribute
+        """
+
+        if key not in self.attributes or self.__loaded:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{key}'")
+
         self.__init_attributes()
 
-        # Initialize variables
-        if self.__parent is not None:
-            self.__init_from_database()
+        return object.__getattribute__(self, key)
+
+    def __setattr__(self, key, value):
+        """ Set an attribute value
+
+        Attributes are initialized before modifying one of them, to avoid to
+        overwrite the new value when another one is accessed
+
+        Parameters
+        ----------
+        key : str
+            Attribute name
+        value : object
+            Attribute value
+        """
+
+        if key in self.attributes and not key == "id" and not self.__loaded:
+            self.__init_attributes()
+
+        object.__setattr__(self, key, value)
 
     def __init_attributes(self):
         """ Initialize object attributes
+
+        Database results, installation date and environment variables are
+        retrieved in a single pass and written directly into the slots
         """
 
-        for key, key_type in self.attributes.items():
+        data = self.__data
+
+        # Retrieve data from database
+        if data is None:
+            data = self.__parent.database.get(
+                "games", {"filename": self.__path.name})
+
+        values = self.__get_default_values()
+        if data:
+            values.update(self.__parse_data(data))
 
-            if key_type is Emulator or key_type is Path:
-                setattr(self, key, None)
+        if values["emulator"] is None:
+            values["emulator"] = self.__emulator
 
-            elif key_type is date and key == "installed":
-                setattr(self, key, None)
+        values["installed"] = self.__get_installation_date()
+        values["environment"] = self.__get_environment()
 
-            elif key_type is date:
-                setattr(self, key, date(1, 1, 1))
+        for key, value in values.items():
+            object.__setattr__(self, key, value)
 
-            elif key_type is bool:
-                setattr(self, key, False)
+        # Database row and file status are only used for the first
+        # initialization
+        self.__data = dict()
+        self.__stat = None
 
-            else:
-                setattr(self, key, key_type())
+        self.__loaded = True
 
-        setattr(self, "id", generate_identifier(self.__path))
+    def __get_installation_date(self):
+        """ Retrieve the installation date from game file status
 
-        setattr(self, "name", self.__path.stem)
+        Returns
+        -------
+        datetime.date
+            File creation date, the default date value when the file is not
+            available anymore
+        """
 
-        setattr(self, "installed", get_creation_datetime(self.__path).date())
+        creation = get_creation_datetime(self.__path, self.__stat)
+
+        if creation is None:
+            return date(1, 1, 1)
+
+        return creation.date()
+
+    def __get_environment(self):
+        """ Retrieve environment variables from API configuration
+
+        Returns
+        -------
+        dict
+            Environment variables with variables names as keys
+        """
+
+        environment = dict()
 
-        self.environment.clear()
         if self.__parent is not None:
-            environment = self.__parent.environment
+            configuration = self.__parent.environment
 
-            if self.id in environment.keys():
-                for option in environment.options(self.id):
-                    self.environment[option.upper()] = environment.get(
+            if self.id in configuration.keys():
+                for option in configuration.options(self.id):
+                    environment[option.upper()] = configuration.get(
                         self.id, option, fallback=str())
 
-    def __init_from_database(self):
-        """ Initialize object with database results
+        return environment
+
+    def __get_default_values(self):
+        """ Generate default values for attributes stored in database
+
+        Returns
+        -------
+        dict
+            Default values with attributes names as keys
         """
 
-        # Retrieve data from database
-        data = self.__parent.database.get(
-            "games", {"filename": self.__path.name})
+        # Immutable default values are only generated once
+        if not Game.__defaults:
+
+            for key, key_type in self.attributes.items():
 
-        if data is not None:
+                if key in ("id", "installed", "environment"):
+                    continue
 
-            # Retrieve time from a string (HH:MM:SS.MS)
-            regex = re_compile(r"(\d+):(\d+):(\d+)[\.\d*]?")
+                elif key_type is Emulator or key_type is Path:
+                    Game.__defaults[key] = None
 
-            # Convert old column name from database to the new object scheme
-            convert_keys = dict(
-                play="played",
-                arguments="default",
-                last_play="last_launch_date",
-                last_play_time="last_launch_time")
+                elif key_type is date:
+                    Game.__defaults[key] = date(1, 1, 1)
 
-            for key, value in data.items():
+                elif key_type is bool:
+                    Game.__defaults[key] = False
 
-                if key in convert_keys.keys():
-                    key = convert_keys[key]
+                elif key_type is not list:
+                    Game.__defaults[key] = key_type()
 
-                if key in self.attributes.keys():
-                    key_type = self.attributes[key]
+        values = Game.__defaults.copy()
 
-                    if key_type is Path and type(value) is str:
+        # Lists cannot be shared between games
+        for key, key_type in self.attributes.items():
+            if key_type is list:
+                values[key] = list()
+
+        values["name"] = self.__path.stem
+
+        return values
 
+    def __parse_data(self, data):
+        """ Convert database results to attributes values
+
+        Parameters
+        ----------
+        data : dict
+            Database row
+
+        Returns
+        -------
+        dict
+            Converted values with attributes names as keys
+        """
+
+        values = dict()
+
+        for key, value in data.items():
+            key = self.__convert_keys.get(key, key)
+
+            key_type = self.attributes.get(key)
+
+            if key_type is not None:
+
+                if key_type is Path and type(value) is str:
+
+                    path = None
+                    if len(value) > 0:
                         path = Path(value).expanduser().resolve()
-                        if len(value) == 0:
-                            path = None
 
-                        setattr(self, key, path)
+                    values[key] = path
+
+                elif key_type is Emulator and type(value) is str:
+                    values[key] = self.__parent.get_emulator(value)
 
-                    elif key_type is Emulator and type(value) is str:
-                        setattr(self, key, self.__parent.get_emulator(value))
+                elif key_type is int:
+                    values[key] = int(value)
 
-                    elif key_type is int:
-                        setattr(self, key, int(value))
+                elif key_type is bool:
+                    values[key] = bool(value)
 
-                    elif key_type is bool:
-                        setattr(self, key, bool(value))
+                elif key_type is list and type(value) is str:
 
-                    elif key_type is list and type(value) is str:
+                    if len(value) > 0:
+                        value = list(set(value.strip().split(';')))
+                        value.sort()
 
-                        if len(value) > 0:
-                            value = list(set(value.strip().split(';')))
-                            value.sort()
+                        values[key] = value
 
-                            setattr(self, key, value)
+                elif key_type is dict:
+                    pass
 
-                    elif key_type is dict:
-                        pass
+                elif key_type is date:
+                    day, month, year = 1, 1, 1
 
-                    elif key_type is date:
-                        day, month, year = 1, 1, 1
+                    # Old GEM format
+                    if len(value) > 10:
+                        day, month, year = value.split()[0].split('-')
 
-                        # Old GEM format
-                        if len(value) > 10:
-                            day, month, year = value.split()[0].split('-')
+                    # ISO 8601 format
+                    elif len(value) > 0:
+                        year, month, day = value.split('-')
 
-                        # ISO 8601 format
-                        elif len(value) > 0:
-                            year, month, day = value.split('-')
+                    values[key] = date(int(year), int(month), int(day))
 
-                        setattr(self, key,
-                                date(int(year), int(month), int(day)))
+                elif key_type is timedelta:
+                    result = self.__time_regex.match(value)
 
-                    elif key_type is timedelta:
-                        result = regex.match(value)
+                    if result is not None:
+                        hours, minutes, seconds = result.groups()
 
-                        if result is not None:
-                            hours, minutes, seconds = result.groups()
+                        values[key] = timedelta(hours=int(hours),
+                                                minutes=int(minutes),
+                                                seconds=int(seconds))
 
-                            setattr(self, key, timedelta(
-                                    hours=int(hours),
-                                    minutes=int(minutes),
-                                    seconds=int(seconds)))
+                elif key_type is str and len(value) > 0:
+                    values[key] = value
 
-                    elif key_type is str and len(value) > 0:
-                        setattr(self, key, value)
+        return values
 
     def __str__(self):
         """ Return a formatted string when using print function
@@ -272,7 +437,8 @@ class Game(object):
             Game object
         """
 
-        game = Game(self.__parent, filename)
+        # Every attributes are copied, avoid to retrieve database values
+        game = Game(self.__parent, filename, data=dict())
 
         for key in self.attributes.keys():
             setattr(game, key, getattr(self, key, None))
@@ -284,9 +450,23 @@ class Game(object):
 
     def reset(self):
         """ Reset game attributes
+
+        Database values are not retrieved again, the attributes use their
+        default values when accessed
         """
 
-        self.__init_attributes()
+        self.__data = dict()
+        self.__emulator = None
+
+        for key in self.attributes.keys():
+            if not key == "id":
+                try:
+                    delattr(self, key)
+
+                except AttributeError:
+                    pass
+
+        self.__loaded = False
 
     @property
     def path(self):
@@ -356,4 +536,8 @@ class Game(object):
         """ Reload installation date from game file
         """
 
-        setattr(self, "installed", get_creation_datetime(self.__path).date())
+        self.__stat = None
+
+        # Installation date is retrieved with the other attributes otherwise
+        if self.__loaded:
+            setattr(self, "installed", self.__get_installation_date())
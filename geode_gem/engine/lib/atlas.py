@@ -0,0 +1,377 @@
+# ------------------------------------------------------------------------------
+#  Copyleft 2015-2020  PacMiam
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+# ------------------------------------------------------------------------------
+
+# Filesystem
+from os import replace
+from pathlib import Path
+
+# GEM
+from geode_gem.engine.utils import get_signature
+
+# Memory
+from mmap import mmap, ACCESS_READ
+
+# Serialization
+from json import dumps as json_dumps
+from json import loads as json_loads
+from struct import Struct, error as StructError
+
+# Thread
+from threading import RLock
+
+
+# ------------------------------------------------------------------------------
+#   Class
+# ------------------------------------------------------------------------------
+
+class Atlas(object):
+
+    # File signature
+    magic = b"GEMATLAS"
+
+    # File format version
+    version = 1
+
+    # Signature, version and index length
+    header = Struct("<8sII")
+
+    def __init__(self, path, logger):
+        """ Constructor
+
+        An atlas file stores the raw pixels of several thumbnails with the
+        same size. The file starts with a header, followed by a JSON index
+        and the tiles data
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Atlas file path
+        logger : logging.Logger
+            Output logger
+
+        Raises
+        ------
+        TypeError
+            If path instance is not pathlib.Path
+        """
+
+        if not isinstance(path, Path):
+            raise TypeError("Expected %s type for path, get %s" % (
+                Path, type(path)))
+
+        # ----------------------------------------
+        #   Variables
+        # ----------------------------------------
+
+        self.path = path
+        self.logger = logger
+
+        # Store tiles offset, length, width, height, rowstride, alpha channel
+        # status and source signature with identifier as key
+        self.__index = dict()
+
+        # Store tiles which are not written yet with identifier as key
+        self.__tiles = dict()
+
+        # Memory mapped atlas file
+        self.__file = None
+        self.__data = None
+
+        # Tiles data offset in atlas file
+        self.__offset = int()
+
+        # Atlas modification status since last save
+        self.__modified = False
+
+        # Atlas is read from covers decoding threads
+        self.__lock = RLock()
+
+        # Atlas file is only read when needed
+        self.__loaded = False
+
+    def __len__(self):
+        """ Retrieve the number of tiles stored in the atlas
+
+        Returns
+        -------
+        int
+            Tiles number
+        """
+
+        with self.__lock:
+            self.__load()
+
+            return len(self.__index)
+
+    def __contains__(self, identifier):
+        """ Check if a tile is stored in the atlas
+
+        Parameters
+        ----------
+        identifier : str
+            Tile identifier
+
+        Returns
+        -------
+        bool
+            True if the tile exists, False otherwise
+        """
+
+        with self.__lock:
+            self.__load()
+
+            return identifier in self.__index
+
+    def __load(self):
+        """ Map the atlas file in memory and read its index
+        """
+
+        if self.__loaded:
+            return
+
+        self.__loaded = True
+
+        if not self.path.exists():
+            return
+
+        try:
+            self.__file = self.path.open("rb")
+            self.__data = mmap(self.__file.fileno(), 0, access=ACCESS_READ)
+
+            magic, version, length = self.header.unpack_from(self.__data)
+
+            if not magic == self.magic or not version == self.version:
+                raise ValueError("Unknown atlas format")
+
+            self.__offset = self.header.size + length
+
+            self.__index = json_loads(
+                self.__data[self.header.size:self.__offset].decode("utf-8"))
+
+            if not isinstance(self.__index, dict):
+                raise ValueError("Wrong index type")
+
+        except (OSError, ValueError, StructError) as error:
+            self.logger.warning(f"Cannot read {self.path} atlas: {error}")
+
+            self.__index = dict()
+            self.__unmap()
+
+            # Broken file will be replaced on next save
+            self.__modified = True
+
+    def __unmap(self):
+        """ Release the memory mapped atlas file
+        """
+
+        if self.__data is not None:
+            self.__data.close()
+
+        if self.__file is not None:
+            self.__file.close()
+
+        self.__data = None
+        self.__file = None
+
+    def get(self, identifier, source):
+        """ Retrieve the tile pixels which is up-to-date with its source
+
+        Parameters
+        ----------
+        identifier : str
+            Tile identifier
+        source : pathlib.Path or str
+            Source file path
+
+        Returns
+        -------
+        tuple or None
+            Pixels bytes, width, height, rowstride and alpha channel status,
+            None if the tile need to be generated
+        """
+
+        with self.__lock:
+            self.__load()
+
+            entry = self.__index.get(identifier)
+            if entry is None:
+                return None
+
+            if not entry[6:] == get_signature(source):
+                del self.__index[identifier]
+                self.__tiles.pop(identifier, None)
+
+                self.__modified = True
+                return None
+
+            offset, length, *properties = entry[:6]
+
+            if identifier in self.__tiles:
+                return (self.__tiles[identifier], *properties)
+
+            start = self.__offset + offset
+
+            data = self.__data[start:start + length]
+
+            # Truncated atlas file
+            if not len(data) == length:
+                return None
+
+            return (data, *properties)
+
+    def set(self, identifier, source, data, width, height, rowstride, alpha):
+        """ Store tile pixels into the atlas
+
+        The tile is written in the atlas file on next save
+
+        Parameters
+        ----------
+        identifier : str
+            Tile identifier
+        source : pathlib.Path or str
+            Source file path
+        data : bytes
+            Tile pixels
+        width : int
+            Tile width in pixels
+        height : int
+            Tile height in pixels
+        rowstride : int
+            Distance in bytes between rows
+        alpha : bool
+            Pixels have an alpha channel
+        """
+
+        with self.__lock:
+            self.__load()
+
+            self.__tiles[identifier] = bytes(data)
+            self.__index[identifier] = [
+                None, len(data), width, height, rowstride, alpha,
+                *get_signature(source)]
+
+            self.__modified = True
+
+    def collect(self, identifiers):
+        """ Remove tiles which belong to unknown identifiers
+
+        Parameters
+        ----------
+        identifiers : list or set
+            Available identifiers
+
+        Returns
+        -------
+        int
+            Number of removed tiles
+        """
+
+        identifiers = set(identifiers)
+
+        with self.__lock:
+            self.__load()
+
+            removed = set(self.__index.keys()) - identifiers
+
+            for identifier in removed:
+                del self.__index[identifier]
+                self.__tiles.pop(identifier, None)
+
+            if len(removed) > 0:
+                self.__modified = True
+
+        return len(removed)
+
+    def save(self):
+        """ Write the atlas file
+
+        Tiles are written in a temporary file which replaces the atlas file
+        when finished, so the mapped file is never modified
+
+        Returns
+        -------
+        bool
+            True if the atlas was written, False otherwise
+        """
+
+        with self.__lock:
+            if not self.__modified:
+                return False
+
+            index, chunks, offset = dict(), list(), int()
+
+            for identifier, entry in self.__index.items():
+
+                if identifier in self.__tiles:
+                    data = self.__tiles[identifier]
+
+                else:
+                    start = self.__offset + entry[0]
+                    data = self.__data[start:start + entry[1]]
+
+                index[identifier] = [offset, *entry[1:]]
+
+                chunks.append(data)
+                offset += len(data)
+
+            content = json_dumps(index, separators=(',', ':')).encode("utf-8")
+
+            path = self.path.with_name(f".{self.path.name}.tmp")
+
+            try:
+                if not self.path.parent.exists():
+                    self.path.parent.mkdir(mode=0o755, parents=True)
+
+                with path.open("wb") as pipe:
+                    pipe.write(self.header.pack(
+                        self.magic, self.version, len(content)))
+                    pipe.write(content)
+
+                    for data in chunks:
+                        pipe.write(data)
+
+                replace(str(path), str(self.path))
+
+            except OSError as error:
+                self.logger.warning(f"Cannot write {self.path} atlas: {error}")
+                return False
+
+            # Map the new atlas file on next access
+            self.__unmap()
+
+            self.__index = dict()
+            self.__tiles.clear()
+
+            self.__loaded = False
+            self.__modified = False
+
+        return True
+
+    def close(self):
+        """ Release the atlas file without saving pending tiles
+        """
+
+        with self.__lock:
+            self.__unmap()
+
+            self.__index = dict()
+            self.__tiles.clear()
+
+            self.__loaded = False
+            self.__modified = False
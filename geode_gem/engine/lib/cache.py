@@ -0,0 +1,648 @@
+# ------------------------------------------------------------------------------
+#  Copyleft 2015-2020  PacMiam
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+# ------------------------------------------------------------------------------
+
+# Collections
+from collections import OrderedDict
+
+# Filesystem
+from pathlib import Path
+
+# GEM
+from geode_gem.engine.utils import get_signature, get_stat
+
+# Serialization
+from json import dumps as json_dumps
+from json import loads as json_loads
+
+# Thread
+from threading import RLock
+
+
+# ------------------------------------------------------------------------------
+#   Class
+# ------------------------------------------------------------------------------
+
+class Cache(object):
+
+    # Manifest filename stored in the cache directory
+    manifest = "manifest.json"
+
+    # Manifest file format version
+    version = 1
+
+    def __init__(self, path, logger, budget=None):
+        """ Constructor
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Cache directory path
+        logger : logging.Logger
+            Output logger
+        budget : int, optional
+            Maximum cache size in bytes, the least recently used files are
+            removed when this size is exceeded (Default: None)
+
+        Raises
+        ------
+        TypeError
+            If path instance is not pathlib.Path
+        """
+
+        if not isinstance(path, Path):
+            raise TypeError("Expected %s type for path, get %s" % (
+                Path, type(path)))
+
+        # ----------------------------------------
+        #   Variables
+        # ----------------------------------------
+
+        self.path = path
+        self.logger = logger
+
+        self.budget = budget
+
+        # Store cache files source path, modification time, size and cache
+        # file size with the relative cache file path as key. The least
+        # recently used files are stored first
+        self.__entries = OrderedDict()
+
+        # Cache files total size
+        self.__size = int()
+
+        # Manifest modification status since last save
+        self.__modified = False
+
+        # Cache can be accessed from several threads
+        self.__lock = RLock()
+
+        # ----------------------------------------
+        #   Initialization
+        # ----------------------------------------
+
+        self.load()
+
+    def __len__(self):
+        """ Retrieve the number of cache files stored in the manifest
+
+        Returns
+        -------
+        int
+            Cache files number
+        """
+
+        return len(self.__entries)
+
+    @property
+    def size(self):
+        """ Retrieve cache files total size
+
+        Returns
+        -------
+        int
+            Cache files total size in bytes
+        """
+
+        return self.__size
+
+    @staticmethod
+    def __get_name(key, size, identifier, extension):
+        """ Generate the relative path of a cache file
+
+        Parameters
+        ----------
+        key : str
+            Cache category folder
+        size : int
+            Icon size in pixels
+        identifier : str
+            Icon identifier
+        extension : str
+            Cache file extension
+
+        Returns
+        -------
+        str
+            Cache file relative path
+        """
+
+        return f"{key}/{size}x{size}/{identifier}.{extension}"
+
+    def load(self):
+        """ Read the manifest file from the cache directory
+
+        Returns
+        -------
+        bool
+            True if the manifest was loaded, False otherwise
+        """
+
+        path = self.path.joinpath(self.manifest)
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = int()
+            self.__modified = False
+
+            if not path.exists():
+                return False
+
+            try:
+                data = json_loads(path.read_text())
+
+                if not data.get("version") == self.version:
+                    return False
+
+                for name, *entry in data["entries"]:
+                    self.__entries[name] = entry
+                    self.__size += entry[3]
+
+            except (OSError, ValueError, KeyError, TypeError,
+                    IndexError, AttributeError) as error:
+                self.logger.warning(f"Cannot read cache manifest: {error}")
+
+                self.__entries.clear()
+                self.__size = int()
+
+                return False
+
+        return True
+
+    def save(self):
+        """ Write the manifest file into the cache directory
+
+        Returns
+        -------
+        bool
+            True if the manifest was written, False otherwise
+        """
+
+        with self.__lock:
+            if not self.__modified:
+                return False
+
+            data = {
+                "version": self.version,
+                "entries": list(
+                    [name, *entry] for name, entry in self.__entries.items())
+            }
+
+            self.__modified = False
+
+        try:
+            if not self.path.exists():
+                self.path.mkdir(mode=0o755, parents=True)
+
+            self.path.joinpath(self.manifest).write_text(
+                json_dumps(data, separators=(',', ':')))
+
+        except OSError as error:
+            self.logger.warning(f"Cannot write cache manifest: {error}")
+            return False
+
+        return True
+
+    def get(self, key, size, identifier, source, extension="png"):
+        """ Retrieve a cache file which is up-to-date with its source
+
+        Cache files which are not stored in the manifest, or which source was
+        modified since they were generated, are considered as missing
+
+        Parameters
+        ----------
+        key : str
+            Cache category folder
+        size : int
+            Icon size in pixels
+        identifier : str
+            Icon identifier
+        source : pathlib.Path or str or None
+            Source file path
+        extension : str, optional
+            Cache file extension (Default: png)
+
+        Returns
+        -------
+        pathlib.Path or None
+            Cache file path, None if the cache file need to be generated
+        """
+
+        name = self.__get_name(key, size, identifier, extension)
+
+        with self.__lock:
+            entry = self.__entries.get(name)
+
+            if entry is None:
+                return None
+
+            path = self.path.joinpath(name)
+
+            if not entry[:3] == get_signature(source) \
+               or get_stat(path) is None:
+                self.__remove(name)
+                return None
+
+            # Mark this file as the most recently used
+            self.__entries.move_to_end(name)
+            self.__modified = True
+
+        return path
+
+    def register(self, key, size, identifier, source, extension="png"):
+        """ Store a new generated cache file into the manifest
+
+        The least recently used files are removed when the cache size exceeds
+        the budget
+
+        Parameters
+        ----------
+        key : str
+            Cache category folder
+        size : int
+            Icon size in pixels
+        identifier : str
+            Icon identifier
+        source : pathlib.Path or str or None
+            Source file path
+        extension : str, optional
+            Cache file extension (Default: png)
+
+        Returns
+        -------
+        bool
+            True if the cache file was stored, False otherwise
+        """
+
+        name = self.__get_name(key, size, identifier, extension)
+
+        stat = get_stat(self.path.joinpath(name))
+        if stat is None:
+            return False
+
+        with self.__lock:
+            if name in self.__entries:
+                self.__size -= self.__entries.pop(name)[3]
+
+            self.__entries[name] = [*get_signature(source), stat.st_size]
+            self.__size += stat.st_size
+
+            self.__modified = True
+
+            self.__evict()
+
+        return True
+
+    def __remove(self, name):
+        """ Remove a cache file and its manifest entry
+
+        Parameters
+        ----------
+        name : str
+            Cache file relative path
+        """
+
+        entry = self.__entries.pop(name, None)
+        if entry is not None:
+            self.__size -= entry[3]
+
+        self.__modified = True
+
+        try:
+            self.path.joinpath(name).unlink()
+
+        except FileNotFoundError:
+            pass
+
+        except OSError as error:
+            self.logger.warning(f"Cannot remove {name} from cache: {error}")
+
+    def __evict(self):
+        """ Remove the least recently used files to respect the cache budget
+
+        The most recently used file is always kept
+
+        Returns
+        -------
+        int
+            Number of removed files
+        """
+
+        counter = int()
+
+        if self.budget is None or self.budget <= 0:
+            return counter
+
+        while self.__size > self.budget and len(self.__entries) > 1:
+            self.__remove(next(iter(self.__entries)))
+
+            counter += 1
+
+        if counter > 0:
+            self.logger.debug(f"Remove {counter} files from cache")
+
+        return counter
+
+    def set_budget(self, budget):
+        """ Change the cache size budget
+
+        Parameters
+        ----------
+        budget : int or None
+            Maximum cache size in bytes, no limit if None or null
+
+        Returns
+        -------
+        int
+            Number of removed files
+        """
+
+        with self.__lock:
+            self.budget = budget
+
+            return self.__evict()
+
+    def collect(self, key, identifiers, extension="png"):
+        """ Remove cache files which belong to unknown identifiers
+
+        Files available in the category folder without a manifest entry are
+        also removed when their identifier is unknown
+
+        Parameters
+        ----------
+        key : str
+            Cache category folder
+        identifiers : list or set
+            Available identifiers
+        extension : str, optional
+            Extension of the files available in category folder
+            (Default: png)
+
+        Returns
+        -------
+        int
+            Number of removed files
+        """
+
+        identifiers = set(identifiers)
+
+        counter = int()
+
+        with self.__lock:
+            for name in list(self.__entries.keys()):
+                category, folder, filename = name.split('/')
+
+                if category == key \
+                   and Path(filename).stem not in identifiers:
+                    self.__remove(name)
+
+                    counter += 1
+
+            directory = self.path.joinpath(key)
+
+            if directory.exists():
+                for path in directory.glob(f"*/*.{extension}"):
+
+                    if path.stem not in identifiers:
+                        self.__remove(
+                            f"{key}/{path.parent.name}/{path.name}")
+
+                        counter += 1
+
+        if counter > 0:
+            self.logger.debug(
+                f"Remove {counter} orphan files from {key} cache")
+
+        return counter
+
+    def clear(self):
+        """ Forget every manifest entries
+
+        This function must be called when the cache directory is removed
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = int()
+
+            self.__modified = True
+
+
+class MemoryCache(object):
+
+    def __init__(self, budget=None):
+        """ Constructor
+
+        Parameters
+        ----------
+        budget : int, optional
+            Maximum cache size in bytes, the least recently used values are
+            removed when this size is exceeded (Default: None)
+        """
+
+        # ----------------------------------------
+        #   Variables
+        # ----------------------------------------
+
+        self.budget = budget
+
+        # Store values, source signature, size and source with key as key.
+        # The least recently used values are stored first
+        self.__entries = OrderedDict()
+
+        # Values total size
+        self.__size = int()
+
+        # Cache can be accessed from several threads
+        self.__lock = RLock()
+
+    def __len__(self):
+        """ Retrieve the number of values stored in memory
+
+        Returns
+        -------
+        int
+            Values number
+        """
+
+        return len(self.__entries)
+
+    @property
+    def size(self):
+        """ Retrieve values total size
+
+        Returns
+        -------
+        int
+            Values total size in bytes
+        """
+
+        return self.__size
+
+    def get(self, key, source):
+        """ Retrieve a value which was generated from the same source
+
+        Only the source path is compared here, to avoid a filesystem access
+        for each value. Modified source files are checked by validate
+
+        Parameters
+        ----------
+        key : tuple
+            Value key
+        source : pathlib.Path or str or None
+            Source file path
+
+        Returns
+        -------
+        object or None
+            Stored value, None if the value need to be generated
+        """
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            if not entry[1][0] == str(source):
+                self.__size -= self.__entries.pop(key)[2]
+                return None
+
+            # Mark this value as the most recently used
+            self.__entries.move_to_end(key)
+
+            return entry[0]
+
+    def set(self, key, value, size, source):
+        """ Store a value in memory
+
+        The least recently used values are removed when the cache size
+        exceeds the budget
+
+        Parameters
+        ----------
+        key : tuple
+            Value key
+        value : object
+            Value to store
+        size : int
+            Value size in bytes
+        source : pathlib.Path or str or None
+            Source file path
+
+        Returns
+        -------
+        bool
+            True if the value was stored, False if it exceeds the budget
+        """
+
+        if self.budget is not None and 0 < self.budget < size:
+            return False
+
+        with self.__lock:
+            if key in self.__entries:
+                self.__size -= self.__entries.pop(key)[2]
+
+            self.__entries[key] = (
+                value, get_signature(source), size, source)
+            self.__size += size
+
+            self.__evict()
+
+        return True
+
+    def __evict(self):
+        """ Remove the least recently used values to respect the cache budget
+
+        Returns
+        -------
+        int
+            Number of removed values
+        """
+
+        counter = int()
+
+        if self.budget is None or self.budget <= 0:
+            return counter
+
+        while self.__size > self.budget and len(self.__entries) > 0:
+            self.__size -= self.__entries.popitem(last=False)[1][2]
+
+            counter += 1
+
+        return counter
+
+    def set_budget(self, budget):
+        """ Change the cache size budget
+
+        Parameters
+        ----------
+        budget : int or None
+            Maximum cache size in bytes, no limit if None or null
+
+        Returns
+        -------
+        int
+            Number of removed values
+        """
+
+        with self.__lock:
+            self.budget = budget
+
+            return self.__evict()
+
+    def validate(self):
+        """ Remove values which source file was modified since they were stored
+
+        Sources status are retrieved without holding the lock, so this
+        function can be called from a thread while values are used
+
+        Returns
+        -------
+        int
+            Number of removed values
+        """
+
+        with self.__lock:
+            entries = list(self.__entries.items())
+
+        outdated = list((key, entry) for key, entry in entries
+                        if not entry[1] == get_signature(entry[3]))
+
+        counter = int()
+
+        with self.__lock:
+            for key, entry in outdated:
+
+                # Value was replaced meanwhile
+                if self.__entries.get(key) is not entry:
+                    continue
+
+                self.__size -= self.__entries.pop(key)[2]
+
+                counter += 1
+
+        return counter
+
+    def clear(self):
+        """ Remove every values from memory
+        """
+
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = int()
@@ -20,6 +20,12 @@
 # Database
 import sqlite3
 
+# Collections
+from collections import Counter
+
+# Context
+from contextlib import contextmanager
+
 # Filesystem
 from pathlib import Path
 
@@ -29,14 +35,122 @@ from geode_gem.engine.lib.configuration import Configuration
 # Logging
 from logging import Logger
 
+# System
+from sys import _getframe
+
+# Thread
+from threading import Lock, get_ident
+from threading import enumerate as thread_enumerate
+
+# Time
+from time import perf_counter
+
 
 # ------------------------------------------------------------------------------
 #   Class
 # ------------------------------------------------------------------------------
 
+class ProfileCursor(sqlite3.Cursor):
+
+    def __init__(self, *args, **kwargs):
+        """ Constructor
+
+        This cursor is used by Database when profiling is enabled, to count
+        retrieved rows and the time spent to fetch them
+        """
+
+        super(ProfileCursor, self).__init__(*args, **kwargs)
+
+        # Function called with elapsed time and rows number after each fetch
+        self.register = None
+
+    def __register(self, start, rows):
+        """ Send fetch statistics to the profiling function
+
+        Parameters
+        ----------
+        start : float
+            Fetch starting time
+        rows : int
+            Fetched rows number
+        """
+
+        if self.register is not None:
+            self.register(perf_counter() - start, rows)
+
+    def __next__(self):
+        """ Retrieve the next row when iterating over the cursor
+        """
+
+        start = perf_counter()
+
+        row = super(ProfileCursor, self).__next__()
+        self.__register(start, 1)
+
+        return row
+
+    def fetchone(self):
+        """ Retrieve the next row
+        """
+
+        start = perf_counter()
+
+        row = super(ProfileCursor, self).fetchone()
+        self.__register(start, int(row is not None))
+
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        """ Retrieve the next set of rows
+        """
+
+        start = perf_counter()
+
+        rows = super(ProfileCursor, self).fetchmany(*args, **kwargs)
+        self.__register(start, len(rows))
+
+        return rows
+
+    def fetchall(self):
+        """ Retrieve every remaining rows
+        """
+
+        start = perf_counter()
+
+        rows = super(ProfileCursor, self).fetchall()
+        self.__register(start, len(rows))
+
+        return rows
+
+
 class Database(object):
 
-    def __init__(self, db_path, configuration, logger):
+    pragmas = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -8192,
+        "mmap_size": 67108864,
+        "temp_store": "MEMORY"
+    }
+
+    # Maximum number of host parameters used in a single request
+    chunk_size = 500
+
+    # Number of prepared statements kept by each connection
+    cached_statements = 256
+
+    # Number of rows copied between two progress updates during migration
+    migration_chunk_size = 5000
+
+    # Number of rows fetched at once when iterating over a request
+    arraysize = 256
+
+    # Execution time in milliseconds above which a request is logged when
+    # profiling is enabled
+    slow_request_threshold = 100
+
+    def __init__(self, db_path, configuration, logger, profile=None,
+                 **pragmas):
         """ Constructor
 
         Parameters
@@ -47,6 +161,12 @@ class Database(object):
             Configuration file which contains database scheme
         logger : logging.Logger
             Logging object
+        profile : int, optional
+            Enable requests profiling and log requests which are slower than
+            this value in milliseconds (Default: None)
+        pragmas : dict, optional
+            Pragmas which override default values (journal_mode, synchronous,
+            cache_size, mmap_size, temp_store)
 
         Raises
         ------
@@ -77,14 +197,29 @@ class Database(object):
 
         self.logger = logger
 
-        self.sql_types = {
-            "NULL": None,
-            "BOOL": int,
-            "INTEGER": int,
-            "REAL": float,
-            "TEXT": str,
-            "BLOB": memoryview
-        }
+        # Avoid to modify the class attribute when overriding pragmas
+        self.pragmas = dict(Database.pragmas, **pragmas)
+
+        # Store opened connections with thread identifier as key
+        self.__connections = dict()
+        self.__lock = Lock()
+
+        # Store transaction depth with thread identifier as key
+        self.__transactions = dict()
+
+        # Store tables columns with table name as key
+        self.__columns = dict()
+
+        # Store tables and columns which cannot be used as UPSERT target
+        self.__conflicts = set()
+
+        # Store requests statistics with request as key
+        self.__profile = None
+        self.__profile_lock = Lock()
+        self.__profile_threshold = None
+
+        if profile is not None:
+            self.set_profiling(True, profile)
 
         # ------------------------------------
         #   Intialization
@@ -104,47 +239,433 @@ class Database(object):
             for table in tables:
                 self.create_table(table)
 
-    def __generate_request(self, table, data):
+    def __generate_request(self, data, conditions=False):
         """ Generate a request to database
 
-        This function generate a correct sql request from data dict which use
-        keys as columns.
+        This function generate a parameterized sql request from data dict which
+        use keys as columns. Values are never written into the request string
+        to let SQLite reuse the prepared statement.
 
         Parameters
         ----------
-        table : str
-            Table name
         data : dict
             Columns keys with values
+        conditions : bool, optional
+            Generate request for a WHERE clause, which use IS NULL operator for
+            empty values (Default: False)
 
         Returns
         -------
-        list
-            Request strings list
+        tuple
+            Request strings list and parameters list
+        """
+
+        values, parameters = list(), list()
+
+        for column, value in data.items():
+
+            if conditions and value is None:
+                values.append("%s IS NULL" % str(column))
+
+            else:
+                values.append("%s = ?" % str(column))
+                parameters.append(self.__convert_value(value))
+
+        return values, parameters
+
+    def __convert_value(self, value):
+        """ Convert a value to a type supported by SQLite
+
+        Parameters
+        ----------
+        value : object
+            Value to convert
+
+        Returns
+        -------
+        object
+            Converted value
+        """
+
+        if value is None or type(value) in (int, float, str, bytes):
+            return value
+
+        if type(value) is bool:
+            return int(value)
+
+        return str(value)
+
+    def __init_pragmas(self, connection):
+        """ Apply pragmas on a freshly opened connection
+
+        Parameters
+        ----------
+        connection : sqlite3.Connection
+            Database connection
         """
 
-        values = list()
+        for key, value in self.pragmas.items():
+            if value is None:
+                continue
+
+            try:
+                connection.execute("PRAGMA %(key)s = %(value)s;" % {
+                    "key": key,
+                    "value": value
+                })
+
+            except Exception as error:
+                self.logger.error(
+                    "Cannot set %s pragma: %s" % (key, str(error)))
+
+    def connect(self):
+        """ Retrieve the database connection for the current thread
+
+        The main thread keep the same connection during the whole object life,
+        other threads (GameThread, ScriptThread, ...) receive their own
+        connection which is stored in a small pool and reused on next calls.
+
+        Returns
+        -------
+        sqlite3.Connection
+            Database connection
+        """
+
+        identifier = get_ident()
+
+        with self.__lock:
+            connection = self.__connections.get(identifier, None)
 
-        if self.configuration.has_section(table):
+            if connection is None:
+                # Close connections which belong to terminated threads
+                alive = [thread.ident for thread in thread_enumerate()]
 
-            for column, value in data.items():
-                sql_type = self.configuration.get(table, column).split()[0]
+                for key in list(self.__connections.keys()):
+                    if key not in alive:
+                        self.__connections.pop(key).close()
 
-                if sql_type.upper() in list(self.sql_types.keys()):
+                connection = sqlite3.connect(
+                    str(self.path),
+                    check_same_thread=False,
+                    cached_statements=self.cached_statements)
 
-                    if self.sql_types.get(sql_type.upper()) is str:
-                        values.append("%s = \"%s\"" % (
-                            str(column), str(data.get(column))))
-                    else:
-                        values.append("%s = %s" % (
-                            str(column), str(data.get(column))))
+                self.__init_pragmas(connection)
+
+                self.__connections[identifier] = connection
+
+        return connection
+
+    def close(self):
+        """ Close every opened connections
+
+        This function must be called before moving or removing the database
+        file, to ensure the write-ahead log is merged back into the database.
+        """
+
+        with self.__lock:
+            for connection in self.__connections.values():
+                try:
+                    connection.close()
+
+                except Exception as error:
+                    self.logger.error(str(error))
+
+            self.__connections.clear()
+
+    def execute(self, request, parameters=tuple(), commit=False,
+                row_factory=None):
+        """ Execute a request on the current thread connection
+
+        Parameters
+        ----------
+        request : str
+            SQL request with ? placeholders
+        parameters : list or tuple, optional
+            Values bound to the request placeholders (Default: empty tuple)
+        commit : bool, optional
+            Commit the transaction after request execution (Default: False)
+        row_factory : callable, optional
+            Factory used by the returned cursor to generate rows
+            (Default: None)
+
+        Returns
+        -------
+        sqlite3.Cursor
+            Cursor which contains request results
+
+        Raises
+        ------
+        sqlite3.Error
+            When the request cannot be executed
+        """
+
+        database = self.connect()
+
+        if self.__profile is not None:
+            return self.__execute_profile(
+                database, request, parameters, commit, row_factory)
+
+        cursor = database.cursor()
+        if row_factory is not None:
+            cursor.row_factory = row_factory
+
+        cursor.execute(request, parameters)
+
+        # Commit is delayed until the end of the current transaction scope
+        if commit and get_ident() not in self.__transactions:
+            database.commit()
+
+        return cursor
+
+    def __execute_profile(self, database, request, parameters, commit,
+                          row_factory):
+        """ Execute a request and store his statistics
+
+        Parameters
+        ----------
+        database : sqlite3.Connection
+            Current thread connection
+        request : str
+            SQL request with ? placeholders
+        parameters : list or tuple
+            Values bound to the request placeholders
+        commit : bool
+            Commit the transaction after request execution
+        row_factory : callable
+            Factory used by the returned cursor to generate rows
+
+        Returns
+        -------
+        gem.engine.lib.database.ProfileCursor
+            Cursor which contains request results
+        """
+
+        # Retrieve the first function outside of this module
+        frame = _getframe(1)
+        while frame is not None and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+
+        caller = "unknown"
+        if frame is not None:
+            caller = "%s:%s" % (
+                Path(frame.f_code.co_filename).stem, frame.f_code.co_name)
+
+        cursor = database.cursor(ProfileCursor)
+        if row_factory is not None:
+            cursor.row_factory = row_factory
+
+        start = perf_counter()
+
+        cursor.execute(request, parameters)
+
+        if commit and get_ident() not in self.__transactions:
+            database.commit()
+
+        elapsed = perf_counter() - start
+
+        rows = 0
+        if cursor.rowcount > 0:
+            rows = cursor.rowcount
+
+        self.__register_profile(request, elapsed, rows, caller)
+
+        cursor.register = lambda elapsed, rows: self.__register_profile(
+            request, elapsed, rows)
+
+        if elapsed * 1000 >= self.__profile_threshold:
+            self.logger.warning("Slow request (%.2f ms) from %s: %s" % (
+                elapsed * 1000, caller, " ".join(request.split())))
+
+        return cursor
+
+    def __register_profile(self, request, elapsed, rows, caller=None):
+        """ Store statistics for a specific request
+
+        Parameters
+        ----------
+        request : str
+            SQL request
+        elapsed : float
+            Time spent in seconds
+        rows : int
+            Affected or retrieved rows number
+        caller : str, optional
+            Function which execute the request, None when statistics come
+            from a rows retrieving (Default: None)
+        """
+
+        with self.__profile_lock:
+            if self.__profile is None:
+                return
+
+            if request not in self.__profile:
+                self.__profile[request] = {
+                    "calls": 0,
+                    "time": 0.0,
+                    "maximum": 0.0,
+                    "rows": 0,
+                    "callers": Counter()
+                }
+
+            data = self.__profile[request]
+
+            data["time"] += elapsed
+            data["rows"] += rows
+
+            if caller is not None:
+                data["calls"] += 1
+                data["maximum"] = max(data["maximum"], elapsed)
+                data["callers"][caller] += 1
+
+    def set_profiling(self, status, threshold=None):
+        """ Enable or disable requests profiling
+
+        Parameters
+        ----------
+        status : bool
+            Profiling status
+        threshold : int, optional
+            Execution time in milliseconds above which a request is logged
+            (Default: Database.slow_request_threshold)
+        """
+
+        with self.__profile_lock:
+            if not status:
+                self.__profile = None
+
+            elif self.__profile is None:
+                self.__profile = dict()
+
+        if threshold is None:
+            threshold = self.slow_request_threshold
+
+        self.__profile_threshold = threshold
+
+    def get_profile(self):
+        """ Retrieve requests statistics
+
+        Returns
+        -------
+        dict
+            Statistics with request as key, each value contains the calls
+            number, the total and maximum time in seconds, the rows number and
+            the callers functions counter
+        """
+
+        if self.__profile is None:
+            return dict()
+
+        with self.__profile_lock:
+            return dict((request, dict(data, callers=Counter(data["callers"])))
+                        for request, data in self.__profile.items())
+
+    def log_profile(self, limit=20):
+        """ Write requests statistics summary into logger
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of requests to show, sorted by total time
+            (Default: 20)
+        """
+
+        statistics = self.get_profile()
+
+        if len(statistics) == 0:
+            return
+
+        self.logger.info("Database profile: %d requests, %d calls, %.2f ms" % (
+            len(statistics),
+            sum(data["calls"] for data in statistics.values()),
+            sum(data["time"] for data in statistics.values()) * 1000))
+
+        requests = sorted(statistics.items(),
+                          key=lambda item: item[1]["time"],
+                          reverse=True)
+
+        for request, data in requests[:limit]:
+            self.logger.info(
+                "%8.2f ms (max %.2f ms) | %6d calls | %7d rows | %s | %s" % (
+                    data["time"] * 1000,
+                    data["maximum"] * 1000,
+                    data["calls"],
+                    data["rows"],
+                    ", ".join(caller for caller, counter
+                              in data["callers"].most_common(3)),
+                    " ".join(request.split())))
+
+    @contextmanager
+    def transaction(self):
+        """ Group requests into a single transaction
+
+        Every request executed in this scope by the current thread is
+        committed once when leaving the outermost scope, or rolled back if an
+        exception is raised inside it.
+
+        The write lock is acquired when entering the outermost scope, so
+        concurrent threads wait for each other instead of failing when they
+        try to upgrade their read snapshot.
+
+        Examples
+        --------
+        >>> with database.transaction():
+        ...     database.insert("main", {"name": "doe"})
+        ...     database.insert("main", {"name": "smith"})
+        """
+
+        identifier = get_ident()
+        database = self.connect()
+
+        depth = self.__transactions.get(identifier, 0)
+        if depth == 0 and not database.in_transaction:
+            database.execute("BEGIN IMMEDIATE;")
+
+        self.__transactions[identifier] = depth + 1
+
+        try:
+            yield database
+
+        except Exception:
+            if depth == 0:
+                database.rollback()
+
+            raise
 
         else:
-            for column, value in data.items():
-                values.append("%s = \"%s\"" % (
-                    str(column), str(data.get(column))))
+            if depth == 0:
+                database.commit()
+
+        finally:
+            if depth == 0:
+                del self.__transactions[identifier]
+
+            else:
+                self.__transactions[identifier] = depth
 
-        return values
+    def __generate_row(self, row):
+        """ Generate a dictionary from a database row
+
+        Parameters
+        ----------
+        row : sqlite3.Row
+            Database row
+
+        Returns
+        -------
+        dict
+            Row data with columns as keys
+        """
+
+        data = dict()
+
+        for column in row.keys():
+            value = row[column]
+            if value == "None":
+                value = None
+
+            data[column] = value
+
+        return data
 
     def create_table(self, table):
         """ Create a new table into database
@@ -155,27 +676,22 @@ class Database(object):
             Table name
         """
 
-        request = list()
+        self.__columns.pop(table, None)
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        request = list()
 
         for option in self.configuration.items(table):
             request.append(" ".join(option))
 
         try:
-            with database:
-                cursor.execute("CREATE TABLE %(table)s (%(data)s);" % {
-                    "table": table,
-                    "data": ", ".join(request)
-                })
+            self.execute("CREATE TABLE %(table)s (%(data)s);" % {
+                "table": table,
+                "data": ", ".join(request)
+            }, commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
     def rename_table(self, table, name):
         """ Rename a table from database
 
@@ -187,21 +703,18 @@ class Database(object):
             New table name
         """
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        self.__columns.pop(table, None)
+        self.__columns.pop(name, None)
 
         try:
-            cursor.execute("ALTER TABLE %(table)s RENAME TO %(name)s;" % {
+            self.execute("ALTER TABLE %(table)s RENAME TO %(name)s;" % {
                 "table": table,
                 "name": name
-            })
+            }, commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
     def remove_table(self, table):
         """ Remove a table from database
 
@@ -211,20 +724,16 @@ class Database(object):
             Table name
         """
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        self.__columns.pop(table, None)
 
         try:
-            cursor.execute("DROP TABLE IF EXISTS %(table)s;" % {
+            self.execute("DROP TABLE IF EXISTS %(table)s;" % {
                 "table": table
-            })
+            }, commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
     def add_column(self, table, name, sql_type):
         """ Add a new column into database
 
@@ -238,27 +747,90 @@ class Database(object):
             Column type
         """
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        self.__columns.pop(table, None)
 
         try:
-            with database:
-                cursor.execute(
-                    "ALTER TABLE %(table)s ADD COLUMN %(name)s %(type)s;" % {
-                        "table": table,
-                        "name": name,
-                        "type": sql_type
-                    })
+            self.execute(
+                "ALTER TABLE %(table)s ADD COLUMN %(name)s %(type)s;" % {
+                    "table": table,
+                    "name": name,
+                    "type": sql_type
+                }, commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
+    def create_virtual_table(self, table, module, arguments):
+        """ Create a new virtual table into database if not exists
+
+        Virtual tables are not described by the configuration schema and are
+        ignored by check_integrity.
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        module : str
+            Virtual table module name (fts5, rtree, ...)
+        arguments : list
+            Module arguments list
+
+        Returns
+        -------
+        bool
+            True if the table is available, False otherwise (when the SQLite
+            library was built without this module for example)
+        """
+
+        try:
+            self.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS %(table)s "
+                "USING %(module)s (%(arguments)s);" % {
+                    "table": table,
+                    "module": module,
+                    "arguments": ", ".join(arguments)
+                }, commit=True)
+
+        except Exception as error:
+            self.logger.warning(
+                "Cannot create %s virtual table: %s" % (table, str(error)))
+
+            return False
+
+        return True
+
+    def create_index(self, table, columns, unique=False):
+        """ Create an index on table columns if not exists
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        columns : list
+            Indexed columns name list
+        unique : bool, optional
+            Forbid duplicate values for indexed columns (Default: False)
+        """
+
+        try:
+            self.execute(
+                "CREATE %(unique)sINDEX IF NOT EXISTS %(name)s "
+                "ON %(table)s (%(columns)s);" % {
+                    "unique": "UNIQUE " if unique else str(),
+                    "name": "_".join(["index", table, *columns]),
+                    "table": table,
+                    "columns": ", ".join(columns)
+                }, commit=True)
+
+        except Exception as error:
+            self.logger.critical(str(error))
 
     def get_columns(self, table):
         """ Get all the columns from database
 
+        The columns list is stored in memory after the first request and
+        refreshed only when the table schema is modified by this object.
+
         Parameters
         ----------
         table : str
@@ -270,26 +842,25 @@ class Database(object):
             Columns list
         """
 
-        columns = list()
+        if table in self.__columns:
+            return list(self.__columns[table])
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        columns = list()
 
         try:
-            with database:
-                request = cursor.execute("PRAGMA table_info(%(table)s);" % {
-                    "table": table
-                })
+            request = self.execute("PRAGMA table_info(%(table)s);" % {
+                "table": table
+            })
 
-                for data in request.fetchall():
-                    columns.append(data[1])
+            for data in request.fetchall():
+                columns.append(data[1])
+
+            if len(columns) > 0:
+                self.__columns[table] = list(columns)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
         return columns
 
     def insert(self, table, data):
@@ -306,41 +877,21 @@ class Database(object):
             Columns keys and values
         """
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        # Empty values are replaced by the column default value
+        data = dict((column, self.__convert_value(value))
+                    for column, value in data.items() if value is not None)
 
         try:
-            values, columns = list(), list()
-
-            for column in list(data.keys()):
-                sql_type = self.configuration.get(table, column).split()[0]
-
-                if sql_type.upper() in list(self.sql_types.keys()):
-
-                    if self.sql_types.get(sql_type.upper()) is str:
-                        if data.get(column) is not None:
-                            columns.append(column)
-                            values.append("\"%s\"" % str(data.get(column)))
-
-                    elif data.get(column) is not None:
-                        columns.append(column)
-                        values.append(str(data.get(column)))
-
-            with database:
-                cursor.execute(
-                    "INSERT INTO %(table)s (%(columns)s) VALUES (%(data)s);"
-                    "" % {
-                        "table": table,
-                        "columns": ", ".join(columns),
-                        "data": ", ".join(values)
-                    })
+            self.execute(
+                "INSERT INTO %(table)s (%(columns)s) VALUES (%(data)s);" % {
+                    "table": table,
+                    "columns": ", ".join(data.keys()),
+                    "data": ", ".join('?' * len(data))
+                }, list(data.values()), commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
     def update(self, table, data, where):
         """ Update a row from database
 
@@ -357,27 +908,21 @@ class Database(object):
             Request conditions
         """
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        values, parameters = self.__generate_request(data)
+        conditions, conditions_parameters = self.__generate_request(
+            where, conditions=True)
 
         try:
-            values = self.__generate_request(table, data)
-            conditions = self.__generate_request(table, where)
-
-            with database:
-                cursor.execute(
-                    "UPDATE %(table)s SET %(data)s WHERE %(where)s;" % {
-                        "table": table,
-                        "data": ", ".join(values),
-                        "where": " AND ".join(conditions)
-                    })
+            self.execute(
+                "UPDATE %(table)s SET %(data)s WHERE %(where)s;" % {
+                    "table": table,
+                    "data": ", ".join(values),
+                    "where": " AND ".join(conditions)
+                }, parameters + conditions_parameters, commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
     def select(self, table, columns, where=None):
         """ Get rows from the database
 
@@ -409,26 +954,24 @@ class Database(object):
         if type(columns) is not list:
             columns = [columns]
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
-
         try:
             if where is None:
-                request = cursor.execute(
+                request = self.execute(
                     "SELECT %(columns)s FROM %(table)s;" % {
                         "table": table,
                         "columns": ", ".join(columns)
                     })
 
             else:
-                conditions = self.__generate_request(table, where)
+                conditions, parameters = self.__generate_request(
+                    where, conditions=True)
 
-                request = cursor.execute(
+                request = self.execute(
                     "SELECT %(columns)s FROM %(table)s WHERE %(where)s;" % {
                         "table": table,
                         "columns": ", ".join(columns),
                         "where": " AND ".join(conditions)
-                    })
+                    }, parameters)
 
             value = request.fetchall()
 
@@ -438,9 +981,6 @@ class Database(object):
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
         if value is not None and len(value) == 0:
             return None
         elif value is not None and len(value) == 1:
@@ -448,6 +988,97 @@ class Database(object):
 
         return value
 
+    def is_empty(self, table):
+        """ Check if a table contains rows
+
+        Parameters
+        ----------
+        table : str
+            Table name
+
+        Returns
+        -------
+        bool
+            True if the table has no row, False otherwise
+        """
+
+        try:
+            return self.execute("SELECT 1 FROM %(table)s LIMIT 1;" % {
+                "table": table
+            }).fetchone() is None
+
+        except Exception as error:
+            self.logger.critical(str(error))
+
+        return True
+
+    def iter_select(self, table, columns, where=None, arraysize=None):
+        """ Iterate over rows from the database
+
+        Contrary to select, this function never load the whole results in
+        memory and always generate rows as tuples, whatever the results number.
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        columns : list
+            Columns name list
+        where : dict, optional
+            Request conditions (default: None)
+        arraysize : int, optional
+            Number of rows fetched at once from database (default: None, which
+            use Database.arraysize)
+
+        Yields
+        ------
+        tuple
+            Database row
+
+        Examples
+        --------
+        >>> list(database.iter_select("main", ["age"], {"name": "doe"}))
+        [(42,)]
+        """
+
+        if type(columns) is not list:
+            columns = [columns]
+
+        if arraysize is None:
+            arraysize = self.arraysize
+
+        request = "SELECT %(columns)s FROM %(table)s" % {
+            "table": table,
+            "columns": ", ".join(columns)
+        }
+
+        parameters = list()
+
+        if where is not None:
+            conditions, parameters = self.__generate_request(
+                where, conditions=True)
+
+            request += " WHERE %s" % " AND ".join(conditions)
+
+        try:
+            cursor = self.execute(request + ';', parameters)
+            cursor.arraysize = arraysize
+
+        except Exception as error:
+            self.logger.critical(str(error))
+            return
+
+        try:
+            rows = cursor.fetchmany()
+
+            while len(rows) > 0:
+                yield from rows
+
+                rows = cursor.fetchmany()
+
+        finally:
+            cursor.close()
+
     def remove(self, table, where):
         """ Remove data from database
 
@@ -462,30 +1093,32 @@ class Database(object):
             Request conditions
         """
 
-        database = sqlite3.connect(str(self.path))
-        cursor = database.cursor()
+        conditions, parameters = self.__generate_request(
+            where, conditions=True)
 
         try:
-            with database:
-                conditions = self.__generate_request(table, where)
-
-                cursor.execute("DELETE FROM %(table)s WHERE %(where)s;" % {
-                    "table": table,
-                    "where": " AND ".join(conditions)
-                })
+            self.execute("DELETE FROM %(table)s WHERE %(where)s;" % {
+                "table": table,
+                "where": " AND ".join(conditions)
+            }, parameters, commit=True)
 
         except Exception as error:
             self.logger.critical(str(error))
 
-        database.commit()
-        cursor.close()
-
     def modify(self, table, data, where=None):
         """ Set a specific data in main table
 
         This function insert or update a row from database with data and where
         dict which use keys as columns.
 
+        When the where keys are not modified, the row is written with a single
+        UPSERT request which use these keys as conflict target. When these keys
+        are not a primary key or an unique index, the row is checked with a
+        SELECT request before being inserted or updated.
+
+        As with insert and update methods, empty values are replaced by the
+        column default value for a new row and clear the column otherwise.
+
         Parameters
         ----------
         table : str
@@ -496,6 +1129,22 @@ class Database(object):
             Request conditions (Default: None)
         """
 
+        # UPSERT syntax is only available since SQLite 3.24
+        use_upsert = where is not None and \
+            sqlite3.sqlite_version_info >= (3, 24, 0)
+
+        # The where keys are modified, a simple UPSERT cannot be used here
+        if use_upsert:
+            use_upsert = not any(column in data and not data[column] == value
+                                 for column, value in where.items())
+
+        # The where keys are not a primary key or an unique index
+        if use_upsert:
+            use_upsert = (table, tuple(where.keys())) not in self.__conflicts
+
+        if use_upsert and self.__upsert(table, data, where):
+            return
+
         request = self.select(table, list(data.keys()), where)
 
         if request is None:
@@ -507,6 +1156,73 @@ class Database(object):
         else:
             self.update(table, data, where)
 
+    def __upsert(self, table, data, where):
+        """ Insert or update a row with a single UPSERT request
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        data : dict
+            Columns keys and values
+        where : dict
+            Request conditions used as conflict target
+
+        Returns
+        -------
+        bool
+            False if where keys cannot be used as conflict target, True
+            otherwise
+        """
+
+        values = dict((column, self.__convert_value(value))
+                      for column, value in data.items() if value is not None)
+        values.update((column, self.__convert_value(value))
+                      for column, value in where.items())
+
+        updates = list()
+        for column, value in data.items():
+            if column in where:
+                continue
+
+            if value is None:
+                updates.append("%s = NULL" % column)
+
+            else:
+                updates.append("%(column)s = excluded.%(column)s" % {
+                    "column": column
+                })
+
+        try:
+            self.execute(
+                "INSERT INTO %(table)s (%(columns)s) VALUES (%(data)s) "
+                "ON CONFLICT(%(keys)s) DO %(update)s;" % {
+                    "table": table,
+                    "columns": ", ".join(values.keys()),
+                    "data": ", ".join('?' * len(values)),
+                    "keys": ", ".join(where.keys()),
+                    "update": "UPDATE SET %s" % ", ".join(updates)
+                    if updates else "NOTHING"
+                }, list(values.values()), commit=True)
+
+        except sqlite3.OperationalError as error:
+            if "ON CONFLICT clause does not match" not in str(error):
+                self.logger.critical(str(error))
+                return True
+
+            self.logger.debug(
+                "Cannot use %s columns as conflict target for %s table" % (
+                    ", ".join(where.keys()), table))
+
+            self.__conflicts.add((table, tuple(where.keys())))
+
+            return False
+
+        except Exception as error:
+            self.logger.critical(str(error))
+
+        return True
+
     def get(self, table, where):
         """ Get rows from database
 
@@ -533,21 +1249,206 @@ class Database(object):
 
         result = None
 
-        values = self.select(table, ['*'], where)
+        conditions, parameters = self.__generate_request(
+            where, conditions=True)
 
-        if values is not None:
-            columns = self.get_columns(table)
+        try:
+            row = self.execute(
+                "SELECT * FROM %(table)s WHERE %(where)s;" % {
+                    "table": table,
+                    "where": " AND ".join(conditions)
+                }, parameters, row_factory=sqlite3.Row).fetchone()
 
-            result = dict()
-            for column in columns:
-                value = values[columns.index(column)]
-                if value == "None":
-                    value = None
+            if row is not None:
+                result = self.__generate_row(row)
 
-                result[column] = value
+        except Exception as error:
+            self.logger.critical(str(error))
 
         return result
 
+    def get_many(self, table, key, values):
+        """ Get rows from database for a list of key values
+
+        This function request rows which match one of the specified values in
+        a minimal number of requests, instead of calling get() for each value.
+
+        Parameters
+        ----------
+        table : str
+            Table name
+        key : str
+            Column used to match values
+        values : list
+            Values to retrieve
+
+        Returns
+        -------
+        dict
+            Rows data with key column value as keys
+
+        Examples
+        --------
+        >>> database.get_many("main", "name", ["doe", "smith"])
+        {'doe': {'name': 'doe', 'age': 42}, 'smith': {'name': 'smith', ...}}
+        """
+
+        results = dict()
+
+        values = list(set(values))
+
+        try:
+            # Split values to respect the SQLite host parameters limit
+            for index in range(0, len(values), self.chunk_size):
+                chunk = values[index:index + self.chunk_size]
+
+                request = self.execute(
+                    "SELECT * FROM %(table)s WHERE %(key)s IN (%(data)s);" % {
+                        "table": table,
+                        "key": key,
+                        "data": ", ".join('?' * len(chunk))
+                    }, chunk, row_factory=sqlite3.Row)
+
+                for row in request.fetchall():
+                    data = self.__generate_row(row)
+
+                    results[data[key]] = data
+
+        except Exception as error:
+            self.logger.critical(str(error))
+
+        return results
+
+    @staticmethod
+    def __convert_default(value):
+        """ Convert a column default value to a SQL literal
+
+        Parameters
+        ----------
+        value : str
+            Default value as returned by the table_info pragma
+
+        Returns
+        -------
+        str
+            SQL literal
+
+        Examples
+        --------
+        >>> database.__convert_default('"text"')
+        "'text'"
+        """
+
+        # Double quoted strings are identifiers outside of a column definition
+        if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+            value = value[1:-1].replace('""', '"')
+
+            return "'%s'" % value.replace("'", "''")
+
+        return value
+
+    def migrate(self, path, table, updater=None):
+        """ Copy a table content from another database file
+
+        The other database is attached to the current connection and rows are
+        copied with INSERT ... SELECT requests inside a single transaction, so
+        they never go through Python. Only columns which exist in both tables
+        are copied, and empty values of not null columns are replaced by the
+        column default value.
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Database filepath which contains the rows to copy
+        table : str
+            Table name
+        updater : class, optional
+            Class to call when rows are copied, which use init(length) and
+            update(index) methods (Default: None)
+
+        Returns
+        -------
+        int
+            Copied rows number
+        """
+
+        counter = int()
+
+        self.execute("ATTACH DATABASE ? AS previous;", (str(path),))
+
+        try:
+            request = self.execute(
+                "SELECT name FROM previous.sqlite_master "
+                "WHERE type = 'table' AND name = ?;", (table,))
+
+            if request.fetchone() is None:
+                return counter
+
+            previous_columns = list(
+                data[1] for data in self.execute(
+                    "PRAGMA previous.table_info(%(table)s);" % {
+                        "table": table
+                    }).fetchall())
+
+            columns, values = list(), list()
+
+            scheme = self.execute(
+                "PRAGMA main.table_info(%(table)s);" % {
+                    "table": table
+                }).fetchall()
+
+            for data in scheme:
+                column, notnull, default = data[1], data[3], data[4]
+
+                # Avoid to retrieve columns which are no more used
+                if column not in previous_columns:
+                    continue
+
+                columns.append(column)
+
+                # Previous scheme can allow empty values in this column
+                if notnull and default is not None:
+                    values.append("COALESCE(%s, %s)" % (
+                        column, self.__convert_default(default)))
+
+                else:
+                    values.append(column)
+
+            length, first, last = self.execute(
+                "SELECT COUNT(*), MIN(rowid), MAX(rowid) "
+                "FROM previous.%(table)s;" % {
+                    "table": table
+                }).fetchone()
+
+            if updater is not None:
+                updater.init(length)
+
+            if length == 0:
+                return counter
+
+            with self.transaction():
+
+                for index in range(first, last + 1,
+                                   self.migration_chunk_size):
+                    cursor = self.execute(
+                        "INSERT INTO %(table)s (%(columns)s) "
+                        "SELECT %(values)s FROM previous.%(table)s "
+                        "WHERE rowid >= ? AND rowid < ?;" % {
+                            "table": table,
+                            "columns": ", ".join(columns),
+                            "values": ", ".join(values)
+                        }, (index, index + self.migration_chunk_size))
+
+                    counter += cursor.rowcount
+
+                    if updater is not None:
+                        updater.update(counter)
+
+        finally:
+            self.execute("DETACH DATABASE previous;")
+
+        return counter
+
     def check_integrity(self):
         """ Check if database respect configuration schema
 
@@ -557,10 +1458,20 @@ class Database(object):
             Integrity status
         """
 
-        tables = self.select("sqlite_master", ["name"], {"type": "table"})
+        tables = self.select(
+            "sqlite_master", ["name", "sql"], {"type": "table"})
         if not type(tables) is list:
             tables = [tables]
 
+        # Virtual tables and their shadow tables are not part of the schema
+        virtual_tables = list(name for name, sql in tables
+                              if sql.upper().startswith("CREATE VIRTUAL"))
+
+        tables = list(name for name, sql in tables
+                      if name not in virtual_tables
+                      and not any(name.startswith("%s_" % virtual)
+                                  for virtual in virtual_tables))
+
         if not sorted(tables) == sorted(self.configuration.sections()):
             return False
 
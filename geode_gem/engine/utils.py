@@ -21,9 +21,12 @@
 from datetime import datetime, timedelta
 
 # Filesystem
-from os.path import getctime
+from os import access, scandir, sep, X_OK
+from os import stat as os_stat
+from os.path import abspath, dirname
 from pathlib import Path
 from shutil import copy2
+from stat import S_ISDIR, S_ISREG
 
 # Regex
 from re import sub
@@ -32,6 +35,45 @@ from re import sub
 from os import environ
 from sys import version_info
 
+# Time
+from time import time_ns
+
+
+# ------------------------------------------------------------------------------
+#   Variables
+# ------------------------------------------------------------------------------
+
+# Store resolved binaries with binary and $PATH variable as key
+_binaries = dict()
+
+# Delay in nanoseconds during which a resolved binary is used without checking
+# the directories which can contain it
+BINARY_CACHE_DELAY = 1000000000
+
+# Delay in nanoseconds during which a modified directory can be modified again
+# without changing its modification time, as some filesystems use a coarse
+# modification time
+DIRECTORY_RACY_DELAY = 2000000000
+
+# Store sniffed mimetypes with file path as key
+_mimetypes = dict()
+
+# Files signatures used to detect images mimetypes
+MIMETYPE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+    (b"II*\x00", "image/tiff"),
+    (b"MM\x00*", "image/tiff"),
+    (b"\x00\x00\x01\x00", "image/vnd.microsoft.icon"),
+)
+
+# Bytes which can be found in a text file
+TEXT_CHARACTERS = bytes(
+    {7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
+
 
 # ------------------------------------------------------------------------------
 #   Methods
@@ -158,13 +200,230 @@ def get_binary_path(binary):
     return available
 
 
-def generate_identifier(path):
+def resolve_binary_path(binary):
+    """ Retrieve the absolute path of the binary which will be executed
+
+    Like shutil.which, a binary which contains a directory is used as a path,
+    and a binary name is only searched in $PATH directories. The binary must
+    be an executable regular file. The result is cached with binary and $PATH
+    as key, and is only resolved again when one of these directories
+    modification time changed. Directories are checked at most once during
+    BINARY_CACHE_DELAY.
+
+    Parameters
+    ----------
+    binary : str or pathlib.Path
+        Binary name or path
+
+    Returns
+    -------
+    str or None
+        Binary absolute path, None if the binary is not available
+
+    Examples
+    --------
+    >>> resolve_binary_path("ls")
+    '/bin/ls'
+    """
+
+    if binary is None or len(str(binary)) == 0:
+        return None
+
+    binary = str(Path(binary).expanduser())
+
+    key = (binary, environ.get("PATH", str()))
+
+    now = time_ns()
+
+    data = _binaries.get(key)
+    if data is not None and now - data[0] < BINARY_CACHE_DELAY:
+        return data[2]
+
+    candidates = list()
+
+    # Binary path is not searched in $PATH directories
+    if sep in binary:
+        candidates.append(abspath(binary))
+
+    # Empty $PATH entries are ignored to avoid to use the current directory
+    else:
+        for path in key[1].split(':'):
+            candidate = abspath(Path(path, binary))
+
+            if path and candidate not in candidates:
+                candidates.append(candidate)
+
+    directories = list()
+    for candidate in candidates:
+        if dirname(candidate) not in directories:
+            directories.append(dirname(candidate))
+
+    mtimes = list()
+    for directory in directories:
+        stat = get_stat(directory)
+        mtimes.append(stat.st_mtime_ns if stat is not None else None)
+
+    mtimes = tuple(mtimes)
+
+    if data is not None and data[1] == mtimes:
+        _binaries[key] = (now, mtimes, data[2])
+        return data[2]
+
+    resolved = None
+    for candidate in candidates:
+        stat = get_stat(candidate)
+
+        if stat is not None and S_ISREG(stat.st_mode) \
+           and access(candidate, X_OK):
+            resolved = candidate
+            break
+
+    _binaries[key] = (now, mtimes, resolved)
+
+    return resolved
+
+
+def get_stat(path):
+    """ Retrieve the status of a specific file with a single system call
+
+    Parameters
+    ----------
+    path : pathlib.Path or str
+        File path
+
+    Returns
+    -------
+    os.stat_result or None
+        File status, None if the file not exists or cannot be accessed
+
+    Examples
+    --------
+    >>> get_stat("~/.bashrc").st_size
+    3526
+    """
+
+    if isinstance(path, str):
+        path = Path(path).expanduser()
+
+    try:
+        return os_stat(path)
+
+    except (OSError, ValueError):
+        return None
+
+
+def get_signature(path):
+    """ Generate a signature which change when a file is modified
+
+    Parameters
+    ----------
+    path : pathlib.Path or str or None
+        File path
+
+    Returns
+    -------
+    list
+        File path, modification time and size, which are None when the path
+        is not an available file, like a themed icon name
+
+    Examples
+    --------
+    >>> get_signature("~/.bashrc")
+    ['~/.bashrc', 1590317281283457350, 3526]
+    """
+
+    stat = None
+    if path is not None:
+        stat = get_stat(path)
+
+    if stat is None:
+        return [str(path), None, None]
+
+    return [str(path), stat.st_mtime_ns, stat.st_size]
+
+
+def get_mimetype(path):
+    """ Retrieve the mimetype of a file from its first bytes
+
+    Only images and text files are recognized, other files are considered as
+    application/octet-stream. The result is cached with file path as key and
+    reused while the file inode, modification time and size are the same.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        File path, symbolic links are followed
+
+    Returns
+    -------
+    str
+        File mimetype, an empty string if the file cannot be read
+
+    Examples
+    --------
+    >>> get_mimetype("gem.png")
+    'image/png'
+    """
+
+    stat = get_stat(path)
+    if stat is None:
+        return str()
+
+    key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    data = _mimetypes.get(str(path))
+    if data is not None and data[0] == key:
+        return data[1]
+
+    if S_ISDIR(stat.st_mode):
+        mimetype = "inode/directory"
+
+    elif stat.st_size == 0:
+        mimetype = "inode/x-empty"
+
+    else:
+        try:
+            with open(path, "rb") as pipe:
+                header = pipe.read(4096)
+
+        except OSError:
+            return str()
+
+        mimetype = "application/octet-stream"
+
+        for signature, value in MIMETYPE_SIGNATURES:
+            if header.startswith(signature):
+                mimetype = value
+                break
+
+        else:
+            if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+                mimetype = "image/webp"
+
+            elif len(header.translate(None, TEXT_CHARACTERS)) == 0:
+                mimetype = "text/plain"
+
+                # Scalable vector graphics are stored as XML documents
+                if b"<svg" in header \
+                   and header.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(
+                       (b"<?xml", b"<svg", b"<!DOCTYPE", b"<!--")):
+                    mimetype = "image/svg+xml"
+
+    _mimetypes[str(path)] = (key, mimetype)
+
+    return mimetype
+
+
+def generate_identifier(path, stat=None):
     """ Generate an identifier from a path
 
     Parameters
     ----------
     path : pathlib.Path or str
         Path to parse into indentifier
+    stat : os.stat_result, optional
+        Path status already retrieved, to avoid a new filesystem access
+        (Default: None)
 
     Returns
     -------
@@ -182,9 +441,12 @@ def generate_identifier(path):
     if isinstance(path, str):
         path = Path(path).expanduser()
 
-    if path.exists():
-        # Retrieve file inode number
-        inode = path.stat().st_ino
+    if stat is None:
+        stat = get_stat(path)
+
+    # Retrieve file inode number
+    if stat is not None:
+        inode = stat.st_ino
 
     # Retrieve file basename
     path = path.name
@@ -200,37 +462,84 @@ def generate_identifier(path):
     return name
 
 
-def generate_extension(extension):
-    """ Generate a regex pattern to check lower and upper case extensions
+def scan_directory(path, extensions, recursive=False, directories=None):
+    """ Retrieve the files which use specific extensions from a directory
 
-    Thanks to https://stackoverflow.com/a/10148272
+    Every directory is read once with os.scandir, whatever the number of
+    extensions, and extensions are matched without case sensitivity. Like
+    the pathlib glob methods, symbolic links to directories are not followed.
 
     Parameters
     ----------
-    extension : str
-        Extension to parse without the first dot
+    path : pathlib.Path or str
+        Directory path
+    extensions : list
+        Extensions without the first dot
+    recursive : bool, optional
+        Scan the subdirectories too (Default: False)
+    directories : dict, optional
+        Filled with the modification time in nanoseconds of every scanned
+        directory, with directory path as key (Default: None)
 
     Returns
     -------
-    str
-        Regex pattern
+    list
+        os.DirEntry objects list sorted by path
 
     Examples
     --------
-    >>> generate_extensions("nes")
-    '[nN][eE][sS]'
+    >>> scan_directory("~/roms", ["nes", "zip"])
+    [<DirEntry 'Double Dragon (Europe).nes'>, <DirEntry 'Gremlins 2.zip'>]
     """
 
-    pattern = str()
+    if isinstance(path, str):
+        path = Path(path).expanduser()
 
-    for character in extension:
-        if not character == '.':
-            pattern += f"[{character.lower()}{character.upper()}]"
+    extensions = set(extension.lower().lstrip('.')
+                     for extension in extensions if extension)
 
-        else:
-            pattern += '.'
+    entries = list()
+    if not extensions:
+        return entries
+
+    queue = [str(path)]
+
+    while queue:
+        directory = queue.pop()
+
+        try:
+            # Retrieve modification time before reading the directory content
+            if directories is not None:
+                directories[directory] = os_stat(directory).st_mtime_ns
+
+            with scandir(directory) as iterator:
+                for entry in iterator:
+
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        queue.append(entry.path)
+                        continue
 
-    return pattern
+                    # Check every suffix to match multiple dots extensions
+                    name = entry.name.lower()
+                    index = name.find('.')
+
+                    while index >= 0:
+                        if name[index + 1:] in extensions:
+                            if entry.is_file():
+                                entries.append(entry)
+
+                            break
+
+                        index = name.find('.', index + 1)
+
+        except OSError:
+            # Ignore unreadable subdirectories like pathlib glob methods
+            if directory == str(path):
+                raise
+
+    entries.sort(key=lambda entry: entry.path.split(sep))
+
+    return entries
 
 
 def copy(src, dst, follow_symlinks=True):
@@ -259,13 +568,16 @@ def copy(src, dst, follow_symlinks=True):
     copy2(src, dst, follow_symlinks=follow_symlinks)
 
 
-def get_creation_datetime(path):
+def get_creation_datetime(path, stat=None):
     """ Retrieve the creation date from a specific filename
 
     Parameters
     ----------
     path : pathlib.Path or str
         Path to retrieve creation datetime
+    stat : os.stat_result, optional
+        Path status already retrieved, to avoid a new filesystem access
+        (Default: None)
 
     Returns
     -------
@@ -278,13 +590,13 @@ def get_creation_datetime(path):
     datetime.datetime(2019, 9, 22, 14, 1, 37, 56527)
     """
 
-    if isinstance(path, str):
-        path = Path(path).expanduser()
+    if stat is None:
+        stat = get_stat(path)
 
-    if not path.exists():
+    if stat is None:
         return None
 
-    return datetime.fromtimestamp(getctime(path))
+    return datetime.fromtimestamp(stat.st_ctime)
 
 
 def get_boot_datetime_as_timestamp(proc_path="/proc"):
@@ -17,12 +17,14 @@
 #  MA 02110-1301, USA.
 # ------------------------------------------------------------------------------
 
+# Concurrent
+from concurrent.futures import ThreadPoolExecutor
+
 # Datetime
 from datetime import date, datetime, timedelta
 
 # Filesystem
 from os import R_OK, W_OK, X_OK, access, remove
-from os.path import getctime
 from pathlib import Path
 from copy import deepcopy
 from shutil import rmtree
@@ -30,11 +32,13 @@ from shutil import rmtree
 # GEM
 from geode_gem.engine.utils import (copy,
                                     get_data,
-                                    get_binary_path,
                                     parse_timedelta,
-                                    generate_identifier)
+                                    generate_identifier,
+                                    resolve_binary_path)
 from geode_gem.engine.api import GEM
 from geode_gem.engine.console import Console
+from geode_gem.engine.lib.atlas import Atlas
+from geode_gem.engine.lib.cache import Cache, MemoryCache
 from geode_gem.engine.lib.configuration import Configuration
 
 from geode_gem.ui.data import Icons, Columns, Folders, Metadata
@@ -61,6 +65,7 @@ from geode_gem.ui.preferences.interface import (ConsolePreferences,
                                                 EmulatorPreferences,
                                                 PreferencesWindow)
 from geode_gem.ui.widgets.game import GameThread
+from geode_gem.ui.widgets.monitor import ConsoleMonitor
 from geode_gem.ui.widgets.script import ScriptThread
 from geode_gem.ui.widgets.widgets import ListBoxItem, IconsGenerator
 
@@ -89,8 +94,8 @@ from sys import version_info
 from shlex import split as shlex_split
 
 # Thread
+from threading import Thread
 from threading import enumerate as thread_enumerate
-from threading import main_thread as thread_main_thread
 
 # Translation
 from gettext import gettext as _
@@ -151,6 +156,12 @@ class MainWindow(Gtk.ApplicationWindow):
         # Cache folder
         self.__cache = cache
 
+        # Cache files manifest
+        self.__icons_cache = Cache(cache, self.logger)
+
+        # Store loaded icons with category, size and identifier as key
+        self.__pixbufs = MemoryCache()
+
         # Check development version
         self.__version = self.check_version()
 
@@ -165,6 +176,11 @@ class MainWindow(Gtk.ApplicationWindow):
         # Store thread id for game listing
         self.list_thread = int()
 
+        # Store games filenames which use a tag matching the filter
+        self.__filter_tags = None
+        # Store games found by the search index for the filter
+        self.__filter_games = None
+
         # Store started notes with note file path as key
         self.notes = dict()
         # Store script threads with basename game file without extension as key
@@ -177,6 +193,23 @@ class MainWindow(Gtk.ApplicationWindow):
         self.shortcuts_data = dict()
         # Store consoles iters
         self.consoles_iter = dict()
+        # Store consoles directories monitors with console identifier as key
+        self.__monitors = dict()
+        # Consoles games directories scanning thread
+        self.__scan_thread = None
+        # Store consoles identifier which games directory is scanned
+        self.__scanning = set()
+        # Store consoles which need another scan when the current one is
+        # terminated with console identifier as key
+        self.__rescan = dict()
+
+        # Decode games covers without blocking the interface
+        self.__thumbnails_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="thumbnail")
+        # Store pending covers decoding futures
+        self.__thumbnails = set()
+        # Store games thumbnails atlases with console identifier and size
+        self.__atlases = dict()
 
         # Store user keys input
         self.keys = list()
@@ -3372,11 +3405,63 @@ class MainWindow(Gtk.ApplicationWindow):
             self.logger.debug(f"Remove thread ID {self.list_thread}")
             GLib.source_remove(self.list_thread)
 
+        # Stop consoles directories monitors
+        for monitor in self.__monitors.values():
+            monitor.stop()
+
+        self.__monitors.clear()
+
+        # Remove pending covers decoding and wait for atlases writing
+        self.__on_cancel_thumbnails()
+
+        self.__thumbnails_pool.shutdown(wait=True)
+
+        # ------------------------------------
+        #   Icons cache
+        # ------------------------------------
+
+        self.__icons_cache.collect("consoles", self.api.consoles.keys())
+        self.__icons_cache.collect("emulators", self.api.emulators.keys())
+
+        # Games are only known when every games directories were scanned
+        consoles = self.api.get_consoles()
+
+        scanned = self.__scan_thread is not None \
+            and not self.__scan_thread.is_alive() \
+            and all(console.path is None or console.path.exists()
+                    for console in consoles)
+
+        if scanned:
+            self.__icons_cache.collect(
+                "games",
+                set(game.id
+                    for console in consoles for game in console.get_games()))
+
+        # ------------------------------------
+        #   Thumbnails atlases
+        # ------------------------------------
+
+        for (identifier, size), atlas in self.__atlases.items():
+            console = self.api.get_console(identifier)
+
+            if scanned and console is not None:
+                atlas.collect(game.id for game in console.get_games())
+
+            self.__on_save_atlas(atlas, identifier, size, close=True)
+
+        self.__atlases.clear()
+
+        # Remove atlases of removed consoles
+        self.__icons_cache.collect(
+            "atlas", self.api.consoles.keys(), extension="atlas")
+
+        self.__icons_cache.save()
+
         # Remove game and script threads
         for thread in thread_enumerate().copy():
 
-            # Avoid to remove the main thread
-            if thread is not thread_main_thread():
+            # Avoid to remove the main thread and the consoles scanning thread
+            if isinstance(thread, (GameThread, ScriptThread)):
                 self.logger.debug(f"Remove thread {thread.name}")
                 thread.proc.terminate()
                 thread.join()
@@ -3530,6 +3615,17 @@ class MainWindow(Gtk.ApplicationWindow):
         self.hide_empty_console = self.config.getboolean(
             "gem", "hide_empty_console", fallback=False)
 
+        # Icons cache size in megabytes, without limit when null
+        self.__icons_cache.set_budget(self.config.getint(
+            "gem", "icons_cache_budget", fallback=256) * 1024 * 1024)
+
+        self.use_thumbnails_atlas = self.config.getboolean(
+            "gem", "use_thumbnails_atlas", fallback=False)
+
+        # Loaded icons size in megabytes, without limit when null
+        self.__pixbufs.set_budget(self.config.getint(
+            "gem", "pixbufs_cache_budget", fallback=128) * 1024 * 1024)
+
         self.use_dark_theme = self.config.getboolean(
             "gem", "dark_theme", fallback=False)
 
@@ -3709,7 +3805,8 @@ class MainWindow(Gtk.ApplicationWindow):
         if selected_row is not None:
             self.scroll_sidebar.set_visible(self.show_sidebar)
 
-            self.__on_selected_console(None, selected_row, True)
+            self.__on_selected_console(
+                None, selected_row, force=True, scan=False)
 
         # Manage default widgets visibility when no console selected
         else:
@@ -3771,6 +3868,8 @@ class MainWindow(Gtk.ApplicationWindow):
             self.button_toolbar_filters.get_style_context().remove_class(
                 "suggested-action")
 
+        self.__update_filter_games(self.selection.get("console"))
+
         self.filter_games_list.refilter()
         self.filter_games_grid.refilter()
 
@@ -3796,6 +3895,64 @@ class MainWindow(Gtk.ApplicationWindow):
         self.button_toolbar_filters.get_style_context().remove_class(
             "suggested-action")
 
+    def __update_filter_games(self, console):
+        """ Retrieve the games which match the filter content
+
+        Games filenames, tags and notes are searched once with the search
+        index, games names are still checked on each row by filters_match
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console or None
+            Console which games are displayed
+        """
+
+        text = self.entry_toolbar_filters.get_text()
+
+        self.__filter_tags = self.__get_filter_tags(text)
+
+        self.__filter_games = None
+
+        if len(text) > 0 and console is not None:
+            self.__filter_games = set(
+                self.api.search(text, limit=None, console=console))
+
+    def __get_filter_tags(self, text):
+        """ Retrieve the games which use a tag matching the filter
+
+        Tags are checked once from the game_tags table instead of checking
+        every game tags for each row
+
+        Parameters
+        ----------
+        text : str
+            Filter content
+
+        Returns
+        -------
+        set or None
+            Games filenames, None if the filter is empty
+        """
+
+        if len(text) == 0:
+            return None
+
+        games = set()
+
+        for tag in self.api.get_game_tags():
+            try:
+                # Regex match tag
+                found = match("%s$" % text, tag) is not None
+
+            except Exception:
+                found = False
+
+            # Lowercase filter match lowercase tag
+            if found or text.lower() in tag.lower():
+                games.update(self.api.get_games_by_tag(tag))
+
+        return games
+
     def filters_match(self, model, row, *args):
         """ Update treeview rows
 
@@ -3841,18 +3998,15 @@ class MainWindow(Gtk.ApplicationWindow):
                 if text.lower() in game.name.lower():
                     found = True
 
-            # Check game tags second
-            if len(game.tags) > 0:
-
-                for tag in game.tags:
-
-                    # Regex match one of game tag
-                    if match("%s$" % text, tag) is not None:
-                        found = True
+            # Check game from search index second
+            if self.__filter_games is not None \
+               and game in self.__filter_games:
+                found = True
 
-                    # Lowercase filter match lowercase game.name
-                    if text.lower() in tag.lower():
-                        found = True
+            # Check game tags third
+            if self.__filter_tags is not None \
+               and game.path.name in self.__filter_tags:
+                found = True
 
             # ------------------------------------
             #   Set status
@@ -4640,9 +4794,18 @@ class MainWindow(Gtk.ApplicationWindow):
 
             if dialog.run() == Gtk.ResponseType.YES:
 
+                # Release thumbnails atlases before removing their files
+                for atlas in self.__atlases.values():
+                    atlas.close()
+
+                self.__atlases.clear()
+
                 # Remove cache directory
                 rmtree(str(Folders.CACHE))
 
+                self.__icons_cache.clear()
+                self.__pixbufs.clear()
+
                 # Generate directories
                 Folders.CACHE.mkdir(mode=0o755, parents=True)
 
@@ -4705,7 +4868,7 @@ class MainWindow(Gtk.ApplicationWindow):
                     "response",
                     self.__on_show_notes_response,
                     dialog,
-                    game.name,
+                    game,
                     path)
 
                 dialog.show_all()
@@ -4717,7 +4880,7 @@ class MainWindow(Gtk.ApplicationWindow):
             elif str(path) in self.notes.keys():
                 self.notes[str(path)].grab_focus()
 
-    def __on_show_notes_response(self, widget, response, dialog, title, path):
+    def __on_show_notes_response(self, widget, response, dialog, game, path):
         """ Close notes dialog
 
         This function close current notes dialog and save his textview buffer
@@ -4731,8 +4894,8 @@ class MainWindow(Gtk.ApplicationWindow):
             Dialog object user response
         dialog : gem.windows.EditorDialog
             Dialog editor object
-        title : str
-            Dialog title, it's game name by default
+        game : gem.engine.game.Game
+            Game object
         path : pathlib.Path
             Notes path
         """
@@ -4747,12 +4910,15 @@ class MainWindow(Gtk.ApplicationWindow):
                 with path.open('w') as pipe:
                     pipe.write(text_buffer)
 
-                self.logger.info("Update note for %s" % title)
+                self.logger.info("Update note for %s" % game.name)
 
             elif path.exists():
                 path.unlink()
 
-                self.logger.debug("Remove note for %s" % title)
+                self.logger.debug("Remove note for %s" % game.name)
+
+            # Keep search index up-to-date with notes content
+            self.api.update_search_game(game)
 
         self.config.modify("windows", "notes", "%dx%d" % dialog.get_size())
         self.config.update()
@@ -4801,6 +4967,9 @@ class MainWindow(Gtk.ApplicationWindow):
                     # Remove previous console storage
                     del self.consoles_iter[previous_id]
 
+                    if previous_id in self.__monitors:
+                        self.__monitors.pop(previous_id).stop()
+
                     # Store row with the new identifier
                     self.consoles_iter[data["id"]] = self.__current_menu_row
 
@@ -4809,14 +4978,11 @@ class MainWindow(Gtk.ApplicationWindow):
                 # Write console data
                 self.api.write_data(GEM.Consoles)
 
-                # Load games list if the game directory exists
-                if console.path.exists():
+                # Load games list without blocking the interface, the views
+                # are updated when the scan is terminated
+                self.__on_scan_console(console)
 
-                    try:
-                        console.init_games()
-
-                    except OSError as error:
-                        self.logger.warning(error)
+                self.__on_monitor_console(console)
 
                 # Remove thumbnails from cache
                 for size in ("22x22", "24x24", "48x48", "64x64", "96x96"):
@@ -4870,13 +5036,7 @@ class MainWindow(Gtk.ApplicationWindow):
                     self.__current_menu_row.image_status.set_from_icon_name(
                         icon, Gtk.IconSize.MENU)
 
-                    text = _("No game")
-                    if len(console.get_games()) == 1:
-                        text = _("1 game")
-                    elif len(console.get_games()) > 1:
-                        text = _("%d games") % len(console.get_games())
-
-                    self.__current_menu_row.set_tooltip_text(text)
+                    self.__on_update_console_row(self.__current_menu_row)
 
                     # Console flag selectors
                     self.item_consoles_favorite.set_active(console.favorite)
@@ -5079,6 +5239,9 @@ class MainWindow(Gtk.ApplicationWindow):
                 # Remove console
                 self.api.delete_console(console.id)
 
+                if console.id in self.__monitors:
+                    self.__monitors.pop(console.id).stop()
+
                 # Write consoles data
                 self.api.write_data(GEM.Consoles)
 
@@ -5115,6 +5278,12 @@ class MainWindow(Gtk.ApplicationWindow):
         # Reset consoles caches
         self.consoles_iter.clear()
 
+        # Stop previous consoles directories monitors
+        for monitor in self.__monitors.values():
+            monitor.stop()
+
+        self.__monitors.clear()
+
         # Remove previous consoles objects
         for child in self.listbox_consoles.get_children():
             self.listbox_consoles.remove(child)
@@ -5133,8 +5302,25 @@ class MainWindow(Gtk.ApplicationWindow):
                 # Store console iter
                 self.consoles_iter[row.console.id] = row
 
+                self.__on_monitor_console(row.console)
+
         self.__on_update_consoles()
 
+        # Scan consoles games directories without blocking the interface
+        consoles = list(row.console for row in self.consoles_iter.values()
+                        if row.console.path is not None
+                        and row.console.path.exists())
+
+        self.__scanning.update(console.id for console in consoles)
+
+        self.__scan_thread = Thread(
+            target=self.api.scan_consoles,
+            kwargs={
+                "consoles": consoles,
+                "callback": self.__on_console_scanned},
+            daemon=True)
+        self.__scan_thread.start()
+
         if len(self.listbox_consoles) > 0:
             self.scroll_sidebar.set_visible(self.show_sidebar)
 
@@ -5163,14 +5349,10 @@ class MainWindow(Gtk.ApplicationWindow):
         if not isinstance(console, Console):
             console = self.api.get_console(console)
 
-        # Load games list if the game directory exists
+        # Load games list from the last snapshot, games directories are
+        # scanned later by the GEM.scan_consoles thread
         if console.path.exists():
-
-            try:
-                console.init_games()
-
-            except OSError as error:
-                self.logger.warning(error)
+            self.api.load_snapshot(console)
 
         else:
             self.logger.warning(
@@ -5220,14 +5402,6 @@ class MainWindow(Gtk.ApplicationWindow):
             image_console_status = Gtk.Image.new_from_pixbuf(
                 self.icons.blank(22))
 
-        text = _("No game")
-        if len(console.get_games()) == 1:
-            text = _("1 game")
-        elif len(console.get_games()) > 1:
-            text = _("%d games") % len(console.get_games())
-
-        row_console.set_tooltip_text(text)
-
         grid_console.pack_start(image_console, False, False, 0)
         grid_console.pack_start(label_console, True, True, 0)
         grid_console.pack_start(image_console_status, False, False, 0)
@@ -5239,11 +5413,247 @@ class MainWindow(Gtk.ApplicationWindow):
         setattr(row_console, "image_icon", image_console)
         setattr(row_console, "image_status", image_console_status)
 
+        self.__on_update_console_row(row_console)
+
         self.listbox_consoles.add(row_console)
 
         return row_console
 
-    def __on_selected_console(self, widget, row, force=False):
+    def __on_update_console_row(self, row):
+        """ Update console row tooltip with the games counter
+
+        Parameters
+        ----------
+        row : Gtk.ListBoxRow
+            Console row
+        """
+
+        games = len(row.console.get_games())
+
+        text = _("No game")
+        if games == 1:
+            text = _("1 game")
+        elif games > 1:
+            text = _("%d games") % games
+
+        row.set_tooltip_text(text)
+
+    def __on_scan_console(self, console, force=False):
+        """ Scan the games directory of a specific console in a thread
+
+        The games views are updated from the main loop when the scan is
+        terminated. When the console is already scanned, another scan is
+        started after the current one
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console instance
+        force : bool, optional
+            Read console directories even if they were not modified
+            (Default: False)
+
+        Returns
+        -------
+        bool
+            True if a new scan was started, False otherwise
+        """
+
+        if console.id in self.__scanning:
+            self.__rescan[console.id] = console
+            return False
+
+        if console.path is None or not console.path.exists():
+            return False
+
+        self.__scanning.add(console.id)
+
+        thread = Thread(target=self.__on_scan_console_thread,
+                        args=(console, force),
+                        daemon=True)
+        thread.start()
+
+        return True
+
+    def __on_scan_console_thread(self, console, force):
+        """ Scan the games directory of a specific console
+
+        This function is called from a thread
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console instance
+        force : bool
+            Read console directories even if they were not modified
+        """
+
+        try:
+            status = console.init_games(force=force)
+
+        except OSError as error:
+            self.logger.warning(error)
+            status = False
+
+        # The console must leave the scanning consoles in any case
+        except Exception as error:
+            self.logger.exception(
+                "Cannot scan %s games: %s" % (console.id, str(error)))
+            status = False
+
+        self.__on_console_scanned(console, status)
+
+    def __on_console_scanned(self, console, status):
+        """ Receive a console scan result
+
+        This function is called from a thread, the interface is only updated
+        from the main loop
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Scanned console
+        status : bool
+            Games list modification status
+        """
+
+        # Loaded icons sources are checked here instead of each time an icon
+        # is used
+        self.__pixbufs.validate()
+
+        GLib.idle_add(self.__on_reload_console_row, console, status)
+
+    def __on_monitor_console(self, console):
+        """ Watch the games directory of a specific console
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console instance
+        """
+
+        if console.id in self.__monitors:
+            self.__monitors.pop(console.id).stop()
+
+        monitor = ConsoleMonitor(console, self.logger)
+
+        if monitor.start():
+            monitor.connect("console-modified", self.__on_console_modified)
+
+            self.__monitors[console.id] = monitor
+
+    def __on_console_modified(self, monitor, console):
+        """ Scan a console games directory when its content was modified
+
+        Parameters
+        ----------
+        monitor : gem.ui.widgets.monitor.ConsoleMonitor
+            Object which receive signal
+        console : gem.engine.console.Console
+            Modified console
+        """
+
+        self.__on_scan_console(console)
+
+    def __on_update_console_games(self, row):
+        """ Apply games list modifications to console and games views
+
+        Parameters
+        ----------
+        row : gem.gtk.widgets.ListBoxSelectorItem
+            Modified console row
+        """
+
+        console = row.console
+
+        self.logger.debug("Update %s games list" % console.name)
+
+        self.__on_update_console_row(row)
+        self.__on_update_consoles()
+
+        if not self.selection["console"] == console:
+            return
+
+        # Reload the whole view when games are still appended or when the
+        # games placeholder visibility need to be changed
+        if not self.list_thread == 0 \
+           or len(self.game_path) == 0 or len(console.get_games()) == 0:
+            self.__on_selected_console(None, row, force=True, scan=False)
+            return
+
+        self.__block_signals()
+
+        # New games need to be checked with the current filter
+        self.__update_filter_games(console)
+
+        unselect = False
+
+        # Remove games which are not available anymore
+        for identifier, data in list(self.game_path.items()):
+            game, row_list, row_grid = data
+
+            if console.get_game(identifier) is not game:
+                self.model_games_list.remove(row_list)
+                self.model_games_grid.remove(row_grid)
+
+                del self.game_path[identifier]
+
+                if self.selection["game"] == game:
+                    unselect = True
+
+        # Append new games
+        for game in console.get_games():
+            if game.id not in self.game_path:
+                self.__on_append_game(console, game, check_path=False)
+
+        if unselect:
+            self.unselect_all()
+
+            self.sensitive_interface()
+
+            self.set_informations()
+
+        self.set_informations_headerbar()
+
+        self.__unblock_signals()
+
+    def __on_reload_console_row(self, console, status):
+        """ Update a console row when its games directory scan is terminated
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Scanned console
+        status : bool
+            Games list modification status
+
+        Returns
+        -------
+        bool
+            Always False to remove this function from the main loop
+        """
+
+        self.__scanning.discard(console.id)
+
+        # Games directory was modified during the scan, the console could
+        # have been replaced by the console editor meanwhile
+        if console.id in self.__rescan:
+            self.__on_scan_console(self.__rescan.pop(console.id))
+
+        if not status:
+            return False
+
+        row = self.consoles_iter.get(console.id)
+
+        # Consoles list was regenerated meanwhile
+        if row is None or row.console is not console:
+            return False
+
+        self.__on_update_console_games(row)
+
+        return False
+
+    def __on_selected_console(self, widget, row, force=False, scan=True):
         """ Select a console
 
         This function occurs when the user select a console in the consoles
@@ -5257,6 +5667,9 @@ class MainWindow(Gtk.ApplicationWindow):
             Activated row
         force : bool
             Force console selection even if this is the same console
+        scan : bool
+            Scan the console games directory, which also read directories
+            which were not modified when force is True (Default: True)
         """
 
         # Avoid to reload the same console
@@ -5306,6 +5719,10 @@ class MainWindow(Gtk.ApplicationWindow):
             loader = self.append_games(row.console)
             self.list_thread = GLib.idle_add(loader.__next__)
 
+            # Games views are updated when the scan is terminated
+            if scan:
+                self.__on_scan_console(row.console, force=force)
+
     def __on_retrieve_selected_console(self):
         """ Retrieve console object instance from current selection
 
@@ -5402,6 +5819,8 @@ class MainWindow(Gtk.ApplicationWindow):
 
                 self.api.write_object(self.__current_menu_row.console)
 
+                self.__on_monitor_console(self.__current_menu_row.console)
+
             elif widget == self.item_consoles_favorite:
                 self.__current_menu_row.console.favorite = \
                     not self.__current_menu_row.console.favorite
@@ -5525,7 +5944,8 @@ class MainWindow(Gtk.ApplicationWindow):
         """ Append to games treeview all games from console
 
         This function add every games which match console extensions to games
-        treeview
+        treeview. The console games directory is not scanned here, to avoid
+        to block the interface
 
         Parameters
         ----------
@@ -5549,6 +5969,32 @@ class MainWindow(Gtk.ApplicationWindow):
         # Get current thread id
         current_thread_id = self.list_thread
 
+        # Covers of the previous games list are not needed anymore
+        self.__on_cancel_thumbnails()
+
+        # Write thumbnails generated for the previous games list without
+        # blocking the interface
+        for (identifier, size), atlas in self.__atlases.items():
+            self.__thumbnails_pool.submit(
+                self.__on_save_atlas, atlas, identifier, size,
+                close=not self.use_thumbnails_atlas)
+
+        if not self.use_thumbnails_atlas:
+            self.__atlases.clear()
+
+        else:
+            for size in (96, 22):
+                # Mark the console atlas as the most recently used file
+                self.__icons_cache.get(
+                    "atlas", size, console.id, None, extension="atlas")
+
+                if (console.id, size) not in self.__atlases:
+                    self.__atlases[(console.id, size)] = Atlas(
+                        self.__cache.joinpath(
+                            "atlas", "%dx%d" % (size, size),
+                            "%s.atlas" % console.id),
+                        self.logger)
+
         self.game_path = dict()
 
         # ------------------------------------
@@ -5608,17 +6054,15 @@ class MainWindow(Gtk.ApplicationWindow):
 
         self.selection["console"] = console
 
-        # Load games list if the game directory exists
-        if console.path.exists():
-
-            try:
-                console.init_games()
-
-            except OSError as error:
-                self.logger.warning(error)
+        # Games files status are only checked when the list cannot be
+        # updated by a scan
+        check_path = console.path is None or not console.path.exists()
 
         games = console.get_games()
 
+        # Games objects can be replaced when the games list is updated
+        self.__update_filter_games(console)
+
         column, order = self.sorted_games_list.get_sort_column_id()
 
         # Retrieve reverse value from column order
@@ -5700,7 +6144,7 @@ class MainWindow(Gtk.ApplicationWindow):
             if not current_thread_id == self.list_thread:
                 yield False
 
-            if self.__on_append_game(console, game):
+            if self.__on_append_game(console, game, check_path=check_path):
                 self.set_informations_headerbar()
 
                 self.progress_statusbar.set_text("%d/%d" % (index, len(games)))
@@ -5744,7 +6188,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
         yield False
 
-    def __on_append_game(self, console, game):
+    def __on_append_game(self, console, game, check_path=True):
         """ Append a new game to current views
 
         Parameters
@@ -5753,6 +6197,9 @@ class MainWindow(Gtk.ApplicationWindow):
             Console instance
         game : gem.engine.game.Game
             Game instance
+        check_path : bool, optional
+            Check if the game file still exists, which is useless when the
+            console games list has just been scanned (Default: True)
         """
 
         # Hide games which match ignores regex
@@ -5767,7 +6214,16 @@ class MainWindow(Gtk.ApplicationWindow):
                 pass
 
         # Check if rom file exists
-        if game.path.exists() and show:
+        if show and (not check_path or game.path.exists()):
+
+            # Covers already loaded are used without waiting for the pool
+            grid_icon, list_icon = None, None
+
+            if game.cover is not None:
+                grid_icon = self.__pixbufs.get(
+                    ("games", 96, game.id), game.cover)
+                list_icon = self.__pixbufs.get(
+                    ("games", 22, game.id), game.cover)
 
             # ------------------------------------
             #   Grid mode
@@ -5779,12 +6235,8 @@ class MainWindow(Gtk.ApplicationWindow):
                 game
             ]
 
-            # Large icon
-            icon = self.get_pixbuf_from_cache(
-                "games", 96, game.id, game.cover)
-
-            if icon is not None:
-                row_data[Columns.Grid.THUMBNAIL] = icon
+            if grid_icon is not None:
+                row_data[Columns.Grid.THUMBNAIL] = grid_icon
 
             row_grid = self.model_games_grid.append(row_data)
 
@@ -5810,6 +6262,9 @@ class MainWindow(Gtk.ApplicationWindow):
                 self.__console_thumbnail
             ]
 
+            if list_icon is not None:
+                row_data[Columns.List.THUMBNAIL] = list_icon
+
             # Favorite
             if game.favorite:
                 row_data[Columns.List.FAVORITE] = \
@@ -5864,13 +6319,6 @@ class MainWindow(Gtk.ApplicationWindow):
                 row_data[Columns.List.SAVESTATE] = \
                     self.icons.get("savestate")
 
-            # Thumbnail icon
-            icon = self.get_pixbuf_from_cache(
-                "games", 22, game.id, game.cover)
-
-            if icon is not None:
-                row_data[Columns.List.THUMBNAIL] = icon
-
             row_list = self.model_games_list.append(row_data)
 
             # ------------------------------------
@@ -5880,10 +6328,183 @@ class MainWindow(Gtk.ApplicationWindow):
             # Store both Gtk.TreeIter under game filename key
             self.game_path[game.id] = [game, row_list, row_grid]
 
+            # Console icons are used until the game cover is decoded
+            if game.cover is not None \
+               and (grid_icon is None or list_icon is None):
+                future = self.__thumbnails_pool.submit(
+                    self.__on_generate_thumbnails, console, game)
+                future.add_done_callback(self.__thumbnails.discard)
+
+                self.__thumbnails.add(future)
+
             return True
 
         return False
 
+    def __on_generate_thumbnails(self, console, game):
+        """ Generate game cover thumbnails for both games views
+
+        This function is called from a thread of the covers decoding pool, the
+        views are only updated from the main loop
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console instance
+        game : gem.engine.game.Game
+            Game instance
+        """
+
+        try:
+            # Large icon
+            grid_icon = self.__get_game_thumbnail(console, game, 96)
+
+            # Thumbnail icon
+            list_icon = self.__get_game_thumbnail(console, game, 22)
+
+        except GLib.Error as error:
+            self.logger.warning(
+                "Cannot load %s cover: %s" % (game.name, error.message))
+            return
+
+        if grid_icon is not None or list_icon is not None:
+            GLib.idle_add(
+                self.__on_update_thumbnails, game, grid_icon, list_icon)
+
+    def __get_game_thumbnail(self, console, game, size):
+        """ Retrieve a game cover thumbnail
+
+        When thumbnails atlases are used, the thumbnail pixels are read from
+        the console atlas instead of a cache file
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console instance
+        game : gem.engine.game.Game
+            Game instance
+        size : int
+            Thumbnail size in pixels
+
+        Returns
+        -------
+        GdkPixbuf.Pixbuf or None
+            Game thumbnail
+        """
+
+        atlas = self.__atlases.get((console.id, size))
+
+        if atlas is None:
+            return self.get_pixbuf_from_cache(
+                "games", size, game.id, game.cover)
+
+        icon = self.__pixbufs.get(("games", size, game.id), game.cover)
+        if icon is not None:
+            return icon
+
+        tile = atlas.get(game.id, game.cover)
+
+        if tile is not None:
+            data, width, height, rowstride, alpha = tile
+
+            icon = GdkPixbuf.Pixbuf.new_from_bytes(
+                GLib.Bytes.new(data),
+                GdkPixbuf.Colorspace.RGB,
+                alpha,
+                8,
+                width,
+                height,
+                rowstride)
+
+        else:
+            icon = self.get_pixbuf_from_cache(
+                "games", size, game.id, game.cover, use_cache=False)
+
+            if icon is not None:
+                atlas.set(game.id,
+                          game.cover,
+                          icon.read_pixel_bytes().get_data(),
+                          icon.get_width(),
+                          icon.get_height(),
+                          icon.get_rowstride(),
+                          icon.get_has_alpha())
+
+        if icon is not None:
+            self.__pixbufs.set(("games", size, game.id),
+                               icon,
+                               icon.get_byte_length(),
+                               game.cover)
+
+        return icon
+
+    def __on_update_thumbnails(self, game, grid_icon, list_icon):
+        """ Set the game cover thumbnails in both games views
+
+        Parameters
+        ----------
+        game : gem.engine.game.Game
+            Game instance
+        grid_icon : GdkPixbuf.Pixbuf or None
+            Grid view thumbnail
+        list_icon : GdkPixbuf.Pixbuf or None
+            List view thumbnail
+
+        Returns
+        -------
+        bool
+            Always False to remove this function from the main loop
+        """
+
+        data = self.game_path.get(game.id)
+
+        # Game was removed from views meanwhile
+        if data is None or data[0] is not game:
+            return False
+
+        if grid_icon is not None:
+            self.model_games_grid.set_value(
+                data[2], Columns.Grid.THUMBNAIL, grid_icon)
+
+        if list_icon is not None:
+            self.model_games_list.set_value(
+                data[1], Columns.List.THUMBNAIL, list_icon)
+
+        return False
+
+    def __on_cancel_thumbnails(self):
+        """ Cancel the pending game covers decoding
+        """
+
+        for future in list(self.__thumbnails):
+            future.cancel()
+
+        self.__thumbnails.clear()
+
+    def __on_save_atlas(self, atlas, identifier, size, close=False):
+        """ Write a thumbnails atlas and store its size in the icons cache
+
+        Atlases files are counted in the icons cache budget, so the least
+        recently used atlases can be removed like the other cache files
+
+        Parameters
+        ----------
+        atlas : gem.engine.lib.atlas.Atlas
+            Thumbnails atlas
+        identifier : str
+            Console identifier
+        size : int
+            Thumbnails size in pixels
+        close : bool, optional
+            Release the atlas file when it was written (Default: False)
+        """
+
+        if atlas.save():
+            self.__icons_cache.register(
+                "atlas", size, identifier, None, extension="atlas")
+
+        if close:
+            atlas.close()
+
     def __on_update_game_columns(self, column, cell, model, treeiter, *args):
         """ Manage specific columns behavior during games adding
 
@@ -6966,15 +7587,8 @@ class MainWindow(Gtk.ApplicationWindow):
 
                         # Update console tooltip
                         if console.id in self.consoles_iter:
-                            row = self.consoles_iter[console.id]
-
-                            text = _("No game")
-                            if len(console.get_games()) == 1:
-                                text = _("1 game")
-                            elif len(console.get_games()) > 1:
-                                text = _("%d games") % len(console.get_games())
-
-                            row.set_tooltip_text(text)
+                            self.__on_update_console_row(
+                                self.consoles_iter[console.id])
 
                     except Exception:
                         self.logger.exception("An error occur during removing")
@@ -8247,7 +8861,7 @@ class MainWindow(Gtk.ApplicationWindow):
                 if not options["copy"]:
                     path.unlink()
 
-                game = console.get_game(generate_identifier(new_path))
+                game = console.get_game_from_path(new_path)
 
                 # Add a new game to console storage if not exists
                 if game is None:
@@ -8255,20 +8869,12 @@ class MainWindow(Gtk.ApplicationWindow):
 
                 # Update installed time
                 else:
-                    game.installed = datetime.fromtimestamp(
-                        getctime(new_path)).date()
+                    game.update_installation_date()
 
                 # Update console tooltip
                 if console.id in self.consoles_iter:
-                    row = self.consoles_iter[console.id]
-
-                    text = _("No game")
-                    if len(console.get_games()) == 1:
-                        text = _("1 game")
-                    elif len(console.get_games()) > 1:
-                        text = _("%d games") % len(console.get_games())
-
-                    row.set_tooltip_text(text)
+                    self.__on_update_console_row(
+                        self.consoles_iter[console.id])
 
                 # This file is owned by current selected console
                 if self.selection["console"] is not None \
@@ -8406,9 +9012,11 @@ class MainWindow(Gtk.ApplicationWindow):
         user want to do that, so ...
         """
 
-        if len(get_binary_path("mednafen")) > 0:
+        binary = resolve_binary_path("mednafen")
+
+        if binary is not None:
             proc = Popen(
-                ["mednafen"],
+                [binary],
                 stdin=PIPE,
                 stdout=PIPE,
                 stderr=STDOUT,
@@ -8441,7 +9049,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
         if self.api.debug:
 
-            if len(get_binary_path("git")) > 0:
+            if resolve_binary_path("git") is not None:
                 path = Path(".git")
 
                 if path.exists():
@@ -8520,9 +9128,29 @@ class MainWindow(Gtk.ApplicationWindow):
         cache_path = self.get_icon_from_cache(
             key, "%dx%d" % (size, size), identifier + ".png")
 
-        # Retrieve icon from cache folder
-        if use_cache and cache_path.exists() and cache_path.is_file():
-            return GdkPixbuf.Pixbuf.new_from_file(str(cache_path))
+        # Consoles icons can be retrieved from the icons collection
+        source = path
+        if key == "consoles" and path is not None and not path.exists():
+            source = self.api.get_local("icons", "%s.png" % path)
+
+        # Retrieve icon from memory when it was already loaded
+        if use_cache:
+            icon = self.__pixbufs.get((key, size, identifier), source)
+
+            if icon is not None:
+                return icon
+
+        # Retrieve icon from cache folder when its source was not modified
+        if use_cache and self.__icons_cache.get(
+           key, size, identifier, source) is not None:
+            icon = GdkPixbuf.Pixbuf.new_from_file(str(cache_path))
+
+            self.__pixbufs.set((key, size, identifier),
+                               icon,
+                               icon.get_byte_length(),
+                               source)
+
+            return icon
 
         # Generate a new cache icon
         elif path is not None:
@@ -8575,10 +9203,17 @@ class MainWindow(Gtk.ApplicationWindow):
 
                     icon.savev(str(cache_path), "png", list(), list())
 
+                    self.__icons_cache.register(key, size, identifier, source)
+
                 except GLib.Error:
                     self.logger.exception(
                         "An error occur during cache generation")
 
+                self.__pixbufs.set((key, size, identifier),
+                                   icon,
+                                   icon.get_byte_length(),
+                                   source)
+
             return icon
 
         return None
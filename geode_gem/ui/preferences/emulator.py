@@ -21,7 +21,9 @@
 from pathlib import Path
 
 # GEM
-from geode_gem.engine.utils import get_binary_path, generate_identifier
+from geode_gem.engine.utils import (get_binary_path,
+                                    generate_identifier,
+                                    resolve_binary_path)
 
 from geode_gem.ui.data import Icons
 from geode_gem.ui.utils import on_entry_clear, magic_from_file
@@ -652,7 +654,7 @@ class EmulatorPreferences(CommonWindow):
             self.error = True
 
         # Binary not exists in available $PATH variable
-        elif len(get_binary_path(binary_path)) == 0:
+        elif resolve_binary_path(binary_path) is None:
             self.error = True
 
             icon = Icons.ERROR
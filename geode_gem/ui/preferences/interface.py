@@ -355,6 +355,9 @@ class PreferencesWindow(CommonWindow):
         self.widget_behavior_hide_consoles = ListBoxItem()
         self.switch_general_behavior_hide_consoles = Gtk.Switch()
 
+        self.widget_behavior_thumbnails_atlas = ListBoxItem()
+        self.switch_general_behavior_thumbnails_atlas = Gtk.Switch()
+
         # Properties
         self.label_general_behavior.set_hexpand(True)
         self.label_general_behavior.set_use_markup(True)
@@ -389,6 +392,13 @@ class PreferencesWindow(CommonWindow):
         self.widget_behavior_hide_consoles.set_description_label(
             _("Hide consoles without games"))
 
+        self.widget_behavior_thumbnails_atlas.set_widget(
+            self.switch_general_behavior_thumbnails_atlas)
+        self.widget_behavior_thumbnails_atlas.set_option_label(
+            _("Pack games thumbnails"))
+        self.widget_behavior_thumbnails_atlas.set_description_label(
+            _("Store games thumbnails in a single file for each console"))
+
         # ------------------------------------
         #   General - Editor
         # ------------------------------------
@@ -1170,6 +1180,8 @@ class PreferencesWindow(CommonWindow):
         self.listbox_general_behavior.add(self.widget_behavior_last_console)
         self.listbox_general_behavior.add(self.widget_behavior_last_column)
         self.listbox_general_behavior.add(self.widget_behavior_hide_consoles)
+        self.listbox_general_behavior.add(
+            self.widget_behavior_thumbnails_atlas)
 
         self.listbox_general_editor.add(self.widget_editor_lines_visible)
         self.listbox_general_editor.add(self.widget_editor_tab_width)
@@ -1477,6 +1489,12 @@ class PreferencesWindow(CommonWindow):
                 "option": "hide_empty_console",
                 "fallback": False
             },
+            self.widget_behavior_thumbnails_atlas: {
+                "type": Gtk.Switch,
+                "section": "gem",
+                "option": "use_thumbnails_atlas",
+                "fallback": False
+            },
 
             # ------------------------------------
             #   General - Editor
@@ -21,6 +21,9 @@
 from datetime import date
 from datetime import timedelta
 
+# GEM
+from geode_gem.engine.utils import get_mimetype
+
 # GObject
 try:
     from gi import require_version
@@ -376,6 +379,9 @@ def replace_for_markup(text):
 def magic_from_file(filename, mime=False):
     """ Fallback function to retrieve file type when python-magic is missing
 
+    The mimetype is sniffed from the file header without starting a new
+    process, only the human readable name use the file command
+
     Parameters
     ----------
     filename : str
@@ -387,14 +393,18 @@ def magic_from_file(filename, mime=False):
     -------
     str
         File type result as human readable name or mimetype
+
+    See Also
+    --------
+    geode_gem.engine.utils.get_mimetype()
     """
 
+    if mime:
+        return get_mimetype(filename)
+
     # Use dereference to follow symlink
     commands = ["file", "--dereference", str(filename)]
 
-    if mime:
-        commands.insert(1, "--mime-type")
-
     with Popen(commands, stdout=PIPE, stdin=PIPE, stderr=STDOUT,
                universal_newlines=True) as pipe:
 
@@ -0,0 +1,363 @@
+# ------------------------------------------------------------------------------
+#  Copyleft 2015-2020  PacMiam
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+# ------------------------------------------------------------------------------
+
+# Filesystem
+from os import scandir
+from pathlib import Path
+
+# GObject
+try:
+    from gi.repository import Gio, GLib, GObject
+
+except ImportError as error:
+    from sys import exit
+
+    exit("Cannot found python3-gobject module: %s" % str(error))
+
+# Thread
+from threading import Thread
+
+
+# ------------------------------------------------------------------------------
+#   Class
+# ------------------------------------------------------------------------------
+
+class ConsoleMonitor(GObject.GObject):
+
+    __gsignals__ = {
+        "console-modified": (GObject.SignalFlags.RUN_FIRST, None, [object]),
+    }
+
+    # Delay in milliseconds used to merge a burst of filesystem events
+    delay = 500
+
+    # Maximum number of directories watched by each main loop iteration
+    batch = 64
+
+    # Events which can modify the games list
+    events = (
+        Gio.FileMonitorEvent.CREATED,
+        Gio.FileMonitorEvent.DELETED,
+        Gio.FileMonitorEvent.MOVED_IN,
+        Gio.FileMonitorEvent.MOVED_OUT,
+        Gio.FileMonitorEvent.RENAMED,
+    )
+
+    def __init__(self, console, logger):
+        """ Constructor
+
+        Parameters
+        ----------
+        console : gem.engine.console.Console
+            Console which games directory is watched
+        logger : logging.Logger
+            Output logger
+        """
+
+        GObject.GObject.__init__(self)
+
+        # ------------------------------------
+        #   Initialize variables
+        # ------------------------------------
+
+        self.console = console
+        self.logger = logger
+
+        # Store directories monitors with directory path as key
+        self.__monitors = dict()
+
+        # Pending console-modified signal source identifier
+        self.__timeout = int()
+
+        # Directories waiting for a monitor
+        self.__pending = list()
+
+        # Pending monitors creation source identifier
+        self.__idle = int()
+
+        # Incremented when monitor is stopped, to ignore the directories
+        # retrieved by a previous walk
+        self.__generation = int()
+
+    def start(self):
+        """ Start to watch the console games directory
+
+        Subdirectories are also watched when the console is recursive. They
+        are retrieved from a thread and watched later from the main loop
+
+        Returns
+        -------
+        bool
+            True if the directory will be watched, False otherwise
+        """
+
+        self.stop()
+
+        if self.console.path is None or not self.console.path.exists():
+            return False
+
+        self.__add_monitor(self.console.path)
+
+        return True
+
+    def stop(self):
+        """ Stop to watch the console games directory
+        """
+
+        for monitor in self.__monitors.values():
+            monitor.cancel()
+
+        self.__monitors.clear()
+        self.__pending.clear()
+
+        if self.__timeout > 0:
+            GLib.source_remove(self.__timeout)
+
+        if self.__idle > 0:
+            GLib.source_remove(self.__idle)
+
+        self.__timeout = int()
+        self.__idle = int()
+
+        self.__generation += 1
+
+    def __add_monitor(self, path):
+        """ Watch a directory and its subdirectories if console is recursive
+
+        Subdirectories are retrieved from a thread to avoid to block the
+        interface with large games directories
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Directory path
+        """
+
+        if not self.console.recursive:
+            self.__on_walk_terminate(self.__generation, [path])
+
+        else:
+            thread = Thread(target=self.__walk,
+                            args=(path, self.__generation),
+                            daemon=True)
+            thread.start()
+
+    def __walk(self, path, generation):
+        """ Retrieve a directory and its subdirectories
+
+        This function is called from a thread, the monitors are only created
+        from the main loop
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Directory path
+        generation : int
+            Monitor generation when the walk was started
+        """
+
+        directories, queue = list(), [path]
+
+        while queue:
+            directory = queue.pop()
+
+            directories.append(directory)
+
+            # Symbolic links are not followed to avoid loops
+            try:
+                with scandir(directory) as entries:
+                    queue.extend(
+                        Path(entry.path) for entry in entries
+                        if entry.is_dir(follow_symlinks=False))
+
+            except OSError:
+                continue
+
+        GLib.idle_add(self.__on_walk_terminate, generation, directories)
+
+    def __on_walk_terminate(self, generation, directories):
+        """ Store the directories which need a monitor
+
+        Parameters
+        ----------
+        generation : int
+            Monitor generation when the walk was started
+        directories : list
+            Directories path
+
+        Returns
+        -------
+        bool
+            Always False to remove this function from the main loop
+        """
+
+        # Monitor was stopped since the walk started
+        if not generation == self.__generation:
+            return False
+
+        self.__pending.extend(directories)
+
+        if self.__idle == 0:
+            self.__idle = GLib.idle_add(self.__on_create_monitors)
+
+        return False
+
+    def __on_create_monitors(self):
+        """ Create the monitors of pending directories by small batches
+
+        Returns
+        -------
+        bool
+            True while some directories are still pending, False otherwise
+        """
+
+        directories = self.__pending[:self.batch]
+        del self.__pending[:self.batch]
+
+        for directory in directories:
+
+            if str(directory) in self.__monitors:
+                continue
+
+            try:
+                monitor = Gio.File.new_for_path(
+                    str(directory)).monitor_directory(
+                        Gio.FileMonitorFlags.WATCH_MOVES, None)
+
+            except GLib.Error as error:
+                self.logger.warning(
+                    f"Cannot watch {directory} directory: {error.message}")
+                continue
+
+            monitor.connect("changed", self.__on_changed)
+
+            self.__monitors[str(directory)] = monitor
+
+        if len(self.__pending) > 0:
+            return True
+
+        self.__idle = int()
+
+        return False
+
+    def __remove_monitor(self, path):
+        """ Stop to watch a directory and its subdirectories
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            Directory path
+
+        Returns
+        -------
+        bool
+            True if the directory was watched, False otherwise
+        """
+
+        # Pending directories are not available anymore either
+        self.__pending = list(
+            directory for directory in self.__pending
+            if not directory == path and path not in directory.parents)
+
+        if str(path) not in self.__monitors:
+            return False
+
+        for directory in list(self.__monitors.keys()):
+            if directory == str(path) or path in Path(directory).parents:
+                self.__monitors.pop(directory).cancel()
+
+        return True
+
+    def __is_game(self, path):
+        """ Check if a file path match the console extensions
+
+        Parameters
+        ----------
+        path : pathlib.Path
+            File path
+
+        Returns
+        -------
+        bool
+            True if the path can be a game, False otherwise
+        """
+
+        name = path.name.lower()
+
+        return any(name.endswith(f".{extension.lower()}")
+                   for extension in self.console.extensions)
+
+    def __on_changed(self, monitor, path, other_path, event):
+        """ Receive an event from a directory monitor
+
+        Parameters
+        ----------
+        monitor : Gio.FileMonitor
+            Directory monitor
+        path : Gio.File
+            Modified file
+        other_path : Gio.File or None
+            New file for a renamed file
+        event : Gio.FileMonitorEvent
+            Event type
+        """
+
+        if event not in self.events:
+            return
+
+        paths = list()
+        for element in (path, other_path):
+            if element is not None and element.get_path() is not None:
+                paths.append(Path(element.get_path()))
+
+        modified = False
+
+        for element in paths:
+
+            # A removed or renamed directory is not watched anymore
+            if self.__remove_monitor(element):
+                modified = True
+
+            if element.is_dir():
+                if self.console.recursive \
+                   and not element.is_symlink() and element.exists():
+                    self.__add_monitor(element)
+
+                    modified = True
+
+            elif self.__is_game(element):
+                modified = True
+
+        if modified and self.__timeout == 0:
+            self.__timeout = GLib.timeout_add(self.delay, self.__on_timeout)
+
+    def __on_timeout(self):
+        """ Emit the console-modified signal once for a burst of events
+
+        Returns
+        -------
+        bool
+            Always False to remove this function from the main loop
+        """
+
+        self.__timeout = int()
+
+        self.emit("console-modified", self.console)
+
+        return False
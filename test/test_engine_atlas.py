@@ -0,0 +1,121 @@
+# ------------------------------------------------------------------------------
+#  Copyleft 2015-2020  PacMiam
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+# ------------------------------------------------------------------------------
+
+# Filesystem
+from pathlib import Path
+
+# Geode
+from geode_gem.engine.lib.atlas import Atlas
+
+# Logging
+from logging import getLogger
+
+# System
+from tempfile import TemporaryDirectory
+
+# Unittest
+import unittest
+
+
+# ------------------------------------------------------------------------------
+#   Tests
+# ------------------------------------------------------------------------------
+
+class GeodeGEMAtlasTC(unittest.TestCase):
+
+    def setUp(self):
+        """ Initialize each test with some data
+        """
+
+        self.directory = TemporaryDirectory()
+
+        self.path = Path(self.directory.name, "atlas", "console.atlas")
+
+        self.source = Path(self.directory.name, "cover.png")
+        self.source.write_bytes(b"cover")
+
+        self.atlas = Atlas(self.path, getLogger("gem"))
+
+    def tearDown(self):
+        """ Remove data from initialization when test terminate
+        """
+
+        self.atlas.close()
+
+        self.directory.cleanup()
+
+    def test_atlas_get(self):
+        """ Check geode_gem.engine.lib.atlas.Atlas.get method
+        """
+
+        self.assertIsNone(self.atlas.get("game", self.source))
+
+        self.atlas.set("game", self.source, b"\x01" * 48, 4, 4, 12, False)
+
+        self.assertIn("game", self.atlas)
+        self.assertEqual(self.atlas.get("game", self.source),
+                         (b"\x01" * 48, 4, 4, 12, False))
+
+        # Tile is removed when its source was modified
+        self.source.write_bytes(b"new cover")
+
+        self.assertIsNone(self.atlas.get("game", self.source))
+        self.assertNotIn("game", self.atlas)
+
+    def test_atlas_save(self):
+        """ Check geode_gem.engine.lib.atlas.Atlas.save method
+        """
+
+        self.assertFalse(self.atlas.save())
+
+        self.atlas.set("game_0", self.source, b"\x01" * 64, 4, 4, 16, True)
+        self.atlas.set("game_1", self.source, b"\x02" * 48, 4, 4, 12, False)
+
+        self.assertTrue(self.atlas.save())
+        self.assertTrue(self.path.exists())
+
+        # Tiles are read from the mapped file
+        atlas = Atlas(self.path, getLogger("gem"))
+
+        self.assertEqual(len(atlas), 2)
+        self.assertEqual(atlas.get("game_1", self.source),
+                         (b"\x02" * 48, 4, 4, 12, False))
+
+        # Stored tiles are kept when the atlas is written again
+        atlas.set("game_2", self.source, b"\x03" * 48, 4, 4, 12, False)
+
+        self.assertEqual(atlas.collect(["game_0", "game_2"]), 1)
+        self.assertTrue(atlas.save())
+
+        self.assertEqual(atlas.get("game_0", self.source),
+                         (b"\x01" * 64, 4, 4, 16, True))
+        self.assertIsNone(atlas.get("game_1", self.source))
+
+        atlas.close()
+
+        self.path.write_bytes(b"oops")
+
+        atlas = Atlas(self.path, getLogger("gem"))
+
+        with self.assertLogs("gem", level="WARNING"):
+            self.assertEqual(len(atlas), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+# ------------------------------------------------------------------------------
+#  Copyleft 2015-2020  PacMiam
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+# ------------------------------------------------------------------------------
+
+# Filesystem
+from pathlib import Path
+
+# Geode
+from geode_gem.engine.lib.cache import Cache, MemoryCache
+
+# Logging
+from logging import getLogger
+
+# System
+from tempfile import TemporaryDirectory
+
+# Unittest
+import unittest
+
+
+# ------------------------------------------------------------------------------
+#   Tests
+# ------------------------------------------------------------------------------
+
+class GeodeGEMCacheTC(unittest.TestCase):
+
+    def setUp(self):
+        """ Initialize each test with some data
+        """
+
+        self.directory = TemporaryDirectory()
+
+        self.path = Path(self.directory.name, "cache")
+
+        self.source = Path(self.directory.name, "cover.png")
+        self.source.write_bytes(b"cover")
+
+        self.cache = Cache(self.path, getLogger("gem"))
+
+    def tearDown(self):
+        """ Remove data from initialization when test terminate
+        """
+
+        self.directory.cleanup()
+
+    def generate(self, identifier, size=96, length=100):
+        """ Generate a cache file and store it into the manifest
+        """
+
+        path = self.path.joinpath("games", f"{size}x{size}")
+        path.mkdir(parents=True, exist_ok=True)
+
+        path.joinpath(f"{identifier}.png").write_bytes(b"x" * length)
+
+        return self.cache.register("games", size, identifier, self.source)
+
+    def test_cache_get(self):
+        """ Check geode_gem.engine.lib.cache.Cache.get method
+        """
+
+        self.assertIsNone(self.cache.get("games", 96, "game", self.source))
+
+        self.assertFalse(self.cache.register("games", 96, "game", None))
+        self.assertTrue(self.generate("game"))
+
+        self.assertEqual(self.cache.get("games", 96, "game", self.source),
+                         self.path.joinpath("games", "96x96", "game.png"))
+
+        # Cache file is removed when its source was modified
+        self.source.write_bytes(b"new cover")
+
+        self.assertIsNone(self.cache.get("games", 96, "game", self.source))
+        self.assertFalse(
+            self.path.joinpath("games", "96x96", "game.png").exists())
+
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.size, 0)
+
+    def test_cache_budget(self):
+        """ Check geode_gem.engine.lib.cache.Cache budget management
+        """
+
+        for index in range(0, 4):
+            self.generate(f"game_{index}")
+
+        self.assertEqual(self.cache.size, 400)
+
+        # Use the oldest file to keep it in cache
+        self.assertIsNotNone(
+            self.cache.get("games", 96, "game_0", self.source))
+
+        self.assertEqual(self.cache.set_budget(250), 2)
+        self.assertEqual(self.cache.size, 200)
+
+        self.assertIsNotNone(
+            self.cache.get("games", 96, "game_0", self.source))
+        self.assertIsNone(self.cache.get("games", 96, "game_1", self.source))
+
+        self.generate("game_4")
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get("games", 96, "game_3", self.source))
+
+    def test_cache_collect(self):
+        """ Check geode_gem.engine.lib.cache.Cache.collect method
+        """
+
+        self.generate("game_0")
+        self.generate("game_1", size=22)
+
+        # File generated without manifest entry
+        self.path.joinpath("games", "96x96", "game_2.png").touch()
+
+        self.assertEqual(self.cache.collect("consoles", list()), 0)
+        self.assertEqual(self.cache.collect("games", ["game_0"]), 2)
+
+        self.assertEqual(len(self.cache), 1)
+        self.assertFalse(
+            self.path.joinpath("games", "96x96", "game_2.png").exists())
+
+    def test_cache_extension(self):
+        """ Check geode_gem.engine.lib.cache.Cache files with extension
+        """
+
+        self.generate("game_0")
+
+        path = self.path.joinpath("atlas", "96x96")
+        path.mkdir(parents=True)
+
+        path.joinpath("console.atlas").write_bytes(b"x" * 200)
+        path.joinpath("removed.atlas").touch()
+
+        self.assertTrue(
+            self.cache.register("atlas", 96, "console", None, "atlas"))
+
+        self.assertEqual(self.cache.size, 300)
+        self.assertEqual(
+            self.cache.get("atlas", 96, "console", None, "atlas"),
+            path.joinpath("console.atlas"))
+
+        # Atlas is the most recently used file
+        self.assertEqual(self.cache.set_budget(250), 1)
+        self.assertIsNone(self.cache.get("games", 96, "game_0", self.source))
+
+        self.assertEqual(self.cache.collect("atlas", ["console"]), 0)
+        self.assertEqual(
+            self.cache.collect("atlas", ["console"], "atlas"), 1)
+
+        self.assertTrue(path.joinpath("console.atlas").exists())
+        self.assertFalse(path.joinpath("removed.atlas").exists())
+
+    def test_cache_manifest(self):
+        """ Check geode_gem.engine.lib.cache.Cache manifest file
+        """
+
+        self.assertFalse(self.cache.save())
+
+        self.generate("game_0")
+        self.generate("game_1")
+
+        self.assertTrue(self.cache.save())
+        self.assertFalse(self.cache.save())
+
+        cache = Cache(self.path, getLogger("gem"))
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 200)
+        self.assertIsNotNone(cache.get("games", 96, "game_1", self.source))
+
+        self.path.joinpath(Cache.manifest).write_text("oops")
+
+        with self.assertLogs("gem", level="WARNING"):
+            self.assertFalse(cache.load())
+
+        self.assertEqual(len(cache), 0)
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class GeodeGEMMemoryCacheTC(unittest.TestCase):
+
+    def setUp(self):
+        """ Initialize each test with some data
+        """
+
+        self.directory = TemporaryDirectory()
+
+        self.source = Path(self.directory.name, "cover.png")
+        self.source.write_bytes(b"cover")
+
+        self.cache = MemoryCache(budget=300)
+
+    def tearDown(self):
+        """ Remove data from initialization when test terminate
+        """
+
+        self.directory.cleanup()
+
+    def test_memory_cache_get(self):
+        """ Check geode_gem.engine.lib.cache.MemoryCache.get method
+        """
+
+        key = ("games", 96, "game")
+
+        self.assertIsNone(self.cache.get(key, self.source))
+
+        self.assertTrue(self.cache.set(key, "pixbuf", 100, self.source))
+        self.assertEqual(self.cache.get(key, self.source), "pixbuf")
+
+        # Themed icons names do not have a signature
+        self.assertTrue(
+            self.cache.set(("emulators", 22, "emulator"), "icon", 10, "icon"))
+        self.assertEqual(
+            self.cache.get(("emulators", 22, "emulator"), "icon"), "icon")
+
+        # Value is removed when its source path was modified
+        self.assertIsNone(self.cache.get(key, "another_cover.png"))
+        self.assertTrue(self.cache.set(key, "pixbuf", 100, self.source))
+
+        # Value is only removed by validate when its source was modified
+        self.source.write_bytes(b"new cover")
+
+        self.assertEqual(self.cache.get(key, self.source), "pixbuf")
+        self.assertEqual(self.cache.validate(), 1)
+
+        self.assertIsNone(self.cache.get(key, self.source))
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.size, 10)
+
+    def test_memory_cache_budget(self):
+        """ Check geode_gem.engine.lib.cache.MemoryCache budget management
+        """
+
+        self.assertFalse(self.cache.set("large", "pixbuf", 400, self.source))
+
+        for index in range(0, 3):
+            self.cache.set(index, f"pixbuf_{index}", 100, self.source)
+
+        # Use the oldest value to keep it in memory
+        self.assertEqual(self.cache.get(0, self.source), "pixbuf_0")
+
+        self.cache.set(3, "pixbuf_3", 100, self.source)
+
+        self.assertEqual(self.cache.size, 300)
+        self.assertIsNone(self.cache.get(1, self.source))
+
+        self.assertEqual(self.cache.set_budget(100), 2)
+        self.assertEqual(self.cache.get(3, self.source), "pixbuf_3")
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
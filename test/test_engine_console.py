@@ -101,6 +101,113 @@ class GeodeGEMConsoleTC(unittest.TestCase):
         self.console.init_games()
         self.assertEqual(len(self.console.get_games()), 5)
 
+    def test_console_init_games_incremental(self):
+        """ Check geode_gem.engine.console.Console.init_games incremental scan
+        """
+
+        self.assertTrue(self.console.is_modified())
+        self.assertTrue(self.console.init_games())
+
+        game = self.console.get_game(self.first_game_id)
+
+        # Directory is considered as stable after the racy delay
+        self.console.racy_delay = 0
+
+        self.assertFalse(self.console.init_games(force=True))
+        self.assertFalse(self.console.is_modified())
+        self.assertFalse(self.console.init_games())
+
+        # Unchanged games are kept
+        self.assertIs(self.console.get_game(self.first_game_id), game)
+
+        path = Path(self.directory.name, "new_game.nop")
+        path.touch()
+
+        self.files[0].close()
+
+        self.assertTrue(self.console.init_games(force=True))
+        self.assertEqual(len(self.console.get_games()), 5)
+
+        self.assertIsNone(self.console.get_game(self.first_game_id))
+        self.assertIsNotNone(self.console.get_game_from_path(path))
+
+        # Games rewritten in place are generated again
+        game = self.console.get_game_from_path(path)
+        path.write_bytes(b"new content")
+
+        self.assertTrue(self.console.init_games(force=True))
+        self.assertIsNot(self.console.get_game_from_path(path), game)
+
+        # Games added manually are kept by next scan
+        path = Path(self.directory.name, "added_game.nop")
+        path.touch()
+
+        game = self.console.add_game(path)
+
+        self.assertFalse(self.console.init_games(force=True))
+        self.assertIs(self.console.get_game_from_path(path), game)
+        self.assertEqual(len(self.console.get_games()), 6)
+
+        # Modified scan parameters reset games list
+        self.console.extensions = ["ext"]
+
+        self.assertTrue(self.console.init_games())
+        self.assertEqual(len(self.console.get_games()), 4)
+
+    def test_console_snapshot(self):
+        """ Check geode_gem.engine.console.Console snapshot methods
+        """
+
+        path = Path(self.directory.name, "snapshots", "console.json")
+
+        self.assertFalse(self.console.load_snapshot(path))
+
+        # Nothing to store before the first scan
+        self.assertFalse(self.console.save_snapshot(path))
+
+        self.console.init_games()
+
+        self.assertTrue(self.console.save_snapshot(path))
+        self.assertTrue(path.exists())
+
+        # Snapshot is only written when games list was modified
+        self.assertFalse(self.console.save_snapshot(path))
+
+        console = Console(None,
+                          path=Path(self.directory.name),
+                          emulator=self.console.emulator,
+                          extensions=["ext", "nop"])
+
+        self.assertTrue(console.load_snapshot(path))
+        self.assertEqual(len(console.get_games()), 5)
+
+        game = console.get_game(self.first_game_id)
+        self.assertEqual(game.path, self.first_game)
+        self.assertEqual(game.name, self.first_game.stem)
+        self.assertEqual(
+            game.installed,
+            self.console.get_game(self.first_game_id).installed)
+
+        # Snapshot is checked against the filesystem by the next scan
+        console.racy_delay = 0
+
+        self.files[0].close()
+
+        self.assertTrue(console.init_games())
+        self.assertEqual(len(console.get_games()), 4)
+        self.assertIsNone(console.get_game(self.first_game_id))
+
+        # Snapshot is ignored when games list was already scanned
+        self.assertFalse(console.load_snapshot(path))
+
+        # Snapshot generated with other scan parameters is ignored
+        console = Console(None,
+                          path=Path(self.directory.name),
+                          emulator=self.console.emulator,
+                          extensions=["ext"])
+
+        self.assertFalse(console.load_snapshot(path))
+
     def test_console_add_game(self):
         """ Check geode_gem.engine.console.Console.add_game method
         """
@@ -146,6 +253,29 @@ class GeodeGEMConsoleTC(unittest.TestCase):
         game = self.console.get_game(self.first_game_id)
         self.assertIsNotNone(game)
 
+    def test_console_get_game_from_path(self):
+        """ Check geode_gem.engine.console.Console.get_game_from_path method
+        """
+
+        self.console.init_games()
+
+        self.assertIsNone(self.console.get_game_from_path("I am error"))
+
+        game = self.console.get_game_from_path(self.first_game)
+        self.assertIsNotNone(game)
+        self.assertIs(game, self.console.get_game(self.first_game_id))
+
+        self.assertIs(game, self.console.get_game_from_path(
+            str(self.first_game)))
+
+        self.console.delete_game(game)
+        self.assertIsNone(self.console.get_game(self.first_game_id))
+        self.assertIsNone(self.console.get_game_from_path(self.first_game))
+
+        # A removed game can be added again
+        self.console.add_game(self.first_game)
+        self.assertEqual(len(self.console.get_games()), 5)
+
     def test_console_search_game(self):
         """ Check geode_gem.engine.console.Console.search_game method
         """
@@ -0,0 +1,493 @@
+# ------------------------------------------------------------------------------
+#  Copyleft 2015-2020  PacMiam
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software
+#  Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+#  MA 02110-1301, USA.
+# ------------------------------------------------------------------------------
+
+# Context
+from contextlib import closing
+
+# Database
+import sqlite3
+
+# Filesystem
+from pathlib import Path
+
+# Geode
+from geode_gem.engine.lib.configuration import Configuration
+from geode_gem.engine.lib.database import Database
+from geode_gem.engine.utils import get_data
+
+# Logging
+from logging import getLogger
+
+# System
+from tempfile import TemporaryDirectory
+
+# Thread
+from threading import Thread
+
+# Time
+from time import sleep
+
+# Unittest
+import unittest
+
+
+# ------------------------------------------------------------------------------
+#   Tests
+# ------------------------------------------------------------------------------
+
+class GeodeGEMDatabaseTC(unittest.TestCase):
+
+    def setUp(self):
+        """ Initialize each test with some data
+        """
+
+        self.directory = TemporaryDirectory()
+
+        self.configuration = Configuration(
+            get_data("data", "config", "databases.conf"), strict=False)
+
+        self.database = Database(Path(self.directory.name, "gem.db"),
+                                 self.configuration,
+                                 getLogger("gem"))
+
+    def tearDown(self):
+        """ Remove data from initialization when test terminate
+        """
+
+        self.database.close()
+
+        self.directory.cleanup()
+
+    def test_database_connect(self):
+        """ Check geode_gem.engine.lib.database.Database.connect method
+        """
+
+        connection = self.database.connect()
+        self.assertIs(connection, self.database.connect())
+
+        mode = connection.execute("PRAGMA journal_mode;").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+        connections = list()
+
+        thread = Thread(
+            target=lambda: connections.append(self.database.connect()))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(len(connections), 1)
+        self.assertIsNot(connections[0], connection)
+
+    def test_database_pragmas(self):
+        """ Check geode_gem.engine.lib.database.Database pragmas override
+        """
+
+        database = Database(Path(self.directory.name, "other.db"),
+                            self.configuration,
+                            getLogger("gem"),
+                            journal_mode="DELETE",
+                            synchronous="FULL")
+
+        connection = database.connect()
+
+        mode = connection.execute("PRAGMA journal_mode;").fetchone()[0]
+        self.assertEqual(mode, "delete")
+
+        synchronous = connection.execute("PRAGMA synchronous;").fetchone()[0]
+        self.assertEqual(synchronous, 2)
+
+        self.assertEqual(Database.pragmas["journal_mode"], "WAL")
+
+        database.close()
+
+    def test_database_close(self):
+        """ Check geode_gem.engine.lib.database.Database.close method
+        """
+
+        self.database.insert("games", {"filename": "game.ext", "name": "Game"})
+
+        self.database.close()
+
+        # A new connection is opened on demand after closing
+        self.assertEqual(
+            self.database.select("games", "name", {"filename": "game.ext"}),
+            "Game")
+
+    def test_database_get_many(self):
+        """ Check geode_gem.engine.lib.database.Database.get_many method
+        """
+
+        self.assertEqual(
+            self.database.get_many("games", "filename", ["unknown.ext"]),
+            dict())
+
+        filenames = [f"game_{index}.ext" for index in range(0, 1200)]
+
+        for filename in filenames:
+            self.database.insert("games", {"filename": filename,
+                                           "name": filename.upper()})
+
+        rows = self.database.get_many(
+            "games", "filename", filenames + ["unknown.ext"])
+
+        self.assertEqual(len(rows), len(filenames))
+        self.assertNotIn("unknown.ext", rows)
+
+        self.assertEqual(rows["game_42.ext"]["name"], "GAME_42.EXT")
+        self.assertEqual(
+            rows["game_42.ext"],
+            self.database.get("games", {"filename": "game_42.ext"}))
+
+    def test_database_parameters(self):
+        """ Check geode_gem.engine.lib.database.Database values escaping
+        """
+
+        name = "Don't \"quote\" me; DROP TABLE games; --"
+
+        self.database.insert("games", {"filename": "game.ext", "name": name})
+        self.assertEqual(
+            self.database.select("games", "name", {"filename": "game.ext"}),
+            name)
+
+        self.database.update("games", {"score": 3}, {"name": name})
+        self.assertEqual(
+            self.database.get("games", {"name": name})["score"], 3)
+
+        self.database.remove("games", {"name": name})
+        self.assertIsNone(self.database.get("games", {"name": name}))
+
+    def test_database_modify(self):
+        """ Check geode_gem.engine.lib.database.Database.modify method
+        """
+
+        self.database.modify("games",
+                             {"filename": "game.ext", "name": "Game"},
+                             {"filename": "game.ext"})
+
+        row = self.database.get("games", {"filename": "game.ext"})
+        self.assertEqual(row["name"], "Game")
+        self.assertEqual(row["score"], 0)
+
+        self.database.modify("games",
+                             {"score": 4, "favorite": True},
+                             {"filename": "game.ext"})
+
+        row = self.database.get("games", {"filename": "game.ext"})
+        self.assertEqual(row["name"], "Game")
+        self.assertEqual(row["score"], 4)
+        self.assertEqual(row["favorite"], 1)
+
+        self.assertEqual(len(self.database.get_many(
+            "games", "filename", ["game.ext"])), 1)
+
+        # Empty values clear the column of an existing row
+        self.database.modify(
+            "games", {"score": None}, {"filename": "game.ext"})
+
+        row = self.database.get("games", {"filename": "game.ext"})
+        self.assertIsNone(row["score"])
+        self.assertEqual(row["favorite"], 1)
+
+        # Conditions which are not a primary key or an unique index
+        for index in range(0, 2):
+            self.database.modify("game_tags",
+                                 {"tag": "tag"},
+                                 {"filename": "game.ext", "tag": "tag"})
+
+        self.assertEqual(self.database.select(
+            "game_tags", ["filename", "tag"], {"filename": "game.ext"}),
+            ("game.ext", "tag"))
+
+        # Modify a key value
+        self.database.modify("gem", {"version": "1.0"}, {"version": "1.0"})
+        self.database.modify("gem", {"version": "2.0"}, {"version": "1.0"})
+
+        self.assertEqual(self.database.select("gem", "version"), "2.0")
+
+    def test_database_transaction(self):
+        """ Check geode_gem.engine.lib.database.Database.transaction method
+        """
+
+        with self.database.transaction():
+            self.database.insert("games", {"filename": "first.ext"})
+
+            with self.database.transaction():
+                self.database.insert("games", {"filename": "second.ext"})
+
+            # Nothing is committed until the outermost scope is closed
+            self.assertTrue(self.database.connect().in_transaction)
+
+        self.assertFalse(self.database.connect().in_transaction)
+        self.assertEqual(len(self.database.get_many(
+            "games", "filename", ["first.ext", "second.ext"])), 2)
+
+        with self.assertRaises(RuntimeError):
+            with self.database.transaction():
+                self.database.insert("games", {"filename": "third.ext"})
+
+                raise RuntimeError("Something goes wrong")
+
+        self.assertIsNone(
+            self.database.get("games", {"filename": "third.ext"}))
+
+        # Another scope can be opened after a rollback
+        with self.database.transaction():
+            self.database.insert("games", {"filename": "third.ext"})
+
+        self.assertIsNotNone(
+            self.database.get("games", {"filename": "third.ext"}))
+
+    def test_database_concurrent_transactions(self):
+        """ Check geode_gem.engine.lib.database.Database.transaction method
+            from several threads
+        """
+
+        errors = list()
+
+        def insert(index):
+            try:
+                with self.database.transaction() as database:
+                    for element in range(0, 50):
+                        database.execute("SELECT COUNT(*) FROM games;")
+
+                        # Let another thread start its transaction
+                        sleep(0.001)
+
+                        database.execute(
+                            "INSERT INTO games (filename) VALUES (?);",
+                            (f"game_{index}_{element}.ext",))
+
+            except sqlite3.Error as error:
+                errors.append(error)
+
+        threads = list(
+            Thread(target=insert, args=(index,)) for index in range(0, 4))
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, list())
+        self.assertEqual(
+            len(list(self.database.iter_select("games", "filename"))), 200)
+
+    def test_database_get_columns(self):
+        """ Check geode_gem.engine.lib.database.Database.get_columns method
+        """
+
+        columns = self.database.get_columns("games")
+        self.assertEqual(columns, self.configuration.options("games"))
+
+        # Returned list can be modified without altering the cache
+        columns.append("oops")
+        self.assertNotIn("oops", self.database.get_columns("games"))
+
+        self.database.add_column("games", "notes", "text")
+        self.assertIn("notes", self.database.get_columns("games"))
+
+        self.database.rename_table("games", "roms")
+        self.assertEqual(self.database.get_columns("games"), list())
+        self.assertIn("notes", self.database.get_columns("roms"))
+
+        self.database.remove_table("roms")
+        self.assertEqual(self.database.get_columns("roms"), list())
+
+    def test_database_migrate(self):
+        """ Check geode_gem.engine.lib.database.Database.migrate method
+        """
+
+        class Updater(object):
+
+            def init(self, length):
+                self.length = length
+                self.steps = list()
+
+            def update(self, index):
+                self.steps.append(index)
+
+        path = Path(self.directory.name, "previous.db")
+
+        with closing(sqlite3.connect(str(path))) as database:
+            database.execute("CREATE TABLE games (filename text primary key, "
+                             "name text, play integer, score integer, "
+                             "removed text);")
+
+            database.executemany(
+                "INSERT INTO games VALUES (?, ?, ?, ?, ?);",
+                ((f"game_{index}.ext", f"Game {index}", 2, 2, "nop")
+                 for index in range(0, 120)))
+
+            database.commit()
+
+        updater = Updater()
+
+        self.database.migration_chunk_size = 50
+
+        counter = self.database.migrate(path, "games", updater)
+
+        self.assertEqual(counter, 120)
+        self.assertEqual(updater.length, 120)
+        self.assertEqual(updater.steps, [50, 100, 120])
+
+        row = self.database.get("games", {"filename": "game_42.ext"})
+        self.assertEqual(row["name"], "Game 42")
+        self.assertEqual(row["play"], 2)
+        self.assertEqual(row["score"], 2)
+        self.assertEqual(row["tags"], "")
+        self.assertNotIn("removed", row)
+
+        # Empty values from previous scheme use the column default value
+        path = Path(self.directory.name, "legacy.db")
+
+        with closing(sqlite3.connect(str(path))) as database:
+            database.execute("CREATE TABLE games (filename text primary key, "
+                             "name text, tags text, cover text);")
+
+            database.execute("INSERT INTO games VALUES (?, ?, ?, ?);",
+                             ("legacy.ext", None, None, None))
+
+            database.commit()
+
+        self.assertEqual(self.database.migrate(path, "games"), 1)
+
+        row = self.database.get("games", {"filename": "legacy.ext"})
+        self.assertEqual(row["name"], "")
+        self.assertEqual(row["tags"], "")
+        self.assertEqual(row["cover"], "")
+
+        # Previous database is detached after migration
+        self.assertEqual(
+            self.database.migrate(Path(self.directory.name, "empty.db"),
+                                  "games"), 0)
+
+    def test_database_iter_select(self):
+        """ Check geode_gem.engine.lib.database.Database.iter_select method
+        """
+
+        self.assertEqual(list(self.database.iter_select("games", "name")),
+                         list())
+
+        for index in range(0, 10):
+            self.database.insert("games", {"filename": f"game_{index}.ext",
+                                           "score": index % 2})
+
+        rows = self.database.iter_select(
+            "games", ["filename", "score"], {"score": 1}, arraysize=2)
+
+        self.assertEqual(len(list(rows)), 5)
+
+        rows = list(self.database.iter_select(
+            "games", "filename", {"filename": "game_3.ext"}))
+
+        self.assertEqual(rows, [("game_3.ext",)])
+
+    def test_database_create_index(self):
+        """ Check geode_gem.engine.lib.database.Database.create_index method
+        """
+
+        self.assertTrue(self.database.is_empty("game_tags"))
+
+        self.database.create_index(
+            "game_tags", ["filename", "tag"], unique=True)
+
+        # Index is only generated once
+        self.database.create_index(
+            "game_tags", ["filename", "tag"], unique=True)
+
+        indexes = self.database.select(
+            "sqlite_master", "name", {"type": "index",
+                                      "tbl_name": "game_tags"})
+
+        self.assertEqual(indexes, "index_game_tags_filename_tag")
+
+        data = {"filename": "game.ext", "tag": "action"}
+
+        self.database.insert("game_tags", data)
+        self.database.insert("game_tags", data)
+
+        self.assertFalse(self.database.is_empty("game_tags"))
+        self.assertEqual(
+            len(list(self.database.iter_select("game_tags", "tag"))), 1)
+
+    def test_database_create_virtual_table(self):
+        """ Check geode_gem.engine.lib.database.Database.create_virtual_table
+            method
+        """
+
+        self.assertTrue(self.database.check_integrity())
+
+        self.assertTrue(self.database.create_virtual_table(
+            "games_search", "fts5", ["name", "tags"]))
+
+        # Virtual and shadow tables do not alter the database integrity
+        self.assertTrue(self.database.check_integrity())
+
+        self.database.insert("games_search", {"name": "Super Game",
+                                              "tags": "action"})
+
+        request = self.database.execute(
+            "SELECT name FROM games_search WHERE games_search MATCH ?;",
+            ("sup*",))
+
+        self.assertEqual(request.fetchall(), [("Super Game",)])
+
+        self.assertFalse(self.database.create_virtual_table(
+            "unknown", "unknown_module", ["name"]))
+
+    def test_database_profile(self):
+        """ Check geode_gem.engine.lib.database.Database profiling methods
+        """
+
+        self.assertEqual(self.database.get_profile(), dict())
+
+        self.database.set_profiling(True, threshold=0)
+
+        for index in range(0, 3):
+            self.database.insert("games", {"filename": f"game_{index}.ext"})
+
+        self.assertEqual(len(self.database.select("games", "filename")), 3)
+
+        with self.assertLogs("gem", level="INFO") as logs:
+            self.database.log_profile()
+
+        self.assertTrue(any("3 calls" in line for line in logs.output))
+
+        statistics = self.database.get_profile()
+
+        request = "INSERT INTO games (filename) VALUES (?);"
+        self.assertEqual(statistics[request]["calls"], 3)
+        self.assertEqual(statistics[request]["rows"], 3)
+        self.assertEqual(
+            statistics[request]["callers"]["test_engine_database:"
+                                           "test_database_profile"], 3)
+
+        request = "SELECT filename FROM games;"
+        self.assertEqual(statistics[request]["calls"], 1)
+        self.assertEqual(statistics[request]["rows"], 3)
+
+        self.database.set_profiling(False)
+
+        self.database.insert("games", {"filename": "game.ext"})
+        self.assertEqual(self.database.get_profile(), dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
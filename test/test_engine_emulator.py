@@ -135,6 +135,40 @@ class GeodeGEMEmulatorTC(unittest.TestCase):
         self.assertIsNotNone(data)
         self.assertEqual(len(data), 4)
 
+    def test_emulator_get_content_index(self):
+        """ Check geode_gem.engine.emulator.Emulator directories index
+        """
+
+        self.emulator.racy_delay = 0
+
+        self.assertEqual(
+            self.emulator.get_screenshots(self.game),
+            sorted(path.resolve() for path in self.screenshots))
+
+        # Index is updated when directory is modified
+        path = self.tempdirectory.joinpath("screenshots", "game_005.png")
+        path.touch()
+
+        try:
+            self.assertIn(path.resolve(),
+                          self.emulator.get_screenshots(self.game))
+
+        finally:
+            path.unlink()
+
+        self.assertEqual(len(self.emulator.get_screenshots(self.game)), 4)
+
+        # Only files with the pattern prefix are retrieved
+        path = self.tempdirectory.joinpath("gam.ext")
+        path.touch()
+
+        try:
+            self.assertEqual(
+                self.emulator.get_screenshots(Game(None, path)), list())
+
+        finally:
+            path.unlink()
+
     def test_emulator_get_command_line(self):
         """ Check geode_gem.engine.emulator.Emulator.get_command_line method
         """
@@ -144,7 +178,8 @@ class GeodeGEMEmulatorTC(unittest.TestCase):
             emulator.get_command_line(self.game)
 
         data = self.emulator.get_command_line(self.game)
-        self.assertEqual(data[0], str(self.emulator.binary))
+        self.assertEqual(data[0], self.emulator.binary_path)
+        self.assertTrue(Path(data[0]).is_absolute())
         self.assertEqual(data[-1], str(self.game.path))
         self.assertEqual(len(data), 2)
 
@@ -18,7 +18,7 @@
 # ------------------------------------------------------------------------------
 
 # Datetime
-from datetime import timedelta
+from datetime import date, timedelta
 
 # Filesystem
 from pathlib import Path
@@ -87,6 +87,59 @@ class GeodeGEMGameTC(unittest.TestCase):
         self.assertEqual(self.game.score, 0)
         self.assertFalse(self.game.multiplayer)
 
+    def test_game_lazy_attributes(self):
+        """ Check geode_gem.engine.game.Game lazy attributes initialization
+        """
+
+        game = Game(None, self.path, emulator="emulator")
+
+        self.assertFalse(hasattr(game, "__dict__"))
+
+        # Modified values are kept when the other attributes are initialized
+        game.score = 4
+
+        self.assertEqual(game.score, 4)
+        self.assertEqual(game.name, self.path.stem)
+        self.assertEqual(game.emulator, "emulator")
+        self.assertEqual(game.tags, list())
+        self.assertEqual(game.environment, dict())
+        self.assertEqual(game.installed, self.game.installed)
+
+        # Lists are not shared between games
+        game.tags.append("action")
+        self.assertEqual(self.game.tags, list())
+
+        # Installation date and environment are kept as other attributes
+        game = Game(None, self.path)
+        game.environment = {"KEY": "value"}
+
+        self.assertEqual(game.installed, self.game.installed)
+        self.assertEqual(game.environment, {"KEY": "value"})
+
+        game.update_installation_date()
+        self.assertEqual(game.installed, self.game.installed)
+
+        game.reset()
+
+        self.assertEqual(game.score, 0)
+        self.assertIsNone(game.emulator)
+
+        with self.assertRaises(AttributeError):
+            game.unknown_attribute
+
+        # Attributes are still available when the game file was removed
+        path = self.path.with_name("removed.ext")
+        path.touch()
+
+        game = Game(None, path)
+        self.assertEqual(game.installed, self.game.installed)
+
+        path.unlink()
+        game.reset()
+
+        self.assertEqual(game.installed, date(1, 1, 1))
+        self.assertEqual(game.name, "removed")
+
     def test_game_extension(self):
         """ Check geode_gem.engine.game.Game.extension property
         """
@@ -21,18 +21,22 @@
 from datetime import datetime, timedelta
 
 # Filesystem
+from os import chdir, getcwd
 from pathlib import Path
 
 # Geode
 from geode_gem.engine.utils import (are_equivalent_timestamps,
                                     copy,
-                                    generate_extension,
                                     generate_identifier,
                                     get_binary_path,
                                     get_boot_datetime_as_timestamp,
                                     get_creation_datetime,
                                     get_data,
-                                    parse_timedelta)
+                                    get_mimetype,
+                                    get_stat,
+                                    parse_timedelta,
+                                    resolve_binary_path,
+                                    scan_directory)
 
 # System
 from tempfile import gettempdir, TemporaryDirectory
@@ -40,6 +44,8 @@ from tempfile import gettempdir, TemporaryDirectory
 # Unittest
 import unittest
 
+from unittest.mock import patch
+
 
 # ------------------------------------------------------------------------------
 #   Tests
@@ -94,6 +100,64 @@ class GeodeGEMUtilsTC(unittest.TestCase):
 
         self.assertEqual(len(get_binary_path("were-binary_of_doom")), 0)
 
+    def test_resolve_binary_path(self):
+        """ Check geode_gem.engine.utils.resolve_binary_path method
+        """
+
+        path = resolve_binary_path("python3")
+
+        self.assertIn(path, get_binary_path("python3"))
+        self.assertTrue(Path(path).is_absolute())
+
+        self.assertIsNone(resolve_binary_path("were-binary_of_doom"))
+        self.assertIsNone(resolve_binary_path(None))
+
+        with TemporaryDirectory() as directory:
+            binary = Path(directory, "were-binary_of_doom")
+
+            self.assertIsNone(resolve_binary_path(binary))
+
+            binary.touch(mode=0o755)
+
+            # Result is cached during a short delay
+            self.assertIsNone(resolve_binary_path(binary))
+
+            # Then checked against the directory modification time
+
+            with patch("geode_gem.engine.utils.BINARY_CACHE_DELAY", 0):
+                self.assertEqual(resolve_binary_path(binary), str(binary))
+
+                # Directories and files without execution permission are
+                # not binaries
+                binary.chmod(0o644)
+                Path(directory, "directory").mkdir()
+
+                self.assertIsNone(resolve_binary_path(binary))
+                self.assertIsNone(
+                    resolve_binary_path(Path(directory, "directory")))
+
+                # Binary names are only searched in $PATH directories
+                with patch.dict("os.environ", {"PATH": directory}):
+                    binary.chmod(0o755)
+                    Path(directory, "python3").mkdir()
+
+                    self.assertEqual(resolve_binary_path(binary.name),
+                                     str(binary))
+                    self.assertIsNone(resolve_binary_path("python3"))
+
+            # Current directory is not searched for binary names
+            current = getcwd()
+
+            try:
+                chdir(directory)
+                Path(directory, "were-directory_of_doom").mkdir()
+
+                self.assertIsNone(
+                    resolve_binary_path("were-directory_of_doom"))
+
+            finally:
+                chdir(current)
+
     def test_get_creation_datetime(self):
         """ Check geode_gem.engine.utils.get_creation_datetime method
         """
@@ -105,18 +169,59 @@ class GeodeGEMUtilsTC(unittest.TestCase):
         creation_date = get_creation_datetime("not_exists.file")
         self.assertIsNone(creation_date)
 
-    def test_generate_extension(self):
-        """ Check geode_gem.engine.utils.generate_extension method
+    def test_get_mimetype(self):
+        """ Check geode_gem.engine.utils.get_mimetype method
         """
 
         self.assertEqual(
-            "[nN][eE][sS]", generate_extension("NES"))
+            get_mimetype(get_data("data", "icons", "nintendo-nes.png")),
+            "image/png")
 
         self.assertEqual(
-            ".[oO][gG][gG]", generate_extension(".ogg"))
+            get_mimetype(get_data("test", "test_engine_utils.py")),
+            "text/plain")
+
+        self.assertEqual(get_mimetype("not_exists.file"), str())
+
+        with TemporaryDirectory() as directory:
+            self.assertEqual(get_mimetype(directory), "inode/directory")
+
+            path = Path(directory, "file")
+
+            for content, mimetype in (
+                    (b"", "inode/x-empty"),
+                    (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg"),
+                    (b"GIF89a\x01\x00", "image/gif"),
+                    (b"BM\x00\x00", "image/bmp"),
+                    (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+                    (b"<?xml version='1.0'?>\n<svg></svg>", "image/svg+xml"),
+                    ("Hélo wörld\n".encode("latin-1"), "text/plain"),
+                    (b"NES\x1a\x02\x01\x00\x00", "application/octet-stream")):
+
+                # Cache is invalidated when file size or modification changed
+                path.write_bytes(content)
+                self.assertEqual(get_mimetype(path), mimetype)
+
+    def test_get_stat(self):
+        """ Check geode_gem.engine.utils.get_stat method
+        """
+
+        path = get_data("test", "test_engine_utils.py")
+
+        self.assertEqual(get_stat(path).st_ino, path.stat().st_ino)
+        self.assertEqual(get_stat(str(path)).st_ino, path.stat().st_ino)
+
+        self.assertIsNone(get_stat("not_exists.file"))
+
+        # Status already retrieved is used instead of the file
+        stat = get_stat(path)
 
         self.assertEqual(
-            ".[tT][aA][rR].[xX][zZ]", generate_extension(".tAr.Xz"))
+            generate_identifier("not_exists.file", stat),
+            f"not-exists-file-{stat.st_ino}")
+        self.assertEqual(
+            get_creation_datetime("not_exists.file", stat),
+            datetime.fromtimestamp(stat.st_ctime))
 
     def test_generate_identifier_from_file(self):
         """ Check geode_gem.engine.utils.generate_identifier method
@@ -146,6 +251,35 @@ class GeodeGEMUtilsTC(unittest.TestCase):
         for string, result in strings:
             self.assertEqual(generate_identifier(string), result)
 
+    def test_scan_directory(self):
+        """ Check geode_gem.engine.utils.scan_directory method
+        """
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory)
+
+            path.joinpath("folder.nes").mkdir()
+            path.joinpath("folder.nes", "Sub Game.NES").touch()
+
+            for filename in ("Game.nes", "Game.tar.xz", "Game.xz",
+                             "Other.Nes", "Readme.txt"):
+                path.joinpath(filename).touch()
+
+            self.assertEqual(scan_directory(path, list()), list())
+
+            entries = scan_directory(path, ["nes", ".TAR.XZ"])
+
+            self.assertEqual([entry.name for entry in entries],
+                             ["Game.nes", "Game.tar.xz", "Other.Nes"])
+
+            entries = scan_directory(str(path), ["nes"], recursive=True)
+
+            self.assertEqual([entry.name for entry in entries],
+                             ["Game.nes", "Other.Nes", "Sub Game.NES"])
+
+        with self.assertRaises(FileNotFoundError):
+            scan_directory("not_exists", ["nes"])
+
     def test_parse_timedelta(self):
         """ Check geode_gem.engine.utils.parse_timedelta method
         """